@@ -8,12 +8,72 @@ class Config:
     MAX_ARTICLES_PER_SITE = int(os.getenv("MAX_ARTICLES_PER_SITE", 100))
     RATE_LIMIT_SEC = float(os.getenv("RATE_LIMIT_SEC", 1.0))
     USER_AGENT = os.getenv("USER_AGENT", "GovernanceWeeklyBot/1.0 (+https://accountabilitylab.org/)")
-    
+
+    # Crawl Scheduling (sources run concurrently, politeness enforced per host)
+    CRAWL_WORKERS = int(os.getenv("CRAWL_WORKERS", 10))
+    HOST_RATE_PER_SEC = float(os.getenv("HOST_RATE_PER_SEC", 1.0 / RATE_LIMIT_SEC if RATE_LIMIT_SEC > 0 else 0))
+    HOST_BURST = float(os.getenv("HOST_BURST", 1))
+    HOST_CONCURRENCY = int(os.getenv("HOST_CONCURRENCY", 2))
+    # Adaptive (AIMD) per-host rate: grows on fast 200s up to HOST_RATE_MAX
+    # (set it above HOST_RATE_PER_SEC to allow climbing past the configured
+    # rate), halves on errors, throttling or slow responses down to HOST_RATE_MIN
+    HOST_RATE_MAX = float(os.getenv("HOST_RATE_MAX", HOST_RATE_PER_SEC))
+    HOST_RATE_MIN = float(os.getenv("HOST_RATE_MIN", 0.1))
+    HOST_RATE_STEP = float(os.getenv("HOST_RATE_STEP", 0.1))
+    FETCH_MAX_RETRIES = int(os.getenv("FETCH_MAX_RETRIES", 3))
+    FETCH_BACKOFF_BASE = float(os.getenv("FETCH_BACKOFF_BASE", 1.0))  # seconds, doubled per attempt
+    FETCH_BACKOFF_MAX = float(os.getenv("FETCH_BACKOFF_MAX", 60.0))
+    FETCH_SLOW_SECONDS = float(os.getenv("FETCH_SLOW_SECONDS", 8.0))
+    BREAKER_THRESHOLD = int(os.getenv("BREAKER_THRESHOLD", 5))  # consecutive failed fetches before a domain is skipped
+    # --deadline planning: share of the deadline kept for processing queued
+    # articles, default crawl time for sources with no history
+    DEADLINE_RESERVE = float(os.getenv("DEADLINE_RESERVE", 0.1))
+    DEFAULT_SOURCE_SECONDS = float(os.getenv("DEFAULT_SOURCE_SECONDS", 300))
+    BUDGET_BORROW_STEP = float(os.getenv("BUDGET_BORROW_STEP", 30))  # seconds borrowed from the pool at a time
+    STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", 8))  # extracted articles buffered ahead of processing
+    COMMIT_BATCH_SIZE = int(os.getenv("COMMIT_BATCH_SIZE", 10))  # articles per DB commit
+    EXTRACT_WORKERS = int(os.getenv("EXTRACT_WORKERS", os.cpu_count() or 1))  # extraction processes; 0 extracts in the fetch threads
+    DISCOVERY_ENABLED = os.getenv("DISCOVERY_ENABLED", "True").lower() == "true"  # sitemaps/RSS before homepage
+    DISCOVERY_MAX_SITEMAPS = int(os.getenv("DISCOVERY_MAX_SITEMAPS", 5))  # child sitemaps followed per source
+    URL_DATE_SLACK_DAYS = float(os.getenv("URL_DATE_SLACK_DAYS", 1))  # tolerance when pruning links by URL date
+    URL_ID_MAX_POINTS = int(os.getenv("URL_ID_MAX_POINTS", 500))  # learned id/date points kept per domain
+
+    # Shared HTTP client (keep-alive pools, optional HTTP/2 via httpx[http2])
+    HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 15))
+    HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "False").lower() == "true"
+    HTTP_POOL_HOSTS = int(os.getenv("HTTP_POOL_HOSTS", 20))
+    HTTP_POOL_PER_HOST = int(os.getenv("HTTP_POOL_PER_HOST", HOST_CONCURRENCY + 2))
+
     # Paths
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
     DB_PATH = os.path.join(BASE_DIR, "data", "gov_weekly.db").replace("\\", "/")
     OUTPUT_DIR = os.path.join(BASE_DIR, "output")
+
+    # Crawl frontier (resumable queue of discovered links) and listing pagination
+    FRONTIER_ENABLED = os.getenv("FRONTIER_ENABLED", "True").lower() == "true"
+    FRONTIER_PATH = os.path.join(BASE_DIR, "data", "frontier.db").replace("\\", "/")
+    FRONTIER_MAX_ATTEMPTS = int(os.getenv("FRONTIER_MAX_ATTEMPTS", 3))  # failed fetches before a link is dropped
+    FRONTIER_REDISCOVER_MINUTES = int(os.getenv("FRONTIER_REDISCOVER_MINUTES", 360))  # restarts within this resume
+    FRONTIER_KEEP_DAYS = int(os.getenv("FRONTIER_KEEP_DAYS", 30))
+    LISTING_MAX_PAGES = int(os.getenv("LISTING_MAX_PAGES", 5))  # pagination depth per listing page
+
+    # Raw article pages, compressed and keyed by content hash
+    PAGE_STORE_PATH = os.path.join(BASE_DIR, "data", "pages.db").replace("\\", "/")
+
+    # HTTP Response Cache (conditional GETs across runs)
+    HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "True").lower() == "true"
+    HTTP_CACHE_PATH = os.path.join(BASE_DIR, "data", "http_cache.db").replace("\\", "/")
+    HTTP_CACHE_MAX_MB = int(os.getenv("HTTP_CACHE_MAX_MB", 500))
+    HTTP_CACHE_TTL_HOMEPAGE = int(os.getenv("HTTP_CACHE_TTL_HOMEPAGE", 15 * 60))  # seconds
+    HTTP_CACHE_TTL_ARTICLE = int(os.getenv("HTTP_CACHE_TTL_ARTICLE", 7 * 24 * 3600))  # seconds
     
+    SOURCE_STATS_PATH = os.path.join(BASE_DIR, "data", "source_stats.json").replace("\\", "/")
+    SOURCES_PATH = os.getenv("SOURCES_PATH", os.path.join(BASE_DIR, "scrapers", "sources.json").replace("\\", "/"))
+    URL_ALIASES_PATH = os.path.join(BASE_DIR, "data", "url_aliases.json").replace("\\", "/")
+    URL_ID_DATES_PATH = os.path.join(BASE_DIR, "data", "url_id_dates.json").replace("\\", "/")
+    ROBOTS_CACHE_PATH = os.path.join(BASE_DIR, "data", "robots_cache.json").replace("\\", "/")
+    ROBOTS_CACHE_TTL = int(os.getenv("ROBOTS_CACHE_TTL", 24 * 3600))  # seconds
+
     # Translation
     TRANSLATION_BACKEND = os.getenv("TRANSLATION_BACKEND", "google") # google, marian, gemini
     GOOGLE_APPLICATION_CREDENTIALS = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
@@ -29,9 +89,29 @@ class Config:
     MAX_ARTICLES_IN_REPORT = int(os.getenv("MAX_ARTICLES_IN_REPORT", 40))
     MIN_IMPACT_SCORE = float(os.getenv("MIN_IMPACT_SCORE", 10.0))
 
-    # Selenium
+    # Selenium (when enabled, each domain is probed over plain HTTP first and
+    # only rendered in the browser if that doesn't yield usable article text)
     USE_SELENIUM = os.getenv("USE_SELENIUM", "True").lower() == "true"
     SELENIUM_HEADLESS = os.getenv("SELENIUM_HEADLESS", "True").lower() == "true"
+    SELENIUM_POOL_SIZE = int(os.getenv("SELENIUM_POOL_SIZE", 2))
+    SELENIUM_ACQUIRE_TIMEOUT = float(os.getenv("SELENIUM_ACQUIRE_TIMEOUT", 120))
+    SELENIUM_LEAN_MODE = os.getenv("SELENIUM_LEAN_MODE", "True").lower() == "true"  # eager load, no media/ads
+    SELENIUM_READY_TIMEOUT = float(os.getenv("SELENIUM_READY_TIMEOUT", 10))  # wait for article selector
+    SELENIUM_PAGE_TIMEOUT = float(os.getenv("SELENIUM_PAGE_TIMEOUT", 30))  # hard page load limit
+    FETCH_MODE_PATH = os.path.join(BASE_DIR, "data", "fetch_modes.json").replace("\\", "/")
+    FETCH_MODE_PROBES = int(os.getenv("FETCH_MODE_PROBES", 3))
+    FETCH_MODE_MIN_TEXT = int(os.getenv("FETCH_MODE_MIN_TEXT", 300))  # chars of body text
+    FETCH_MODE_TTL_DAYS = int(os.getenv("FETCH_MODE_TTL_DAYS", 14))
+
+    # Per-domain extraction profiles (sources.json "extract"): body text needed
+    # for a profile hit, and the hit rate below which the summary flags a profile
+    PROFILE_MIN_TEXT = int(os.getenv("PROFILE_MIN_TEXT", 150))
+    PROFILE_MIN_HIT_RATE = float(os.getenv("PROFILE_MIN_HIT_RATE", 0.8))
+    # JSON-LD articleBody long enough to skip DOM extraction entirely
+    STRUCTURED_FAST_PATH = os.getenv("STRUCTURED_FAST_PATH", "True").lower() == "true"
+    STRUCTURED_MIN_TEXT = int(os.getenv("STRUCTURED_MIN_TEXT", 300))
+    # Strip scripts, styles, SVG, comments and ad slots from pages before extraction and storage
+    HTML_MINIMIZE = os.getenv("HTML_MINIMIZE", "True").lower() == "true"
 
 os.makedirs(Config.OUTPUT_DIR, exist_ok=True)
 os.makedirs(os.path.dirname(Config.DB_PATH), exist_ok=True)
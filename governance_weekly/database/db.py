@@ -3,9 +3,29 @@ import json
 import logging
 from datetime import datetime
 from config import Config
+from database.page_store import get_page_store, move_inline_pages
 
 logger = logging.getLogger(__name__)
 
+# Columns added to articles after its first release: created on existing
+# databases by init_db (SQLite can only add columns, so that is all this does)
+ADDED_COLUMNS = {
+    "stale": "INTEGER DEFAULT 0",  # 1 once re-extraction changed text/date: translation etc. are out of date
+    "reextracted_at": "TIMESTAMP",
+}
+
+def ensure_columns(conn, table, columns):
+    """Adds the missing ones of {name: declaration} to `table`; returns the names added."""
+    existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    added = []
+    for name, declaration in columns.items():
+        if name not in existing:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {declaration}")
+            added.append(name)
+    if added:
+        logger.info(f"Added columns to {table}: {', '.join(added)}")
+    return added
+
 class DB:
     def __init__(self):
         self.conn = None
@@ -53,7 +73,11 @@ class DB:
                 reviewer_notes TEXT
             )
         ''')
+        ensure_columns(self.conn, "articles", ADDED_COLUMNS)
         self.conn.commit()
+        # Databases from before the page store keep pages inline; move them out once
+        if move_inline_pages(self.conn, get_page_store()):
+            self.conn.execute("VACUUM")
 
 # Singleton-ish pattern for main.py to use
 def get_db():
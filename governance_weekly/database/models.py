@@ -27,13 +27,17 @@ class Article(Base):
     relevance_score = Column(Float, default=0.0)
     
     # Deduplication & Provenance
-    content_hash = Column(String, index=True, nullable=True)
-    raw_html = Column(Text, nullable=True)
+    content_hash = Column(String, index=True, nullable=True)  # raw page in the page store
+    raw_html = Column(Text, nullable=True)  # pages before the page store; moved out by init_db
     
     # Review Workflow
     status = Column(String, default="pending_review", index=True) # pending_review, verified, rejected
     requires_review = Column(Boolean, default=False)
     reviewer_notes = Column(Text, nullable=True)
+
+    # Re-extraction (main.py --mode reextract)
+    stale = Column(Integer, default=0)  # translation/classification/summary predate the current text
+    reextracted_at = Column(DateTime, nullable=True)
     
     def __repr__(self):
         return f"<Article(source={self.source_domain}, title={self.title_original})>"
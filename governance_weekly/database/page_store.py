@@ -0,0 +1,164 @@
+"""
+Content-addressed store for raw article pages.
+
+Each article keeps the page it was extracted from so it can be re-extracted
+later, but pages are large and inline in `articles` they made every row scan
+read them. Pages live in their own SQLite file instead, keyed by the SHA-256
+of their content and compressed (zstd when the zstandard package is
+installed, zlib otherwise); `articles.content_hash` references them. The same
+page fetched under two URLs is stored once.
+
+The codec is recorded per page, so a store written with one codec stays
+readable after switching to the other (zstd pages need zstandard to read).
+"""
+import hashlib
+import sqlite3
+import threading
+import zlib
+import logging
+from config import Config
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 10
+READ_BATCH = 50  # pages fetched per query by iter_pages
+MOVE_BATCH = 200  # inline pages moved per commit by move_inline_pages
+
+
+def content_hash(html):
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+class PageStore:
+    def __init__(self, path=None, codec=None):
+        self.path = path or Config.PAGE_STORE_PATH
+        self.codec = codec or ("zstd" if zstandard else "zlib")
+        self.stats = {"stored": 0, "duplicate": 0, "raw_bytes": 0, "stored_bytes": 0}
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS pages (
+                hash TEXT PRIMARY KEY,
+                codec TEXT NOT NULL,
+                size INTEGER,
+                body BLOB
+            )
+        ''')
+        self.conn.commit()
+
+    def compress(self, data):
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+        return zlib.compress(data, ZLIB_LEVEL)
+
+    @staticmethod
+    def decompress(codec, body):
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError("page stored with zstd but the zstandard package is not installed")
+            return zstandard.ZstdDecompressor().decompress(body)
+        return zlib.decompress(body)
+
+    def put(self, html, commit=True):
+        """Stores `html` (once per distinct content) and returns its hash; None for no page."""
+        if not html:
+            return None
+        digest = content_hash(html)
+        with self._lock:
+            if self.conn.execute("SELECT 1 FROM pages WHERE hash = ?", (digest,)).fetchone():
+                self.stats["duplicate"] += 1
+                return digest
+        data = html.encode("utf-8")
+        body = self.compress(data)
+        with self._lock:
+            self.conn.execute("INSERT OR IGNORE INTO pages (hash, codec, size, body) VALUES (?, ?, ?, ?)",
+                              (digest, self.codec, len(data), body))
+            if commit:
+                self.conn.commit()
+            self.stats["stored"] += 1
+            self.stats["raw_bytes"] += len(data)
+            self.stats["stored_bytes"] += len(body)
+        return digest
+
+    def commit(self):
+        with self._lock:
+            self.conn.commit()
+
+    def get(self, digest):
+        if not digest:
+            return None
+        return dict(self.iter_pages([digest])).get(digest)
+
+    def iter_pages(self, hashes, batch=READ_BATCH):
+        """
+        Yields (hash, html) for the stored ones of `hashes`, in order, reading
+        and decompressing a batch at a time so only a few pages are in memory.
+        """
+        hashes = list(hashes)
+        for i in range(0, len(hashes), batch):
+            chunk = hashes[i:i + batch]
+            with self._lock:
+                rows = self.conn.execute(
+                    f"SELECT hash, codec, body FROM pages WHERE hash IN ({', '.join('?' * len(chunk))})", chunk
+                ).fetchall()
+            by_hash = {digest: (codec, body) for digest, codec, body in rows}
+            for digest in chunk:
+                if digest in by_hash:
+                    yield digest, self.decompress(*by_hash[digest]).decode("utf-8")
+
+    def totals(self):
+        """(pages, uncompressed bytes, stored bytes) for the whole store."""
+        with self._lock:
+            return self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(LENGTH(body)), 0) FROM pages"
+            ).fetchone()
+
+    def summary(self):
+        ratio = self.stats["raw_bytes"] / self.stats["stored_bytes"] if self.stats["stored_bytes"] else 0.0
+        return (f"Page store: {self.stats['stored']} new pages ({self.stats['raw_bytes'] / 1e6:.1f} MB -> "
+                f"{self.stats['stored_bytes'] / 1e6:.1f} MB {self.codec}, {ratio:.1f}x), "
+                f"{self.stats['duplicate']} duplicates")
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+def move_inline_pages(conn, store, batch=MOVE_BATCH):
+    """
+    Moves pages still stored inline (articles.raw_html) into `store`, sets
+    content_hash and clears raw_html. Returns the number of articles moved.
+    """
+    moved = 0
+    while True:
+        rows = conn.execute(
+            "SELECT rowid, raw_html FROM articles WHERE raw_html IS NOT NULL LIMIT ?", (batch,)
+        ).fetchall()
+        if not rows:
+            break
+        updates = [(store.put(html, commit=False), rowid) for rowid, html in rows]
+        # Pages first: a crash in between leaves pages without articles, never the reverse
+        store.commit()
+        conn.executemany("UPDATE articles SET content_hash = ?, raw_html = NULL WHERE rowid = ?", updates)
+        conn.commit()
+        moved += len(rows)
+    if moved:
+        logger.info(f"Moved {moved} inline pages to the page store")
+    return moved
+
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_page_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = PageStore()
+        return _store
@@ -2,125 +2,156 @@ try:
     from readability import Document
 except ImportError:
     Document = None
-from bs4 import BeautifulSoup
-import dateparser
-from datetime import datetime
+import re
+import time
+import lxml.html
+from lxml import etree
 import logging
+from config import Config
+from extractor.date_resolver import resolve_date, parse_value
+from extractor.extraction_profiles import get_profile
+from extractor.structured_data import structured_article
 
 logger = logging.getLogger(__name__)
 
+# Remove junk patterns (read time, date stamps, social media prompts, etc.),
+# compiled once and applied in a single pass
+JUNK_PATTERNS = [
+    r'Read Time\s*:.*?\d+\s*(?:minute|min|second|sec)',  # Read Time : < 1 minute
+    r'Read Time\s*:.*?2o?\d{2}\s+\w+\s+\d+\s+\w+\s+o?\d{1,2}:o?\d{2}:o?\d{2}',  # Read Time : > 3 minutes 2o82 Paush 3 Thursday o6:36:oo
+    r'2o?\d{2}\s+(?:Paush|Magh|Falgun|Chaitra|Baisakh|Jestha|Ashadh|Shrawan|Bhadra|Ashwin|Kartik|Mangsir)\s+\d+\s+(?:Sunday|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday)\s+o?\d{1,2}:o?\d{2}:o?\d{2}',  # Nepali calendar dates
+    r'\d{4}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}\s+(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+\d{1,2}:\d{2}',  # Date stamps
+    r'News Summary Generated by OK AI\.?\s*Editorially reviewed\.?',  # OnlineKhabar AI summary notice
+    r'Share on Facebook.*?Share on Twitter',  # Social media
+    r'Share via Email',
+    r'Print this page',
+    r'Advertisement',
+    r'Related Articles?:?',
+    r'Tags?:.*',
+    r'Published on:.*',
+    r'Updated on:.*',
+    r'\[.*?\]',  # [Photo Gallery] etc
+]
+JUNK_RE = re.compile("|".join(f"(?:{p})" for p in JUNK_PATTERNS), re.IGNORECASE)
+BLANK_LINES_RE = re.compile(r'\n\s*\n+')
+
+_html_parser = lxml.html.HTMLParser(recover=True)
+
+
+def parse_html(html):
+    """Parses a page into an lxml tree (the only full parse per article)."""
+    try:
+        return lxml.html.document_fromstring(html, parser=_html_parser)
+    except ValueError:
+        # str input carrying an <?xml encoding=...?> declaration
+        return lxml.html.document_fromstring(html.encode("utf-8"), parser=_html_parser)
+
+TEXT_NODES = etree.XPath('.//text()[not(parent::script or parent::style)]')
+
+def tree_text(node):
+    """All text nodes joined by newlines (like BeautifulSoup's get_text(separator="\\n"))."""
+    return "\n".join(TEXT_NODES(node))
+
+def clean_text(text):
+    text = JUNK_RE.sub('', text.strip())
+    return BLANK_LINES_RE.sub('\n\n', text).strip()
+
+def canonical_link(tree):
+    """Publisher's canonical URL (<link rel="canonical">, else og:url)."""
+    for link in tree.iter("link"):
+        if "canonical" in (link.get("rel") or "").lower().split() and link.get("href"):
+            return link.get("href").strip()
+    for meta in tree.iter("meta"):
+        if meta.get("property") == "og:url" and meta.get("content"):
+            return meta.get("content").strip()
+    return None
+
 def extract_article(html, url):
     """
     Extracts the main content, title, and metadata from an article HTML.
+    Pages whose JSON-LD carries the complete article are served from it
+    without building a DOM. Otherwise the page is parsed once; metadata is
+    read from the tree before readability (which prunes hidden elements in
+    place) takes it. Sources with an extraction profile are read with its
+    selectors, and only go through readability when the profile misses.
+
+    "extraction" holds how the article was extracted, for the run summary
+    (see DateStats, ProfileStats and FastPathStats).
     """
     if not html:
         return None
-        
+
     try:
-        if Document:
-            doc = Document(html)
-            title = doc.short_title()
-            content_html = doc.summary()
-        else:
+        started = time.perf_counter()
+        if Config.STRUCTURED_FAST_PATH:
+            data = structured_article(html, clean_text)
+            if data:
+                data["raw_html"] = html
+                data["extraction"] = {
+                    "fast_path": True,
+                    "date_method": data.pop("date_method"),
+                    "date_seconds": data.pop("date_seconds"),
+                    "seconds": time.perf_counter() - started,
+                }
+                return data
+
+        tree = parse_html(html)
+        profile = get_profile(url)
+        date_started = time.perf_counter()
+        published_at, date_method = None, None
+        if profile:
+            value = profile.date_value(tree)
+            if value:
+                published_at, date_method = parse_value(value)
+        if published_at is None:
+            published_at, date_method = resolve_date(tree)
+        date_seconds = time.perf_counter() - date_started
+        canonical_url = canonical_link(tree)
+
+        title, full_text, author, profile_hit = None, None, None, None
+        if profile:
+            body = profile.body_of(tree)
+            full_text = clean_text(tree_text(body)) if body is not None else ""
+            profile_hit = len(full_text) >= Config.PROFILE_MIN_TEXT
+            if profile_hit:
+                title = profile.text_of(tree, profile.title)
+                author = profile.text_of(tree, profile.author)
+
+        if Document and not (profile_hit and title):
+            # Only when the profile left something to fill in: readability scores the whole page
+            doc = Document(tree)
+            if not profile_hit:
+                # The readable fragment is small; re-reading it is cheap next to the page
+                full_text = clean_text(tree_text(parse_html(doc.summary())))
+            title = title or doc.short_title()
+        elif not Document:
             # Fallback for missing readability
-            soup = BeautifulSoup(html, "html.parser")
-            title = soup.title.string if soup.title else "No Title"
-            # Try to find <article> or just body
-            article_body = soup.find('article') or soup.body
-            content_html = str(article_body) if article_body else html
-        
-        # Clean up tags using BeautifulSoup
-        soup = BeautifulSoup(content_html, "html.parser")
-        text_content = soup.get_text(separator="\n").strip()
-        
-        # Remove junk patterns (read time, date stamps, social media prompts, etc.)
-        import re
-        junk_patterns = [
-            r'Read Time\s*:.*?\d+\s*(?:minute|min|second|sec)',  # Read Time : < 1 minute
-            r'Read Time\s*:.*?2o?\d{2}\s+\w+\s+\d+\s+\w+\s+o?\d{1,2}:o?\d{2}:o?\d{2}',  # Read Time : > 3 minutes 2o82 Paush 3 Thursday o6:36:oo
-            r'2o?\d{2}\s+(?:Paush|Magh|Falgun|Chaitra|Baisakh|Jestha|Ashadh|Shrawan|Bhadra|Ashwin|Kartik|Mangsir)\s+\d+\s+(?:Sunday|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday)\s+o?\d{1,2}:o?\d{2}:o?\d{2}',  # Nepali calendar dates
-            r'\d{4}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}\s+(?:Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s+\d{1,2}:\d{2}',  # Date stamps
-            r'News Summary Generated by OK AI\.?\s*Editorially reviewed\.?',  # OnlineKhabar AI summary notice
-            r'Share on Facebook.*?Share on Twitter',  # Social media
-            r'Share via Email',
-            r'Print this page',
-            r'Advertisement',
-            r'Related Articles?:?',
-            r'Tags?:.*',
-            r'Published on:.*',
-            r'Updated on:.*',
-            r'\[.*?\]',  # [Photo Gallery] etc
-        ]
-        
-        for pattern in junk_patterns:
-            text_content = re.sub(pattern, '', text_content, flags=re.IGNORECASE)
-        
-        # Remove excessive whitespace
-        text_content = re.sub(r'\n\s*\n+', '\n\n', text_content)
-        text_content = text_content.strip()
-        
-        # Metadata extraction (heuristic)
-        # Often readability doesn't get the date well, so we might need custom parsing per site
-        # or use generic meta tag scraping
-        
-        soup_full = BeautifulSoup(html, "html.parser")
-        
-        # Attempt to find published time from multiple sources
-        published_at = None
-        
-        # Try multiple date extraction methods
-        date_candidates = []
-        
-        # 1. Meta tags
-        for meta_tag in soup_full.find_all("meta"):
-            for attr in ['property', 'name', 'itemprop']:
-                if meta_tag.get(attr) in ['article:published_time', 'publishedDate', 'datePublished', 'date', 'publication_date']:
-                    content = meta_tag.get("content")
-                    if content:
-                        date_candidates.append(content)
-        
-        # 2. Time tags
-        for time_tag in soup_full.find_all("time"):
-            datetime_attr = time_tag.get("datetime") or time_tag.get_text()
-            if datetime_attr:
-                date_candidates.append(datetime_attr)
-        
-        # 3. JSON-LD structured data
-        for script in soup_full.find_all("script", type="application/ld+json"):
-            try:
-                import json
-                data = json.loads(script.string)
-                if isinstance(data, dict):
-                    if 'datePublished' in data:
-                        date_candidates.append(data['datePublished'])
-                    elif 'dateCreated' in data:
-                        date_candidates.append(data['dateCreated'])
-            except:
-                pass
-        
-        # 4. Common date class patterns
-        for date_elem in soup_full.find_all(class_=re.compile(r'date|time|publish', re.I)):
-            date_text = date_elem.get_text().strip()
-            if date_text:
-                date_candidates.append(date_text)
-        
-        # Parse first valid date
-        for candidate in date_candidates:
-            try:
-                parsed = dateparser.parse(str(candidate), settings={'PREFER_DATES_FROM': 'past'})
-                if parsed:
-                    published_at = parsed
-                    break
-            except:
-                continue
-        
+            if not title:
+                title_el = tree.find(".//title")
+                title = title_el.text if title_el is not None and title_el.text else "No Title"
+            if not profile_hit:
+                # Try to find <article> or just body
+                article_body = tree.find(".//article")
+                if article_body is None:
+                    article_body = tree.find(".//body")
+                full_text = clean_text(tree_text(article_body if article_body is not None else tree))
+
         return {
             "title": title,
-            "full_text": text_content,
+            "full_text": full_text,
             "published_at": published_at,
-            "raw_html": html
+            "author": author,
+            "raw_html": html,
+            "canonical_url": canonical_url,
+            "extraction": {
+                "fast_path": False,
+                "date_method": date_method,
+                "date_seconds": date_seconds,
+                "profile_hit": profile_hit,
+                "seconds": time.perf_counter() - started,
+            }
         }
-        
+
     except Exception as e:
         logger.error(f"Extraction failed for {url}: {e}")
         return None
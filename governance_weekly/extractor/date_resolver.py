@@ -0,0 +1,156 @@
+"""
+Publication date resolution.
+
+Structured sources are checked first and parsed with an ISO-8601 fast path
+(datetime.fromisoformat): date meta tags, <time datetime>, then JSON-LD
+datePublished/dateCreated. Only when none of them holds an ISO date are
+free-text candidates tried: structured values that were not ISO, <time>
+text, then elements whose class mentions date/time/publish. Free text is
+checked for a Bikram Sambat date first (utils.nepali_calendar, which also
+handles Devanagari numerals) and only then handed to dateparser, which is
+by far the slowest step.
+
+DateStats counts, per source, how dates were found and the time spent.
+"""
+import json
+import re
+import threading
+import logging
+from datetime import datetime
+import dateparser
+from lxml import etree
+from utils.nepali_calendar import bs_to_ad, parse_bs_date, to_ascii_digits
+
+logger = logging.getLogger(__name__)
+
+ISO, BS, TEXT = "iso", "bs", "text"
+
+DATE_META_NAMES = ('article:published_time', 'publishedDate', 'datePublished', 'date', 'publication_date')
+META_DATES = etree.XPath(
+    "//meta[@content and (" + " or ".join(f"@{attr}='{name}'" for attr in ('property', 'name', 'itemprop')
+                                         for name in DATE_META_NAMES) + ")]/@content")
+TIME_ELEMENTS = etree.XPath('//time')
+JSON_LD_TEXTS = etree.XPath('//script[@type="application/ld+json"]/text()')
+# Same as a case-insensitive date|time|publish search of @class, evaluated inside libxml2
+DATE_CLASS_ELEMENTS = etree.XPath(
+    "//*[@class][" + " or ".join(f"contains(translate(@class, 'ADTEIMPUBLSH', 'adteimpublsh'), '{word}')"
+                                  for word in ('date', 'time', 'publish')) + "]")
+
+ISO_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?\s*(?:Z|[+-]\d{2}:?\d{2})?$")
+DATEPARSER_MAX_CHARS = 120  # longer text is a container, not a date line
+
+
+def parse_iso(value):
+    """datetime for an ISO-8601 string (a BS date written as ISO is converted), else None."""
+    value = to_ascii_digits(str(value)).strip()
+    if not ISO_RE.match(value):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00").replace(" +", "+"))
+    except ValueError:
+        return None
+    if parsed.year > datetime.now().year + 1:
+        # "2082-06-16" is a Bikram Sambat date
+        ad = bs_to_ad(parsed.year, parsed.month, parsed.day)
+        return parsed.replace(year=ad.year, month=ad.month, day=ad.day) if ad else None
+    return parsed
+
+def parse_text(value):
+    """(datetime, method) for a free-text date, or (None, None)."""
+    value = str(value).strip()
+    if not value or len(value) > DATEPARSER_MAX_CHARS:
+        return None, None
+    parsed = parse_bs_date(value)
+    if parsed:
+        return parsed, BS
+    try:
+        parsed = dateparser.parse(to_ascii_digits(value), settings={'PREFER_DATES_FROM': 'past'})
+    except Exception:
+        parsed = None
+    return (parsed, TEXT) if parsed else (None, None)
+
+def parse_value(value):
+    """(datetime, method) for one date string: the ISO fast path, else free text."""
+    parsed = parse_iso(value)
+    return (parsed, ISO) if parsed else parse_text(value)
+
+def json_ld_dates(tree):
+    """datePublished (else dateCreated) of every JSON-LD object, including @graph members."""
+    for raw in JSON_LD_TEXTS(tree):
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            continue
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            for node in [item] + [n for n in item.get("@graph", []) if isinstance(n, dict)]:
+                value = node.get('datePublished') or node.get('dateCreated')
+                if isinstance(value, str) and value:
+                    yield value
+
+def resolve_date(tree):
+    """(published datetime, method) for a parsed page, or (None, None)."""
+    leftovers = []
+    structured = list(META_DATES(tree))
+    structured += [t.get("datetime") for t in TIME_ELEMENTS(tree) if t.get("datetime")]
+    structured += list(json_ld_dates(tree))
+    for value in structured:
+        parsed = parse_iso(value)
+        if parsed:
+            return parsed, ISO
+        leftovers.append(value)
+
+    def free_text():
+        yield from leftovers
+        for t in TIME_ELEMENTS(tree):
+            if not t.get("datetime"):
+                yield t.text_content()
+        for elem in DATE_CLASS_ELEMENTS(tree):
+            yield elem.text_content()
+
+    for value in free_text():
+        parsed, method = parse_text(value)
+        if parsed:
+            return parsed, method
+    return None, None
+
+
+class DateStats:
+    """Per-source date resolution counts (by method) and time spent."""
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, domain, method, seconds):
+        with self._lock:
+            s = self._stats.setdefault(domain, {"pages": 0, "seconds": 0.0, ISO: 0, BS: 0, TEXT: 0})
+            s["pages"] += 1
+            s["seconds"] += seconds
+            if method:
+                s[method] += 1
+
+    def summary(self):
+        with self._lock:
+            stats = {d: dict(s) for d, s in self._stats.items()}
+        lines = ["Date resolution:"]
+        for domain, s in sorted(stats.items()):
+            found = s[ISO] + s[BS] + s[TEXT]
+            lines.append(f"  {domain}: {found}/{s['pages']} dated ({found / s['pages']:.0%}; "
+                         f"iso {s[ISO]}, bs {s[BS]}, text {s[TEXT]}), "
+                         f"{s['seconds'] / s['pages'] * 1000:.1f} ms/page")
+        if len(lines) == 1:
+            lines.append("  no pages")
+        return "\n".join(lines)
+
+
+_stats = None
+_stats_lock = threading.Lock()
+
+def get_date_stats():
+    global _stats
+    with _stats_lock:
+        if _stats is None:
+            _stats = DateStats()
+        return _stats
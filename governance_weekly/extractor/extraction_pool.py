@@ -0,0 +1,128 @@
+"""
+Article extraction in worker processes.
+
+Parsing, readability and dateparser are CPU-bound, so running them in the
+fetch threads serializes every source on one core. ExtractionPool moves
+extraction into a ProcessPoolExecutor with EXTRACT_WORKERS processes: a
+fetch thread hands over the page and waits on the result while the other
+fetch threads keep the network busy. Only the page goes to the worker and
+the extracted fields come back; the raw HTML is not shipped back, the
+caller re-attaches the copy it already has.
+
+With EXTRACT_WORKERS=0 (or if the pool breaks) pages are extracted inline.
+"""
+import multiprocessing
+import threading
+import logging
+from collections import deque
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from config import Config
+from extractor.article_extractor import extract_article
+
+logger = logging.getLogger(__name__)
+
+
+def _extract(html, url):
+    """Runs in a worker process."""
+    data = extract_article(html, url)
+    if data:
+        del data["raw_html"]
+    return data
+
+
+class ExtractionPool:
+    def __init__(self, workers=None):
+        self.workers = Config.EXTRACT_WORKERS if workers is None else workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Starts the worker processes. Called before the crawl threads exist:
+        the workers are forked from a process that holds no thread's locks.
+        """
+        with self._lock:
+            if self._executor is not None or self.workers <= 0:
+                return
+            # fork is cheap and needs no re-import of main.py; elsewhere use the default (spawn)
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in methods else None)
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            # The first submit launches every worker up front
+            self._executor.submit(_extract, "", "").result()
+            logger.info(f"Extracting articles in {self.workers} worker processes")
+
+    def extract(self, html, url):
+        """Same as extract_article(html, url), run in a worker process."""
+        if not html:
+            return None
+        executor = self._executor
+        if executor is None:
+            return extract_article(html, url)
+        try:
+            future = executor.submit(_extract, html, url)
+        except BrokenProcessPool:
+            return self._inline(html, url)
+        except RuntimeError:
+            # Shut down meanwhile
+            return extract_article(html, url)
+        return self._result(future, html, url)
+
+    def map(self, pages, window=None):
+        """
+        Extracts an iterable of (html, url) pairs, yielding results in order.
+        At most `window` pages are in flight, so a large batch is streamed
+        rather than submitted (and held in memory) all at once.
+        """
+        window = window or max(1, self.workers) * 4
+        pending = deque()
+        for html, url in pages:
+            executor = self._executor
+            if executor is None or not html:
+                pending.append((None, html, url))
+            else:
+                try:
+                    pending.append((executor.submit(_extract, html, url), html, url))
+                except (BrokenProcessPool, RuntimeError):
+                    pending.append((None, html, url))
+            if len(pending) >= window:
+                yield self._result(*pending.popleft())
+        while pending:
+            yield self._result(*pending.popleft())
+
+    def _result(self, future, html, url):
+        if future is None:
+            return extract_article(html, url) if html else None
+        try:
+            data = future.result()
+        except BrokenProcessPool:
+            return self._inline(html, url)
+        except (RuntimeError, CancelledError):
+            # Pool shut down while this page was in flight
+            return extract_article(html, url)
+        if data:
+            data["raw_html"] = html
+        return data
+
+    def _inline(self, html, url):
+        logger.error("Extraction worker died; extracting inline from now on")
+        self.shutdown()
+        return extract_article(html, url)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_extraction_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ExtractionPool()
+        return _pool
@@ -0,0 +1,163 @@
+"""
+Per-domain extraction profiles.
+
+Sources whose markup we know carry an "extract" entry in the source
+registry (scrapers/sources.json), and their pages are read with these
+selectors instead of readability's whole-DOM scoring:
+
+    title    headline
+    body     article body container
+    date     publication date (its datetime/content attribute, else its text)
+    author   byline
+    remove   elements dropped from the body (share bars, ads, notices),
+             on top of the registry's default_extract_remove
+
+Selectors are CSS, or XPath when they start with "/" or "("; every key
+takes one selector or a list tried in order, and all of them are compiled
+once per process. The CSS body selectors also tell Selenium when an
+article has rendered (ready_selectors). A profile misses when no body container is found or it
+holds less than PROFILE_MIN_TEXT characters; the page then goes through
+readability as before. ProfileStats counts hits and misses per source so a
+site redesign that breaks a profile shows up in the collect summary.
+"""
+import threading
+import logging
+from urllib.parse import urlparse
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from config import Config
+from utils.canonical_url import registered_host
+
+logger = logging.getLogger(__name__)
+
+
+def compile_selector(selector):
+    if selector.startswith(("/", "(")):
+        return etree.XPath(selector)
+    return CSSSelector(selector, translator="html")
+
+def _as_list(selectors):
+    return [selectors] if isinstance(selectors, str) else list(selectors or [])
+
+def _compile_all(selectors):
+    return [compile_selector(s) for s in _as_list(selectors)]
+
+
+class ExtractionProfile:
+    def __init__(self, spec):
+        self.title = _compile_all(spec.get("title"))
+        self.body = _compile_all(spec.get("body"))
+        self.date = _compile_all(spec.get("date"))
+        self.author = _compile_all(spec.get("author"))
+        self.remove = _compile_all(spec.get("remove"))
+        # A paragraph inside the body container means the article has rendered
+        self.ready_selectors = [f"{s} p" for s in _as_list(spec.get("body")) if not s.startswith(("/", "("))]
+
+    @staticmethod
+    def first(tree, selectors):
+        for selector in selectors:
+            found = selector(tree)
+            if found:
+                return found[0]
+        return None
+
+    def text_of(self, tree, selectors):
+        elem = self.first(tree, selectors)
+        text = elem.text_content().strip() if elem is not None else ""
+        return " ".join(text.split()) or None
+
+    def date_value(self, tree):
+        elem = self.first(tree, self.date)
+        if elem is None:
+            return None
+        return elem.get("datetime") or elem.get("content") or elem.text_content().strip() or None
+
+    def body_of(self, tree):
+        """The body container with the removal selectors applied, or None."""
+        body = self.first(tree, self.body)
+        if body is None:
+            return None
+        for selector in self.remove:
+            for elem in selector(body):
+                if elem is not body:
+                    elem.drop_tree()
+        return body
+
+
+def load_profiles():
+    """domain -> ExtractionProfile for every registry source with an "extract" entry."""
+    # Imported here: the registry belongs to the scrapers, the extractor only reads its profiles
+    from scrapers.source_registry import get_sources
+    profiles = {}
+    for source in get_sources():
+        if not source.extract:
+            continue
+        try:
+            profiles[source.domain] = ExtractionProfile(source.extract)
+        except Exception as e:
+            logger.error(f"Invalid extraction profile for {source.domain}: {e}")
+    return profiles
+
+
+_profiles = None
+_profiles_lock = threading.Lock()
+
+def get_profile(url):
+    """The extraction profile for the URL's source, or None."""
+    global _profiles
+    with _profiles_lock:
+        if _profiles is None:
+            try:
+                _profiles = load_profiles()
+            except Exception as e:
+                logger.error(f"Could not load extraction profiles: {e}")
+                _profiles = {}
+    host = registered_host(urlparse(url).netloc)
+    return _profiles.get(host)
+
+
+class ProfileStats:
+    """Per-source profile hits (profile used) and misses (fell back to readability)."""
+    def __init__(self, min_hit_rate=None, min_pages=10):
+        self.min_hit_rate = Config.PROFILE_MIN_HIT_RATE if min_hit_rate is None else min_hit_rate
+        self.min_pages = min_pages
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, domain, hit):
+        """`hit` is None for pages of sources without a profile."""
+        if hit is None:
+            return
+        with self._lock:
+            s = self._stats.setdefault(domain, [0, 0])
+            s[0 if hit else 1] += 1
+
+    def hit_rate(self, domain):
+        with self._lock:
+            hits, misses = self._stats.get(domain, (0, 0))
+        return hits / (hits + misses) if hits + misses else None
+
+    def summary(self):
+        with self._lock:
+            stats = {d: tuple(s) for d, s in self._stats.items()}
+        lines = ["Extraction profiles:"]
+        for domain, (hits, misses) in sorted(stats.items()):
+            total = hits + misses
+            line = f"  {domain}: {hits}/{total} pages ({hits / total:.0%})"
+            if total >= self.min_pages and hits / total < self.min_hit_rate:
+                line += " - below the expected hit rate, check the profile against the site's markup"
+            lines.append(line)
+        if len(lines) == 1:
+            lines.append("  no profiled pages")
+        return "\n".join(lines)
+
+
+_stats = None
+_stats_lock = threading.Lock()
+
+def get_profile_stats():
+    global _stats
+    with _stats_lock:
+        if _stats is None:
+            _stats = ProfileStats()
+        return _stats
@@ -0,0 +1,114 @@
+"""
+Offline re-extraction of stored articles.
+
+Every stored article keeps the page it was extracted from (in the page
+store, or inline in raw_html on unmigrated rows), so an
+improved extractor or junk cleanup can be applied to what is already in
+the database instead of re-crawling. Rows are picked by fetch date and/or
+source, their pages are streamed through the extraction pool, and only
+rows whose text or publication date actually changed are written back.
+Those are marked stale: their translation, summary and categories still
+describe the old text until main.refresh_stale redoes them and clears the
+flag.
+"""
+import logging
+from collections import deque
+from datetime import datetime, timezone
+from database.page_store import get_page_store
+from extractor.date_resolver import get_date_stats
+from extractor.extraction_profiles import get_profile_stats
+from extractor.structured_data import get_fast_path_stats
+from utils.html_minimizer import minimize_html
+
+logger = logging.getLogger(__name__)
+
+READ_BATCH = 50  # stored pages read per query
+
+
+def select_urls(conn, since=None, source=None):
+    """URLs of stored articles with a page, fetched on/after `since` and from `source` if given."""
+    query = "SELECT url FROM articles WHERE (content_hash IS NOT NULL OR raw_html IS NOT NULL)"
+    params = []
+    if since:
+        query += " AND fetched_at >= ?"
+        params.append(since.isoformat())
+    if source:
+        query += " AND source_domain = ?"
+        params.append(source)
+    return [row[0] for row in conn.execute(query + " ORDER BY rowid", params)]
+
+def iter_stored(conn, urls, store, batch=READ_BATCH):
+    """
+    (url, source_domain, html, full_text_original, published_at) for `urls`,
+    read a batch at a time so only a few pages are in memory.
+    """
+    for i in range(0, len(urls), batch):
+        chunk = urls[i:i + batch]
+        rows = conn.execute(
+            "SELECT url, source_domain, content_hash, raw_html, full_text_original, published_at FROM articles "
+            f"WHERE url IN ({', '.join('?' * len(chunk))})", chunk
+        ).fetchall()
+        by_url = {row[0]: row for row in rows}
+        pages = dict(store.iter_pages({row[2] for row in rows if row[2]}, batch=batch))
+        for url in chunk:
+            if url in by_url:
+                url, source, digest, inline, text, published = by_url[url]
+                yield url, source, pages.get(digest) or inline, text, published
+
+def changes(row, data):
+    """{column: new value} for the extracted fields that differ from the stored row."""
+    changed = {}
+    if data["full_text"] != row[3]:
+        changed["full_text_original"] = data["full_text"]
+    published = data["published_at"].isoformat() if data.get("published_at") else None
+    # A date the new extractor can't find is kept rather than erased
+    if published and published != row[4]:
+        changed["published_at"] = published
+    return changed
+
+def reextract(conn, pool, since=None, source=None, commit_every=100, store=None):
+    """
+    Re-extracts the selected stored articles with the current extractor and
+    writes back the changed ones. Returns counts of pages, changed rows (by
+    field), unchanged rows and failed extractions.
+    """
+    store = store or get_page_store()
+    urls = select_urls(conn, since, source)
+    logger.info(f"Re-extracting {len(urls)} stored articles")
+    counts = {"pages": 0, "changed": 0, "text": 0, "date": 0, "unchanged": 0, "failed": 0}
+    rows = deque()
+
+    def pages():
+        for row in iter_stored(conn, urls, store):
+            rows.append(row)
+            # Pages stored before minimization get the same input as fresh ones
+            yield minimize_html(row[2]), row[0]
+
+    now = datetime.now(timezone.utc).isoformat()
+    for data in pool.map(pages()):
+        row = rows.popleft()
+        counts["pages"] += 1
+        if not data or not data.get("full_text"):
+            counts["failed"] += 1
+            continue
+        info = data.get("extraction", {})
+        get_date_stats().record(row[1], info.get("date_method"), info.get("date_seconds", 0.0))
+        get_profile_stats().record(row[1], info.get("profile_hit"))
+        get_fast_path_stats().record(row[1], info.get("fast_path", False), info.get("seconds", 0.0))
+
+        changed = changes(row, data)
+        if not changed:
+            counts["unchanged"] += 1
+            continue
+        counts["changed"] += 1
+        counts["text"] += "full_text_original" in changed
+        counts["date"] += "published_at" in changed
+        assignments = ", ".join(f"{column} = ?" for column in changed)
+        conn.execute(
+            f"UPDATE articles SET {assignments}, stale = 1, reextracted_at = ? WHERE url = ?",
+            list(changed.values()) + [now, row[0]]
+        )
+        if counts["changed"] % commit_every == 0:
+            conn.commit()
+    conn.commit()
+    return counts
@@ -10,28 +10,28 @@ import os
 print("DEBUG: Script starting", flush=True)
 
 from database.db import init_db, get_db
+from database.page_store import get_page_store
 print("DEBUG: Imported DB", flush=True)
 
-from scrapers.domain_scrapers.ekantipur import EkantipurScraper
-print("DEBUG: Imported Ekantipur", flush=True)
-from scrapers.domain_scrapers.kathmandu_post import KathmanduPostScraper
-print("DEBUG: Imported KP", flush=True)
-from scrapers.domain_scrapers.myrepublica import MyRepublicaScraper
-print("DEBUG: Imported MyRepublica", flush=True)
-from scrapers.domain_scrapers.setopati import SetopatiScraper
-print("DEBUG: Imported Setopati", flush=True)
-from scrapers.domain_scrapers.nayapatrika import NayapatrikaScraper
-print("DEBUG: Imported Nayapatrika", flush=True)
-from scrapers.domain_scrapers.annapurna_post import AnnapurnaPostScraper
-print("DEBUG: Imported AnnapurnaPost", flush=True)
-from scrapers.domain_scrapers.annapurna_express import AnnapurnaExpressScraper
-print("DEBUG: Imported AnnapurnaExpress", flush=True)
-from scrapers.domain_scrapers.onlinekhabar import OnlineKhabarScraper
-print("DEBUG: Imported OnlineKhabar", flush=True)
-from scrapers.domain_scrapers.ratopati import RatopatiScraper
-print("DEBUG: Imported Ratopati", flush=True)
-from scrapers.domain_scrapers.ukaalo import UkaaloScraper
-print("DEBUG: Imported Ukaalo", flush=True)
+from scrapers.source_registry import get_sources
+from scrapers.source_scraper import SourceScraper
+print("DEBUG: Imported Source Registry", flush=True)
+from scrapers.crawl_scheduler import stream_articles
+from scrapers.frontier import get_frontier, DONE
+from extractor.extraction_pool import get_extraction_pool
+from extractor.date_resolver import get_date_stats
+from extractor.extraction_profiles import get_profile_stats
+from extractor.structured_data import get_fast_path_stats
+from extractor.reextract import reextract
+print("DEBUG: Imported Crawl Scheduler", flush=True)
+from utils.http_cache import get_cache
+from utils.retry_policy import get_fetch_policy
+from utils.canonical_url import get_canonical_urls
+from utils.time_budget import CrawlBudget, get_source_stats, parse_duration
+from utils.known_urls import KnownUrlIndex
+from utils.selenium_manager import close_driver
+from utils.report_window import get_report_window
+from utils.url_dates import get_id_model
 from translator.translator import Translator
 print("DEBUG: Imported Translator", flush=True)
 from classifier.classifier import Classifier
@@ -55,13 +55,103 @@ def has_nepali(text):
         return False
     return any('\u0900' <= char <= '\u097F' for char in text)
 
+def translate_article(translator, data):
+    """Sets data['title_translated'] and data['full_text_translated'] (English) from the original text."""
+    # Check both title and full_text for Nepali characters
+    needs_translation = (
+        data.get('language') == 'ne' or 
+        has_nepali(data.get('title', '')) or 
+        has_nepali(data.get('full_text', ''))
+    )
+
+    if needs_translation:
+        # Translate title
+        try:
+            trans_title = translator.translate(data['title'], source_lang='ne', target_lang='en')
+            # If translation returns original Nepali (and it was Nepali), mark as failed
+            if has_nepali(trans_title) and has_nepali(data['title']):
+                data['title_translated'] = "[Translation Failed]"
+            else:
+                data['title_translated'] = trans_title
+        except Exception as e:
+            logger.warning(f"Title translation failed for {data['url']}: {e}")
+            data['title_translated'] = "[Translation Failed]"
+
+        # Small delay to avoid rate limiting
+        import time
+        time.sleep(0.5)
+
+        # Translate full text (chunk if needed)
+        try:
+            full_text = data.get('full_text', '')
+            if len(full_text) > 4000:
+                # Chunk large text
+                chunks = [full_text[i:i+4000] for i in range(0, len(full_text), 4000)]
+                translated_chunks = []
+                for chunk in chunks:
+                    trans_chunk = translator.translate(chunk, source_lang='ne', target_lang='en')
+                    translated_chunks.append(trans_chunk)
+                    time.sleep(0.5)  # Delay between chunks
+                data['full_text_translated'] = ' '.join(translated_chunks)
+            else:
+                data['full_text_translated'] = translator.translate(full_text, source_lang='ne', target_lang='en')
+
+            # Check if full text translation failed (still contains Nepali)
+            if has_nepali(data['full_text_translated']) and has_nepali(full_text):
+                logger.warning(f"Full text translation returned Nepali for {data['url']}")
+                # Try to keep what we have or mark failed? 
+                # If it's mostly Nepali, it's useless for summary.
+                # But maybe some parts translated.
+                pass 
+        except Exception as e:
+            logger.warning(f"Text translation failed for {data['url']}: {e}")
+            data['full_text_translated'] = "" # Empty better than blocks
+    else:
+        data['title_translated'] = data['title']
+        data['full_text_translated'] = data['full_text']
+
+def refresh_stale(db, translator, classifier):
+    """
+    Re-translates, re-summarizes and re-classifies the articles whose text
+    re-extraction changed (stale = 1), then clears their stale flag.
+    """
+    rows = db.cursor.execute(
+        "SELECT url, title_original, full_text_original, language FROM articles WHERE stale = 1"
+    ).fetchall()
+    if not rows:
+        return 0
+    logger.info(f"Refreshing {len(rows)} re-extracted articles...")
+    summarizer = Summarizer()
+    refreshed = 0
+    for row in rows:
+        data = {'url': row['url'], 'title': row['title_original'] or "",
+                'full_text': row['full_text_original'] or "", 'language': row['language']}
+        try:
+            translate_article(translator, data)
+            summary_text = summarizer.summarize(data['full_text_translated']) if data.get('full_text_translated') else ""
+            classification = classifier.classify((data.get('title_translated') or "") + "\n" + (data.get('full_text_translated') or ""))
+            db.cursor.execute("""
+                UPDATE articles SET title_translated = ?, full_text_translated = ?, summary = ?,
+                    categories = ?, relevance_score = ?, stale = 0
+                WHERE url = ?
+            """, (data['title_translated'], data['full_text_translated'], summary_text,
+                  json.dumps(classification['categories']), classification['relevance_score'], data['url']))
+            db.commit()
+            refreshed += 1
+        except Exception as e:
+            # Stays stale and is retried by the next collect or reextract run
+            logger.error(f"Failed to refresh {data['url']}: {e}")
+            db.rollback()
+    logger.info(f"Refreshed {refreshed}/{len(rows)} re-extracted articles")
+    return refreshed
+
 def setup():
     print("DEBUG: Inside setup", flush=True)
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     init_db()
     print("DEBUG: init_db done", flush=True)
 
-def collect(target_scraper=None):
+def collect(target_scraper=None, workers=None, deadline=None):
     print("DEBUG: Inside collect", flush=True)
     logger.info("Starting collection phase...")
     db_gen = get_db()
@@ -69,39 +159,46 @@ def collect(target_scraper=None):
     print("DEBUG: Got DB connection", flush=True)
     
     # Calculate date range: last Friday to today
-    from datetime import datetime, timedelta
-    today = datetime.now()
-    days_since_friday = (today.weekday() - 4) % 7  # Friday is 4
-    if days_since_friday == 0 and today.hour < 12:  # If it's Friday morning, go back a week
-        days_since_friday = 7
-    last_friday = today - timedelta(days=days_since_friday)
-    last_friday = last_friday.replace(hour=0, minute=0, second=0, microsecond=0)
+    last_friday, today = get_report_window()
     
     logger.info(f"Collecting articles from {last_friday.strftime('%Y-%m-%d')} to {today.strftime('%Y-%m-%d')}")
     
-    all_scrapers = [
-        EkantipurScraper(),
-        KathmanduPostScraper(),
-        MyRepublicaScraper(),
-        SetopatiScraper(),
-        NayapatrikaScraper(),
-        AnnapurnaPostScraper(),
-        AnnapurnaExpressScraper(),
-        OnlineKhabarScraper(),
-        RatopatiScraper(),
-        UkaaloScraper()
-    ]
+    # One generic scraper per outlet in the source registry (scrapers/sources.json)
+    all_scrapers = [SourceScraper(source) for source in get_sources()]
     
     if target_scraper:
-        scrapers = [s for s in all_scrapers if target_scraper.lower() in s.__class__.__name__.lower()]
+        scrapers = [s for s in all_scrapers if s.source.matches_name(target_scraper)]
         if not scrapers:
             logger.error(f"No scraper found matching '{target_scraper}'")
             return
-        logger.info(f"Running only: {[s.__class__.__name__ for s in scrapers]}")
+        logger.info(f"Running only: {[s.source.name for s in scrapers]}")
     else:
         scrapers = all_scrapers
     
     print(f"DEBUG: Init {len(scrapers)} scrapers", flush=True)
+
+    known_urls = KnownUrlIndex.from_db(db)
+    id_model = get_id_model()
+    id_model.learn_from_db(db)
+    frontier = get_frontier()
+    for scraper in scrapers:
+        scraper.known_urls = known_urls
+        scraper.window = (last_friday, today)
+        scraper.id_model = id_model
+        # Queued links survive a crash/deadline; a restart resumes from them
+        scraper.frontier = frontier
+
+    budget = None
+    if deadline:
+        budget = CrawlBudget(deadline, [s.domain for s in scrapers], workers or Config.CRAWL_WORKERS,
+                             stats=get_source_stats())
+        for scraper in scrapers:
+            scraper.budget = budget
+        logger.info(f"Collect deadline: {deadline / 60:.0f} minutes")
+
+    # Extraction runs in worker processes, started before any crawl or model threads
+    extraction_pool = get_extraction_pool()
+    extraction_pool.start()
     
     translator = Translator()
     print("DEBUG: Init Translator", flush=True)
@@ -109,167 +206,208 @@ def collect(target_scraper=None):
     print("DEBUG: Init Classifier", flush=True)
     
     total_new = 0
+    batch = []  # URLs inserted since the last commit
+    handled = []  # frontier links consumed since the last commit; done once committed
     
     try:
-        for scraper in scrapers:
+        # Sources are crawled concurrently and stream their articles to this
+        # (main) thread, which owns the DB connection and commits in small batches
+        # With a deadline the stream ends at the deadline; what is stored so far is committed below
+        for scraper, data, error in stream_articles(scrapers, workers=workers, budget=budget):
+            if data is None:
+                # Source finished
+                if error:
+                    logger.error(f"Scraper {scraper.domain} failed: {error}")
+                continue
+            handled.append(data.get('link', data['url']))
             try:
-                articles = scraper.run()
-                for data in articles:
-                    # 1. Date filter - skip articles outside date range
-                    if data.get('published_at'):
-                        pub_date = data['published_at']
-                        # Convert to timezone-naive for comparison with last_friday (which is naive)
-                        if hasattr(pub_date, 'tzinfo') and pub_date.tzinfo is not None:
-                            pub_date = pub_date.replace(tzinfo=None)
-                        
-                        if pub_date < last_friday or pub_date > today:
-                            logger.debug(f"Skipping article outside date range: {data.get('title', 'No title')[:50]} (published: {pub_date})")
-                            continue
-                    else:
-                        # No published_at date - skip article (can't verify it's within range)
-                        logger.debug(f"Skipping article with no date: {data.get('title', 'No title')[:50]}")
-                        continue
-                    
-                    # 2. Deduplication check by URL
-                    db.cursor.execute("SELECT 1 FROM articles WHERE url = ?", (data['url'],))
-                    if db.cursor.fetchone():
-                        continue
-                    
-                    # 3. Deduplication check by title similarity (catch same news from different sources)
-                    title_to_check = data.get('title', '').strip()
-                    if title_to_check:
-                        db.cursor.execute("SELECT title_original FROM articles")
-                        existing_titles = [row[0] for row in db.cursor.fetchall()]
-                        
-                        from difflib import SequenceMatcher
-                        for existing_title in existing_titles:
-                            similarity = SequenceMatcher(None, title_to_check.lower(), existing_title.lower()).ratio()
-                            if similarity >= 0.85:  # 85% similar titles = duplicate
-                                logger.debug(f"Skipping duplicate by title: {title_to_check[:50]}")
-                                continue
-                    
-                    # 4. Filter out opinion/commentary content by URL and title patterns
-                    url_lower = data['url'].lower()
-                    title_lower = data.get('title', '').lower()
-                    
-                    opinion_patterns = [
-                        '/opinion/', '/editorial/', '/commentary/', '/column/',
-                        '/interview/', '/op-ed/', '/blog/', '/viewpoint/',
-                        'opinion', 'editorial', 'commentary', 'interview',
-                        'exclusive interview', 'in conversation', 'my view'
-                    ]
-                    
-                    if any(pattern in url_lower or pattern in title_lower for pattern in opinion_patterns):
-                        logger.info(f"Skipping opinion/interview content: {data['title']}")
-                        continue
-                    
-                    # 5. Translation - ensure Nepali content is properly translated
-                    # Check both title and full_text for Nepali characters
-                    needs_translation = (
-                        data.get('language') == 'ne' or 
-                        has_nepali(data.get('title', '')) or 
-                        has_nepali(data.get('full_text', ''))
-                    )
+                # 1. Date filter - skip articles outside date range
+                if data.get('published_at'):
+                    pub_date = data['published_at']
+                    # Convert to timezone-naive for comparison with last_friday (which is naive)
+                    if hasattr(pub_date, 'tzinfo') and pub_date.tzinfo is not None:
+                        pub_date = pub_date.replace(tzinfo=None)
                     
-                    if needs_translation:
-                        # Translate title
-                        try:
-                            trans_title = translator.translate(data['title'], source_lang='ne', target_lang='en')
-                            # If translation returns original Nepali (and it was Nepali), mark as failed
-                            if has_nepali(trans_title) and has_nepali(data['title']):
-                                data['title_translated'] = "[Translation Failed]"
-                            else:
-                                data['title_translated'] = trans_title
-                        except Exception as e:
-                            logger.warning(f"Title translation failed for {data['url']}: {e}")
-                            data['title_translated'] = "[Translation Failed]"
-                        
-                        # Small delay to avoid rate limiting
-                        import time
-                        time.sleep(0.5)
-                        
-                        # Translate full text (chunk if needed)
-                        try:
-                            full_text = data.get('full_text', '')
-                            if len(full_text) > 4000:
-                                # Chunk large text
-                                chunks = [full_text[i:i+4000] for i in range(0, len(full_text), 4000)]
-                                translated_chunks = []
-                                for chunk in chunks:
-                                    trans_chunk = translator.translate(chunk, source_lang='ne', target_lang='en')
-                                    translated_chunks.append(trans_chunk)
-                                    time.sleep(0.5)  # Delay between chunks
-                                data['full_text_translated'] = ' '.join(translated_chunks)
-                            else:
-                                data['full_text_translated'] = translator.translate(full_text, source_lang='ne', target_lang='en')
-                                
-                            # Check if full text translation failed (still contains Nepali)
-                            if has_nepali(data['full_text_translated']) and has_nepali(full_text):
-                                logger.warning(f"Full text translation returned Nepali for {data['url']}")
-                                # Try to keep what we have or mark failed? 
-                                # If it's mostly Nepali, it's useless for summary.
-                                # But maybe some parts translated.
-                                pass 
-                        except Exception as e:
-                            logger.warning(f"Text translation failed for {data['url']}: {e}")
-                            data['full_text_translated'] = "" # Empty better than blocks
-                    else:
-                        data['title_translated'] = data['title']
-                        data['full_text_translated'] = data['full_text']
-                    
-                    # 6. Generate summary from translated text (for English summaries)
-                    summary_text = ""
-                    if data.get('full_text_translated'):
-                        temp_summarizer = Summarizer()
-                        summary_text = temp_summarizer.summarize(data['full_text_translated'])
-                    
-                    # 7. Classification
-                    text_for_class = (data.get('title_translated') or "") + "\n" + (data.get('full_text_translated') or "")
-                    classification = classifier.classify(text_for_class)
-                    
-                    # Skip if excluded (opinion/commentary detected by classifier)
-                    if classification.get('is_excluded'):
-                        logger.info(f"Skipping excluded content: {data['title']}")
+                    if pub_date < last_friday or pub_date > today:
+                        logger.debug(f"Skipping article outside date range: {data.get('title', 'No title')[:50]} (published: {pub_date})")
                         continue
-                        
-                    # Insert
-                    # Serialize complex types
-                    cats_json = json.dumps(classification['categories'])
-                    
-                    db.cursor.execute("""
-                        INSERT INTO articles (
-                            url, source_domain, title_original, full_text_original, 
-                            published_at, fetched_at, language, 
-                            title_translated, full_text_translated, summary,
-                            categories, relevance_score, raw_html, status
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        data['url'],
-                        data['source_domain'],
-                        data['title'],
-                        data['full_text'],
-                        data.get('published_at').isoformat() if data.get('published_at') else None,
-                        datetime.now(timezone.utc).isoformat(),
-                        data.get('language', 'ne'),
-                        data['title_translated'],
-                        data['full_text_translated'],
-                        summary_text,
-                        cats_json,
-                        classification['relevance_score'],
-                        data.get('raw_html'),
-                        "pending_review"
-                    ))
+                else:
+                    # No published_at date - skip article (can't verify it's within range)
+                    logger.debug(f"Skipping article with no date: {data.get('title', 'No title')[:50]}")
+                    continue
+                
+                # 2. Deduplication check by URL (scrapers already skip stored URLs before
+                # fetching; this catches the same URL surfacing twice within a run)
+                if data['url'] in known_urls:
+                    continue
+                
+                # 3. Deduplication check by title similarity (catch same news from different sources)
+                title_to_check = data.get('title', '').strip()
+                if title_to_check:
+                    db.cursor.execute("SELECT title_original FROM articles")
+                    existing_titles = [row[0] for row in db.cursor.fetchall()]
                     
-                    total_new += 1
+                    from difflib import SequenceMatcher
+                    for existing_title in existing_titles:
+                        similarity = SequenceMatcher(None, title_to_check.lower(), existing_title.lower()).ratio()
+                        if similarity >= 0.85:  # 85% similar titles = duplicate
+                            logger.debug(f"Skipping duplicate by title: {title_to_check[:50]}")
+                            continue
+                
+                # 4. Filter out opinion/commentary content by URL and title patterns
+                url_lower = data['url'].lower()
+                title_lower = data.get('title', '').lower()
+                
+                opinion_patterns = [
+                    '/opinion/', '/editorial/', '/commentary/', '/column/',
+                    '/interview/', '/op-ed/', '/blog/', '/viewpoint/',
+                    'opinion', 'editorial', 'commentary', 'interview',
+                    'exclusive interview', 'in conversation', 'my view'
+                ]
+                
+                if any(pattern in url_lower or pattern in title_lower for pattern in opinion_patterns):
+                    logger.info(f"Skipping opinion/interview content: {data['title']}")
+                    continue
+                
+                # 5. Translation - ensure Nepali content is properly translated
+                translate_article(translator, data)
+                
+                # 6. Generate summary from translated text (for English summaries)
+                summary_text = ""
+                if data.get('full_text_translated'):
+                    temp_summarizer = Summarizer()
+                    summary_text = temp_summarizer.summarize(data['full_text_translated'])
+                
+                # 7. Classification
+                text_for_class = (data.get('title_translated') or "") + "\n" + (data.get('full_text_translated') or "")
+                classification = classifier.classify(text_for_class)
+                
+                # Skip if excluded (opinion/commentary detected by classifier)
+                if classification.get('is_excluded'):
+                    logger.info(f"Skipping excluded content: {data['title']}")
+                    continue
                     
-                db.commit()
+                # Insert
+                # Serialize complex types
+                cats_json = json.dumps(classification['categories'])
+                
+                db.cursor.execute("""
+                    INSERT INTO articles (
+                        url, source_domain, title_original, full_text_original, 
+                        published_at, fetched_at, language, 
+                        title_translated, full_text_translated, summary,
+                        categories, relevance_score, content_hash, status
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    data['url'],
+                    data['source_domain'],
+                    data['title'],
+                    data['full_text'],
+                    data.get('published_at').isoformat() if data.get('published_at') else None,
+                    datetime.now(timezone.utc).isoformat(),
+                    data.get('language', 'ne'),
+                    data['title_translated'],
+                    data['full_text_translated'],
+                    summary_text,
+                    cats_json,
+                    classification['relevance_score'],
+                    get_page_store().put(data.get('raw_html')),
+                    "pending_review"
+                ))
+                
+                known_urls.add(data['url'])
+                if classification['categories']:
+                    scraper.count("budget_categorized")
+                id_model.observe(data['source_domain'], data['url'], data.get('published_at'))
+                batch.append(data['url'])
+                total_new += 1
+                
+                if len(batch) >= Config.COMMIT_BATCH_SIZE:
+                    db.commit()
+                    if frontier:
+                        frontier.mark(handled, DONE)
+                    batch = []
+                    handled = []
             except Exception as e:
-                logger.error(f"Scraper {scraper.domain} failed: {e}")
+                # Only the uncommitted batch is lost; its links stay pending in the frontier
+                logger.error(f"Failed to store article from {scraper.domain} ({data.get('url')}): {e}")
                 db.rollback()
+                for url in batch:
+                    known_urls.discard(url)
+                total_new -= len(batch)
+                batch = []
+                handled = []
+        db.commit()
+        if frontier:
+            frontier.mark(handled, DONE)
+        # Articles changed by --mode reextract that could not be refreshed then
+        refresh_stale(db, translator, classifier)
     finally:
         db.close()
+        close_driver()
+        extraction_pool.shutdown()
+        try:
+            id_model.save()
+        except Exception as e:
+            logger.warning(f"Could not save URL id/date model: {e}")
+        try:
+            get_canonical_urls().save()
+        except Exception as e:
+            logger.warning(f"Could not save URL aliases: {e}")
+        try:
+            get_source_stats().save()
+        except Exception as e:
+            logger.warning(f"Could not save source stats: {e}")
 
     logger.info(f"Collection complete. New articles: {total_new}")
+    pruned = {s.domain: s.stats.get('pruned_by_url_date', 0) for s in scrapers if s.stats.get('pruned_by_url_date')}
+    logger.info(f"Fetches avoided by URL date pruning: {sum(pruned.values())} {pruned}")
+    fetched = sum(s.stats.get('budget_links', 0) for s in scrapers)
+    categorized = sum(s.stats.get('budget_categorized', 0) for s in scrapers)
+    prescored = sum(s.stats.get('budget_prescored', 0) for s in scrapers)
+    share = (categorized / fetched * 100) if fetched else 0.0
+    logger.info(f"Crawl budget: {fetched} article links fetched, {prescored} with a positive relevance pre-score, "
+                f"{categorized} stored with a category ({share:.0f}%)")
+    for s in scrapers:
+        if s.stats.get('budget_links'):
+            logger.info(f"  {s.domain}: {s.stats.get('budget_categorized', 0)}/{s.stats['budget_links']} categorized")
+    cache = get_cache()
+    if cache:
+        logger.info(cache.summary())
+    logger.info(get_fetch_policy().summary())
+    logger.info(get_date_stats().summary())
+    logger.info(get_profile_stats().summary())
+    logger.info(get_fast_path_stats().summary())
+    logger.info(get_page_store().summary())
+    if frontier:
+        logger.info(frontier.summary())
+    if budget:
+        logger.info(budget.summary())
+
+def reextract_stored(since=None, source=None):
+    """
+    Runs the current extractor over the stored pages, updates the articles
+    it changes, and refreshes their translation, summary and categories.
+    """
+    logger.info("Starting re-extraction of stored articles...")
+    db_gen = get_db()
+    db = next(db_gen)
+    extraction_pool = get_extraction_pool()
+    extraction_pool.start()
+    try:
+        counts = reextract(db.conn, extraction_pool, since=since, source=source)
+        extraction_pool.shutdown()
+        logger.info(f"Re-extraction complete: {counts['pages']} pages, {counts['changed']} articles updated "
+                    f"({counts['text']} text, {counts['date']} date) and marked stale, "
+                    f"{counts['unchanged']} unchanged, {counts['failed']} failed")
+        logger.info(get_date_stats().summary())
+        logger.info(get_profile_stats().summary())
+        logger.info(get_fast_path_stats().summary())
+        if db.cursor.execute("SELECT 1 FROM articles WHERE stale = 1 LIMIT 1").fetchone():
+            refresh_stale(db, Translator(), Classifier())
+    finally:
+        extraction_pool.shutdown()
+        db.close()
 
 def summarize_and_report():
     logger.info("Starting reporting phase...")
@@ -280,12 +418,7 @@ def summarize_and_report():
     try:
         # Get items from last Friday to today
         # This gives you the week's news: Friday → Thursday (when run weekly)
-        today = datetime.now()
-        days_since_friday = (today.weekday() - 4) % 7  # Friday is 4
-        if days_since_friday == 0 and today.hour < 12:  # If it's Friday morning, go back a week
-            days_since_friday = 7
-        last_friday = today - timedelta(days=days_since_friday)
-        last_friday = last_friday.replace(hour=0, minute=0, second=0, microsecond=0)
+        last_friday, today = get_report_window()
         
         db.cursor.execute("SELECT * FROM articles WHERE fetched_at >= ?", (last_friday,))
         rows = db.cursor.fetchall()
@@ -392,19 +525,30 @@ def summarize_and_report():
 
 def main():
     parser = argparse.ArgumentParser(description="Governance Weekly Pipeline")
-    parser.add_argument("--mode", choices=["collect", "summarize", "force", "export-for-review"], required=True)
+    parser.add_argument("--mode", choices=["collect", "summarize", "force", "reextract", "export-for-review"], required=True)
     parser.add_argument("--scraper", help="Run specific scraper (e.g. 'onlinekhabar')", default=None)
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"Number of sources crawled concurrently (default: {Config.CRAWL_WORKERS})")
+    parser.add_argument("--deadline", type=parse_duration, default=None,
+                        help="Time budget for collection, e.g. 45m or 1h30m; sources are budgeted from past runs "
+                             "and the run stops gracefully at the deadline")
+    parser.add_argument("--since", type=datetime.fromisoformat, default=None,
+                        help="reextract: only articles fetched on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--source", default=None,
+                        help="reextract: only articles from this source domain (e.g. ekantipur.com)")
     args = parser.parse_args()
     
     setup()
     
     if args.mode == "collect":
-        collect(target_scraper=args.scraper)
+        collect(target_scraper=args.scraper, workers=args.workers, deadline=args.deadline)
     elif args.mode == "summarize":
         summarize_and_report()
     elif args.mode == "force":
-        collect(target_scraper=args.scraper)
+        collect(target_scraper=args.scraper, workers=args.workers, deadline=args.deadline)
         summarize_and_report()
+    elif args.mode == "reextract":
+        reextract_stored(since=args.since, source=args.source)
     elif args.mode == "export-for-review":
         print("Export feature pending implementation.")
 
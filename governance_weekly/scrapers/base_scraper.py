@@ -1,15 +1,32 @@
 print("DEBUG: BS imports start", flush=True)
-import requests
-print("DEBUG: Imported requests", flush=True)
 from bs4 import BeautifulSoup
 print("DEBUG: Imported BS4", flush=True)
-import time
 import logging
+import time
+from collections import deque
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 from utils.robots_checker import is_allowed
 print("DEBUG: Imported Robots", flush=True)
-from utils.selenium_manager import get_driver
+from utils.selenium_manager import driver_session, render_page, selenium_available
 print("DEBUG: Imported Selenium Manager", flush=True)
+from utils.rate_limiter import get_limiter
+from utils.http_client import http_get
+from utils.html_decode import response_text
+from utils.html_minimizer import minimize_html
+from utils.http_cache import get_cache
+from utils.retry_policy import get_fetch_policy, FetchError, parse_retry_after
+from utils.fetch_mode import get_policy, is_usable, HTTP, BROWSER, PROBE
+from extractor.extraction_pool import get_extraction_pool
+from extractor.date_resolver import get_date_stats
+from extractor.extraction_profiles import get_profile_stats
+from extractor.structured_data import get_fast_path_stats
+from scrapers.discovery import discover_feed_links, find_next_page
+from scrapers.frontier import SKIPPED
+from scrapers.link_priority import get_scorer
+from utils.canonical_url import canonicalize, get_canonical_urls
+from utils.url_dates import estimate_date_range, outside_window
 from config import Config
 print("DEBUG: Imported Config", flush=True)
 
@@ -19,31 +36,183 @@ class BaseScraper:
     def __init__(self, base_url, domain):
         self.base_url = base_url
         self.domain = domain
-        self.rate_limit = Config.RATE_LIMIT_SEC
+        self.limiter = get_limiter()
         self.max_articles = Config.MAX_ARTICLES_PER_SITE
+        # KnownUrlIndex of already-stored articles, set by collect()
+        self.known_urls = None
+        # (start, end) report window, set by collect(); enables feed discovery
+        self.window = None
+        # Sitemap/RSS paths tried before the defaults during discovery
+        self.feed_paths = []
+        # Publication dates known before fetching (from sitemap/RSS entries)
+        self.link_dates = {}
+        # Anchor text of homepage links, used to prioritize the fetch budget
+        self.link_anchors = {}
+        # IdDateModel for outlets with sequential article IDs, set by collect()
+        self.id_model = None
+        # Listing pages (paths) whose pagination is followed during discovery
+        self.listing_paths = []
+        # CrawlFrontier set by collect(); None crawls straight from discovery
+        self.frontier = None
+        # CrawlBudget when collect runs with --deadline
+        self.budget = None
+        # Per-run counters reported in the collect summary
+        self.stats = {}
         self.headers = {"User-Agent": Config.USER_AGENT}
         
-    def fetch(self, url, use_selenium=False):
+    def resource_kind(self, url):
+        """Cache TTL class of a URL: the source's homepage changes often, articles rarely."""
+        return "homepage" if url.rstrip("/") == self.base_url.rstrip("/") else "article"
+
+    def within_budget(self):
+        """Whether the time budget (if any) lets this source fetch another page."""
+        return self.budget is None or self.budget.allow(self.domain)
+
+    def stopped(self):
+        """True once collect's deadline has passed: nothing more is fetched."""
+        return self.budget is not None and self.budget.stopped()
+
+    def fetch_mode(self):
+        """How this source's pages are fetched: "http", "browser" or "probe" (still learning)."""
+        if not Config.USE_SELENIUM or not selenium_available():
+            return HTTP
+        return get_policy().mode_for(self.domain)
+
+    def fetch(self, url, use_selenium=None, kind=None, refresh=False):
+        """
+        Fetches a page. use_selenium=None follows the domain's learned fetch
+        mode; refresh=True bypasses fresh cache entries.
+        """
         if not is_allowed(url, self.headers["User-Agent"]):
             logger.warning(f"Robots.txt disallows: {url}")
             return None
+
+        if use_selenium is None:
+            use_selenium = self.fetch_mode() == BROWSER
+
+        cache = get_cache()
+        cached = cache.lookup(url) if cache else None
+        if cached and not refresh and cache.is_fresh(cached, kind or self.resource_kind(url)):
+            cache.record("hit")
+            cache.touch(url)
+            return cached.body
             
-        try:
-            time.sleep(self.rate_limit)
-            
-            if use_selenium or Config.USE_SELENIUM: # Global override or per-call
-                driver = get_driver()
-                driver.get(url)
-                # Implement implicit wait or check for ready state if needed
-                return driver.page_source
-            else:
-                r = requests.get(url, headers=self.headers, timeout=15)
-                r.raise_for_status()
-                return r.text
-        except Exception as e:
-            logger.error(f"Error fetching {url}: {e}")
+        policy = get_fetch_policy()
+        if not policy.allow(self.domain):
             return None
 
+        for attempt in range(policy.max_retries + 1):
+            if self.stopped():
+                return None
+            try:
+                # Per-host token bucket replaces the old global sleep before every request
+                with self.limiter.slot(url):
+                    started = time.monotonic()
+                    html = self._fetch_once(url, use_selenium, kind, cache, cached)
+                policy.on_success(self.domain, url, time.monotonic() - started)
+                return html
+            except Exception as e:
+                if not policy.on_failure(self.domain, url, e) or attempt == policy.max_retries:
+                    policy.on_fetch_failed(self.domain, e)
+                    policy.count(self.domain, "failed")
+                    logger.error(f"Error fetching {url}: {e}")
+                    return None
+                delay = policy.backoff(attempt, getattr(e, "retry_after", None))
+                policy.count(self.domain, "retried")
+                logger.warning(f"Error fetching {url}: {e}; retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def _fetch_once(self, url, use_selenium, kind, cache, cached):
+        """A single fetch attempt; raises on any failure."""
+        if use_selenium:
+            with driver_session() as driver:
+                if driver is None:
+                    raise FetchError("no WebDriver available", local=True)
+                html = render_page(driver, url, kind or self.resource_kind(url))
+            if cache:
+                cache.record("miss")
+                cache.store(url, html)
+            return html
+
+        headers = dict(self.headers)
+        if cached:
+            headers.update(cache.conditional_headers(cached))
+        r = http_get(url, headers=headers)
+        if cached and r.status_code == 304:
+            cache.record("revalidated")
+            cache.touch(url, refreshed=True)
+            return cached.body
+        if r.status_code >= 400:
+            raise FetchError(f"HTTP {r.status_code}", status=r.status_code,
+                             retry_after=parse_retry_after(r.headers.get("Retry-After")))
+        # Decode the raw bytes once (UTF-8 fast path) instead of r.text, which
+        # runs charset detection over the whole body when the header has none
+        html = response_text(r)
+        if cache:
+            cache.record("miss")
+            cache.store(url, html, r.headers.get("ETag"), r.headers.get("Last-Modified"))
+        return html
+
+    def discover_links(self):
+        """
+        Candidate article links for this run: in-window entries from the
+        outlet's sitemaps/RSS when it has them, otherwise links from the
+        homepage and the source's paginated listing pages.
+        """
+        if self.window and Config.DISCOVERY_ENABLED:
+            feed_links = discover_feed_links(self, self.window)
+            if feed_links is not None:
+                self.link_dates.update({url: date for url, date in feed_links.items() if date})
+                return set(feed_links)
+
+        links = set()
+        homepage_html = self.fetch(self.base_url) if self.within_budget() else None
+        if homepage_html:
+            links = self.extract_links(homepage_html)
+        if self.window:
+            # Pagination depth is bounded by the report window
+            links |= self.crawl_listings()
+        return links
+
+    def crawl_listings(self):
+        """
+        Follows each listing page's pagination until a page adds no new
+        article links, all of them are older than the report window, or
+        LISTING_MAX_PAGES is reached.
+        """
+        links = set()
+        for path in self.listing_paths:
+            url = urljoin(self.base_url, path)
+            for _ in range(Config.LISTING_MAX_PAGES):
+                if not self.within_budget():
+                    return links
+                html = self.fetch(url, kind="homepage")
+                if not html:
+                    break
+                page_links = self.extract_links(html)
+                new_articles = self.filter_links(page_links - links)
+                links |= page_links
+                if not new_articles or self.older_than_window(new_articles):
+                    break
+                url = find_next_page(html, url)
+                if not url:
+                    break
+        return links
+
+    def older_than_window(self, links):
+        """True if every link whose URL can be dated falls before the report window."""
+        if not self.window:
+            return False
+        cutoff = self.window[0] - timedelta(days=Config.URL_DATE_SLACK_DAYS)
+        latest = [estimate[1] for estimate in
+                  (estimate_date_range(self.domain, l, self.link_dates, self.id_model) for l in links)
+                  if estimate and estimate[1] is not None]
+        return bool(latest) and max(latest) < cutoff
+
+    def filter_links(self, links):
+        """Article links among discovered links (all of them unless a subclass narrows it)."""
+        return list(links)
+
     def extract_links(self, html, pattern=None):
         if not html: return set()
         soup = BeautifulSoup(html, "html.parser")
@@ -58,12 +227,151 @@ class BaseScraper:
                 # Optional pattern filtering
                 if pattern and pattern not in href:
                     continue
-                links.add(href.split("#")[0])
+                href = canonicalize(href)
+                links.add(href)
+                text = a.get_text(" ", strip=True)
+                if text and len(text) > len(self.link_anchors.get(href, "")):
+                    # Keep the most descriptive anchor (headline over "Read more")
+                    self.link_anchors[href] = text
         return links
 
-    def run(self):
+    def prune_links(self, links):
+        """Drops links already stored or dated outside the report window."""
+        links = list(links)
+        if self.known_urls is not None:
+            new_links = self.known_urls.filter_new(links)
+            if len(new_links) < len(links):
+                logger.info(f"{self.domain}: skipping {len(links) - len(new_links)} already-stored articles")
+            links = new_links
+        if self.window:
+            # Drop links whose URL (date path, feed date or article ID) places
+            # them outside the report window
+            in_window = [l for l in links if not outside_window(
+                estimate_date_range(self.domain, l, self.link_dates, self.id_model), self.window)]
+            self.count("pruned_by_url_date", len(links) - len(in_window))
+            links = in_window
+        return links
+
+    def rank_links(self, links):
+        """Links in descending expected relevance, with their scores."""
+        return get_scorer().rank(sorted(links), self.link_anchors)
+
+    def take_budget(self, ranked, scores):
+        selected = ranked[:self.max_articles]
+        self.count("budget_links", len(selected))
+        self.count("budget_prescored", sum(1 for l in selected if scores[l] > 0))
+        return selected
+
+    def select_links(self, links):
+        """
+        Picks which candidate article links to fetch: links already stored or
+        dated outside the report window are dropped first so they don't eat
+        into the per-site budget, and the rest are fetched in descending
+        expected relevance (anchor text and URL scored against the keyword
+        taxonomy).
+        """
+        ranked, scores = self.rank_links(self.prune_links(links))
+        return self.take_budget(ranked, scores)
+
+    def frontier_links(self):
+        """
+        Frontier-backed select_links: newly discovered links are queued with
+        their priority, then the source's pending links are taken from the
+        frontier. Discovery is skipped when resuming a recent run.
+        """
+        window_start = self.window[0] if self.window else None
+        if self.frontier.needs_discovery(self.domain, window_start):
+            links = self.discover_links()
+            ranked, scores = self.rank_links(self.prune_links(self.filter_links(links)))
+            self.frontier.add(self.domain, [(l, scores[l]) for l in ranked], window_start)
+        else:
+            logger.info(f"{self.domain}: resuming from the crawl frontier")
+
+        pending = self.frontier.pending(self.domain)
+        scores = dict(pending)
+        links = [url for url, _ in pending]
+        fresh = self.prune_links(links)
+        # Stored meanwhile, or now outside the window
+        self.frontier.mark(set(links) - set(fresh), SKIPPED)
+        return self.take_budget(fresh, scores)
+
+    def count(self, key, n=1):
+        self.stats[key] = self.stats.get(key, 0) + n
+
+    def fetch_article(self, link):
+        """
+        Fetches and extracts one article page. While the domain's fetch mode
+        is still being learned, the page is tried over plain HTTP first and
+        only re-rendered in the browser if that yields no usable text.
+        """
+        mode = self.fetch_mode()
+        extractor = get_extraction_pool()
+        html = minimize_html(self.fetch(link))
+        data = extractor.extract(html, link)
+        if mode == PROBE and html:
+            usable = is_usable(data)
+            get_policy().observe(self.domain, usable)
+            if not usable:
+                rendered = minimize_html(self.fetch(link, use_selenium=True, refresh=True))
+                rendered_data = extractor.extract(rendered, link)
+                if is_usable(rendered_data) or not data:
+                    data = rendered_data
+        return data
+
+    def scrape_articles(self, links, language):
+        """
+        Fetches and extracts the given article links, keeping up to
+        HOST_CONCURRENCY requests in flight against this source's host.
+        Yields articles in link order as they complete; only a few pages are
+        held in memory at a time.
+        """
+        def fetch_one(link):
+            data = self.fetch_article(link)
+            if self.frontier and not (data and data['title']) and not self.stopped():
+                # Nothing to store: settled here. Stored articles are marked done
+                # by collect() once committed, so a crash never loses them; a
+                # fetch cut off at the deadline is left pending
+                self.frontier.record_attempt(link, bool(data))
+            if data:
+                info = data.pop('extraction', {})
+                get_date_stats().record(self.domain, info.get('date_method'), info.get('date_seconds', 0.0))
+                get_profile_stats().record(self.domain, info.get('profile_hit'))
+                get_fast_path_stats().record(self.domain, info.get('fast_path', False), info.get('seconds', 0.0))
+            if data and data['title']:
+                # The page's rel=canonical wins over the URL it was linked under
+                data['url'] = get_canonical_urls().learn(link, data.pop('canonical_url', None), self.domain)
+                data['source_domain'] = self.domain
+                data['language'] = language
+                data['link'] = link
+                return data
+            return None
+
+        workers = max(1, Config.HOST_CONCURRENCY)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self.domain) as pool:
+            pending = deque()
+            for i, link in enumerate(links):
+                if not self.within_budget():
+                    logger.warning(f"{self.domain}: time budget exhausted, skipping {len(links) - i} links")
+                    self.budget.skip(self.domain, len(links) - i)
+                    break
+                pending.append(pool.submit(fetch_one, link))
+                # Bounded look-ahead instead of pool.map(), which would queue every link
+                if len(pending) > workers:
+                    data = pending.popleft().result()
+                    if data:
+                        yield data
+            while pending:
+                data = pending.popleft().result()
+                if data:
+                    yield data
+
+    def iter_articles(self):
         """
         Main execution method found in subclasses.
-        Should return a list of extracted article dictionaries.
+        Should yield extracted article dictionaries as they are scraped.
         """
         raise NotImplementedError
+
+    def run(self):
+        """Returns all of the source's articles as a list (see iter_articles)."""
+        return list(self.iter_articles())
@@ -0,0 +1,125 @@
+"""
+Runs several source scrapers concurrently.
+
+Each scraper gets its own worker thread; politeness is enforced per host by
+utils.rate_limiter, so the total wall-clock time approaches that of the
+slowest single source rather than the sum of all of them. Articles are
+streamed back through a small bounded queue as soon as they are extracted,
+so memory holds a handful of pages rather than whole sites.
+"""
+import logging
+import queue
+import threading
+import time
+from config import Config
+from utils.fetch_mode import HTTP
+from utils.selenium_manager import get_pool
+from utils.robots_checker import prefetch_robots
+from utils.time_budget import get_source_stats
+
+logger = logging.getLogger(__name__)
+
+def stream_articles(scrapers, workers=None, budget=None):
+    """
+    Runs scraper.iter_articles() for every scraper on a thread pool, within
+    the optional CrawlBudget.
+
+    Yields (scraper, article, None) for each extracted article as it
+    arrives, and (scraper, None, error) once a source is finished, where
+    `error` is the exception that stopped it (or None).
+    """
+    workers = workers or Config.CRAWL_WORKERS
+    workers = max(1, min(workers, len(scrapers) or 1))
+    logger.info(f"Crawling {len(scrapers)} sources with {workers} workers")
+
+    # Load every source's robots.txt (and Crawl-delay) in parallel up front
+    prefetch_robots([scraper.base_url for scraper in scrapers])
+
+    # Start a browser in the background if any source may need one, so its
+    # startup overlaps with the first plain-HTTP fetches
+    if any(scraper.fetch_mode() != HTTP for scraper in scrapers):
+        get_pool().warm_up()
+
+    # Bounded: crawlers block once the consumer falls this far behind
+    out = queue.Queue(maxsize=max(1, Config.STREAM_QUEUE_SIZE))
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                out.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def drain(scraper):
+        if budget and not budget.start(scraper.domain):
+            put((scraper, None, None))
+            return
+        start = time.monotonic()
+        count = 0
+        error = None
+        try:
+            for article in scraper.iter_articles():
+                if not put((scraper, article, None)):
+                    return
+                count += 1
+        except Exception as e:
+            error = e
+        elapsed = time.monotonic() - start
+        logger.info(f"{scraper.domain}: {count} articles in {elapsed:.1f}s")
+        if budget:
+            budget.finish(scraper.domain)
+        # Only complete runs are representative of how long a source takes
+        if error is None and not (budget and scraper.domain in budget.skipped):
+            get_source_stats().record(scraper.domain, elapsed, scraper.stats.get("budget_links", 0), count)
+        put((scraper, None, error))
+
+    # Daemon threads: a source hung at the deadline must not keep the process alive
+    todo = queue.Queue()
+    for scraper in scrapers:
+        todo.put(scraper)
+
+    def work():
+        while not stop.is_set():
+            try:
+                scraper = todo.get_nowait()
+            except queue.Empty:
+                return
+            drain(scraper)
+
+    threads = [threading.Thread(target=work, name=f"crawl_{i}", daemon=True) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    expired = False
+    try:
+        finished = 0
+        while finished < len(scrapers):
+            if budget and budget.expired():
+                expired = True
+                logger.warning("Collect deadline reached; stopping the crawl")
+                stop.set()
+                # Scrapers check the budget before every fetch, so workers wind down
+                budget.stop()
+                # What was already extracted is still processed (that is what DEADLINE_RESERVE is for)
+                while True:
+                    try:
+                        yield out.get_nowait()
+                    except queue.Empty:
+                        return
+            try:
+                # Wake up periodically so a hung source can't run past the deadline
+                item = out.get(timeout=1.0 if budget else None)
+            except queue.Empty:
+                continue
+            if item[1] is None:
+                finished += 1
+            yield item
+    finally:
+        # Consumer stopped early (or finished): release any blocked crawlers.
+        # At the deadline, don't wait for in-flight fetches to time out.
+        stop.set()
+        if not expired:
+            for thread in threads:
+                thread.join()
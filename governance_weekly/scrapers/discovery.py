@@ -0,0 +1,183 @@
+"""
+Feed-based article discovery.
+
+Reads an outlet's sitemaps (index, regular or Google News) and RSS/Atom
+feeds, and keeps only the entries whose lastmod / publication date falls
+inside the report window, so out-of-window articles are never fetched.
+Scrapers fall back to homepage link extraction when no feed is found.
+"""
+import logging
+import re
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup
+from lxml import etree
+from config import Config
+from utils.report_window import to_naive
+from utils.robots_checker import get_sitemaps
+from utils.canonical_url import canonicalize
+
+logger = logging.getLogger(__name__)
+
+# Endpoints tried when robots.txt advertises no sitemap (after the source's own feed paths)
+DEFAULT_FEED_PATHS = ["/sitemap.xml", "/feed"]
+
+_xml_parser = etree.XMLParser(recover=True, resolve_entities=False, no_network=True, huge_tree=True)
+
+def parse_feed_date(value):
+    """Parses sitemap (W3C/ISO 8601) and RSS (RFC 822) dates; returns naive datetime or None."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return to_naive(datetime.fromisoformat(value.replace("Z", "+00:00")))
+    except ValueError:
+        pass
+    try:
+        return to_naive(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        return None
+
+def _local(tag):
+    # Strip "{namespace}" so sitemap, news and Atom elements match by name
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+def _child_text(elem, *names):
+    for child in elem.iter():
+        if _local(child.tag) in names and child.text and child.text.strip():
+            return child.text.strip()
+    return None
+
+def parse_feed(body, base_url):
+    """
+    Parses a sitemap / sitemap index / RSS / Atom document.
+
+    Returns (entries, child_sitemaps) where entries is a list of (url, date)
+    and child_sitemaps a list of (sitemap_url, lastmod) from a sitemap index.
+    """
+    if not body:
+        return [], []
+    data = body.encode("utf-8") if isinstance(body, str) else body
+    try:
+        root = etree.fromstring(data.lstrip(), parser=_xml_parser)
+    except etree.XMLSyntaxError:
+        return [], []
+    if root is None:
+        return [], []
+
+    kind = _local(root.tag)
+    entries, children = [], []
+    if kind == "sitemapindex":
+        for sm in root:
+            if _local(sm.tag) == "sitemap":
+                loc = _child_text(sm, "loc")
+                if loc:
+                    children.append((loc, parse_feed_date(_child_text(sm, "lastmod"))))
+    elif kind == "urlset":
+        for url in root:
+            if _local(url.tag) == "url":
+                loc = _child_text(url, "loc")
+                if loc:
+                    # Google News sitemaps carry the real publication date
+                    date = _child_text(url, "publication_date") or _child_text(url, "lastmod")
+                    entries.append((loc, parse_feed_date(date)))
+    elif kind in ("rss", "RDF"):
+        for item in root.iter():
+            if _local(item.tag) == "item":
+                link = _child_text(item, "link")
+                if link:
+                    entries.append((urljoin(base_url, link), parse_feed_date(_child_text(item, "pubDate", "date"))))
+    elif kind == "feed":  # Atom
+        for entry in root:
+            if _local(entry.tag) != "entry":
+                continue
+            href = None
+            for child in entry:
+                if _local(child.tag) == "link" and child.get("rel", "alternate") == "alternate":
+                    href = child.get("href")
+                    break
+            if href:
+                entries.append((urljoin(base_url, href), parse_feed_date(_child_text(entry, "published", "updated"))))
+    return entries, children
+
+def _looks_current(sitemap_url, window_start):
+    # Undated child sitemaps: only follow news sitemaps or ones named after the current period
+    lower = sitemap_url.lower()
+    return "news" in lower or str(window_start.year) in lower
+
+def discover_feed_links(scraper, window):
+    """
+    Returns {url: date_or_None} for in-window feed entries of the scraper's
+    source, or None if the outlet exposes no usable sitemap/feed.
+    """
+    start, end = window
+    candidates = list(get_sitemaps(scraper.base_url, scraper.headers["User-Agent"]))
+    candidates += [urljoin(scraper.base_url, p) for p in list(scraper.feed_paths) + DEFAULT_FEED_PATHS]
+
+    found_feed = False
+    links = {}
+    seen = set()
+    # (url, is_child_sitemap); top-level candidates are alternatives, children are all read
+    queue = [(url, False) for url in dict.fromkeys(candidates)]
+    child_budget = Config.DISCOVERY_MAX_SITEMAPS
+
+    while queue:
+        feed_url, is_child = queue.pop(0)
+        if feed_url in seen or (found_feed and not is_child):
+            continue
+        seen.add(feed_url)
+        if not scraper.within_budget():
+            break
+        body = scraper.fetch(feed_url, use_selenium=False, kind="feed")
+        entries, children = parse_feed(body, scraper.base_url)
+        if not entries and not children:
+            continue
+        found_feed = True
+
+        # Newest child sitemaps first; skip the ones untouched since the window opened
+        children.sort(key=lambda c: c[1] or datetime.min, reverse=True)
+        for loc, lastmod in children:
+            if child_budget <= 0:
+                break
+            if (lastmod and lastmod >= start) or (lastmod is None and _looks_current(loc, start)):
+                queue.append((loc, True))
+                child_budget -= 1
+
+        for url, date in entries:
+            if scraper.domain not in url:
+                continue
+            if date is not None and not (start <= date <= end):
+                continue
+            links[canonicalize(url)] = date
+
+    if not found_feed:
+        return None
+    if not links:
+        # A daily outlet with nothing dated this week has a stale feed
+        logger.info(f"{scraper.domain}: feeds found but no in-window entries; using homepage")
+        return None
+    logger.info(f"{scraper.domain}: {len(links)} in-window links from sitemaps/feeds")
+    return links
+
+# "Next" link texts on listing pages (English and Nepali)
+NEXT_TEXTS = {"next", "next page", "older", "older posts", "more", "load more", "»", "›", ">", "next »", "next ›",
+              "अर्को", "अर्को पेज", "थप", "थप समाचार"}
+PAGE_NUMBER_RE = re.compile(r"(?:[?&]page=|/page/)(\d+)")
+
+def find_next_page(html, url):
+    """URL of the next listing page: rel="next", a "next" link, or page number + 1."""
+    soup = BeautifulSoup(html, "html.parser")
+    tag = soup.find(["link", "a"], rel="next", href=True)
+    if tag:
+        return urljoin(url, tag["href"])
+    for a in soup.find_all("a", href=True):
+        if a.get_text(" ", strip=True).lower() in NEXT_TEXTS:
+            return urljoin(url, a["href"])
+    m = PAGE_NUMBER_RE.search(url)
+    wanted = int(m.group(1)) + 1 if m else 2
+    for a in soup.find_all("a", href=True):
+        href_m = PAGE_NUMBER_RE.search(a["href"])
+        if href_m and int(href_m.group(1)) == wanted:
+            return urljoin(url, a["href"])
+    return None
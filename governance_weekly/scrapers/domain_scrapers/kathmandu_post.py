@@ -1,44 +1,7 @@
-from scrapers.base_scraper import BaseScraper
-from extractor.article_extractor import extract_article
-import logging
-from datetime import datetime
+"""The Kathmandu Post: configured in scrapers/sources.json; kept for existing imports."""
+from scrapers.source_scraper import SourceScraper
+from scrapers.source_registry import get_source
 
-logger = logging.getLogger(__name__)
-
-class KathmanduPostScraper(BaseScraper):
+class KathmanduPostScraper(SourceScraper):
     def __init__(self):
-        super().__init__("https://kathmandupost.com", "kathmandupost.com")
-
-    def run(self):
-        logger.info(f"Starting scrape for {self.domain}")
-        
-        homepage_html = self.fetch(self.base_url)
-        if not homepage_html:
-            return []
-            
-        links = self.extract_links(homepage_html)
-        
-        # Filter by current year only
-        today = datetime.now()
-        current_year = f"/{today.year}/"
-        
-        # KP links with current year filter
-        article_links = [l for l in links if any(x in l for x in ["/national/", "/politics/", "/investigation/"]) and current_year in l]
-        
-        # Exclude opinion/blog/column/interview URLs
-        article_links = [l for l in article_links if not any(x in l.lower() for x in ['/opinion/', '/blog/', '/column/', '/interview/', '/editorial/', '/perspective/'])]
-        
-        article_links = list(article_links)[:self.max_articles]
-        
-        results = []
-        for link in article_links:
-            html = self.fetch(link)
-            if html:
-                data = extract_article(html, link)
-                if data and data['title']:
-                    data['url'] = link
-                    data['source_domain'] = self.domain
-                    data['language'] = 'en' # KP is English
-                    results.append(data)
-                    
-        return results
+        super().__init__(get_source("kathmandupost.com"))
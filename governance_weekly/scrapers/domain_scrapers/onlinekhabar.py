@@ -1,46 +1,7 @@
-from scrapers.base_scraper import BaseScraper
-from extractor.article_extractor import extract_article
-import logging
-from datetime import datetime, timedelta
-import re
+"""OnlineKhabar: configured in scrapers/sources.json; kept for existing imports."""
+from scrapers.source_scraper import SourceScraper
+from scrapers.source_registry import get_source
 
-logger = logging.getLogger(__name__)
-
-class OnlineKhabarScraper(BaseScraper):
+class OnlineKhabarScraper(SourceScraper):
     def __init__(self):
-        super().__init__("https://www.onlinekhabar.com", "onlinekhabar.com")
-
-    def run(self):
-        logger.info(f"Starting scrape for {self.domain}")
-        
-        homepage_html = self.fetch(self.base_url)
-        if not homepage_html:
-            return []
-            
-        links = self.extract_links(homepage_html)
-        
-        # Filter by current year only (date range filtering happens in main.py)
-        today = datetime.now()
-        current_year = f"/{today.year}/"
-        
-        # OnlineKhabar links: /2025/article-id
-        article_links = [l for l in links if current_year in l and self.domain in l]
-        
-        # Exclude opinion/blog URLs
-        article_links = [l for l in article_links if not any(x in l.lower() for x in ['/opinion/', '/blog/', '/column/', '/interview/'])]
-        
-        article_links = list(article_links)[:self.max_articles]
-        logger.info(f"Found {len(article_links)} potential articles")
-        
-        results = []
-        for link in article_links:
-            html = self.fetch(link)
-            if html:
-                data = extract_article(html, link)
-                if data and data['title']:
-                    data['url'] = link
-                    data['source_domain'] = self.domain
-                    data['language'] = 'ne'  # OnlineKhabar is Nepali
-                    results.append(data)
-            
-        return results
+        super().__init__(get_source("onlinekhabar.com"))
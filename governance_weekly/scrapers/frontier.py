@@ -0,0 +1,142 @@
+"""
+Persistent crawl frontier.
+
+Candidate article links found by discovery (feeds, homepage and paginated
+listing pages) are stored in SQLite with their source, priority and state,
+and the crawl drains them from there. A collect that is restarted soon
+after a crash or a deadline resumes from the pending links instead of
+rediscovering every source; links that keep failing are given up after
+FRONTIER_MAX_ATTEMPTS. A link whose article is stored only becomes done once
+collect() has committed it, so anything lost to a crash, the deadline or a
+rolled-back batch is fetched again on resume.
+"""
+import sqlite3
+import threading
+import time
+import logging
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+PENDING, DONE, FAILED, SKIPPED = "pending", "done", "failed", "skipped"
+
+
+class CrawlFrontier:
+    def __init__(self, path=None, max_attempts=None, rediscover_after=None):
+        self.path = path or Config.FRONTIER_PATH
+        self.max_attempts = max_attempts or Config.FRONTIER_MAX_ATTEMPTS
+        self.rediscover_after = Config.FRONTIER_REDISCOVER_MINUTES * 60 if rediscover_after is None else rediscover_after
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS frontier (
+                url TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                discovered_at REAL,
+                priority REAL,
+                state TEXT,
+                attempts INTEGER DEFAULT 0,
+                updated_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_frontier_pending ON frontier(source, state, priority);
+            CREATE TABLE IF NOT EXISTS discoveries (
+                source TEXT,
+                window_start TEXT,
+                discovered_at REAL,
+                PRIMARY KEY (source, window_start)
+            );
+        ''')
+        self.conn.commit()
+
+    def needs_discovery(self, source, window_start):
+        """False if the source was discovered for this window recently enough to just resume."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT discovered_at FROM discoveries WHERE source = ? AND window_start = ?",
+                (source, str(window_start))
+            ).fetchone()
+        return row is None or time.time() - row[0] > self.rediscover_after
+
+    def add(self, source, scored_links, window_start=None):
+        """Queues (url, priority) pairs; already known URLs keep their state but get the new priority."""
+        now = time.time()
+        with self._lock:
+            self.conn.executemany(
+                "INSERT INTO frontier (url, source, discovered_at, priority, state, attempts, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, 0, ?) ON CONFLICT(url) DO UPDATE SET priority = excluded.priority",
+                [(url, source, now, priority, PENDING, now) for url, priority in scored_links]
+            )
+            if window_start is not None:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO discoveries (source, window_start, discovered_at) VALUES (?, ?, ?)",
+                    (source, str(window_start), now)
+                )
+            self.conn.commit()
+
+    def pending(self, source, limit=None):
+        """Pending (url, priority) pairs of a source, highest priority first."""
+        query = ("SELECT url, priority FROM frontier WHERE source = ? AND state = ? "
+                 "ORDER BY priority DESC, discovered_at ASC")
+        params = [source, PENDING]
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return self.conn.execute(query, params).fetchall()
+
+    def mark(self, urls, state):
+        now = time.time()
+        with self._lock:
+            self.conn.executemany("UPDATE frontier SET state = ?, updated_at = ? WHERE url = ?",
+                                  [(state, now, url) for url in urls])
+            self.conn.commit()
+
+    def record_attempt(self, url, ok):
+        """Marks a fetched link done, or counts a failed attempt (giving up after max_attempts)."""
+        now = time.time()
+        with self._lock:
+            if ok:
+                self.conn.execute("UPDATE frontier SET state = ?, attempts = attempts + 1, updated_at = ? WHERE url = ?",
+                                  (DONE, now, url))
+            else:
+                self.conn.execute(
+                    "UPDATE frontier SET attempts = attempts + 1, updated_at = ?, "
+                    "state = CASE WHEN attempts + 1 >= ? THEN ? ELSE state END WHERE url = ?",
+                    (now, self.max_attempts, FAILED, url)
+                )
+            self.conn.commit()
+
+    def prune(self, older_than_days=None):
+        """Drops entries discovered long before any window we still report on."""
+        days = Config.FRONTIER_KEEP_DAYS if older_than_days is None else older_than_days
+        cutoff = time.time() - days * 86400
+        with self._lock:
+            deleted = self.conn.execute("DELETE FROM frontier WHERE discovered_at < ?", (cutoff,)).rowcount
+            self.conn.execute("DELETE FROM discoveries WHERE discovered_at < ?", (cutoff,))
+            self.conn.commit()
+        return deleted
+
+    def summary(self):
+        with self._lock:
+            rows = self.conn.execute("SELECT state, COUNT(*) FROM frontier GROUP BY state").fetchall()
+        counts = dict(rows)
+        return ("Crawl frontier: " + ", ".join(f"{counts.get(s, 0)} {s}" for s in (PENDING, DONE, FAILED, SKIPPED)))
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+_frontier = None
+_frontier_lock = threading.Lock()
+
+def get_frontier():
+    """Returns the shared CrawlFrontier, or None when FRONTIER_ENABLED is off."""
+    global _frontier
+    if not Config.FRONTIER_ENABLED:
+        return None
+    with _frontier_lock:
+        if _frontier is None:
+            _frontier = CrawlFrontier()
+            _frontier.prune()
+        return _frontier
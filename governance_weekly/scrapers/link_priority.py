@@ -0,0 +1,79 @@
+"""
+Pre-fetch relevance scoring of candidate article links.
+
+Scores a link from its anchor text and URL path against the classifier's
+keyword taxonomy (English and Nepali), weighted by category priority, so
+the per-site budget is spent on governance-heavy stories first. Links that
+look like excluded content (sports, entertainment, opinion) are pushed to
+the back.
+"""
+import re
+import threading
+import logging
+from urllib.parse import urlparse, unquote
+from classifier.classifier import Classifier
+from classifier.keywords import exclude_keywords
+
+logger = logging.getLogger(__name__)
+
+# Penalty per exclude-keyword hit; larger than any single category match
+EXCLUDE_PENALTY = 10
+
+# URL separators become spaces so slugs read like text
+_SLUG_SEP_RE = re.compile(r"[-_/.+]+")
+
+
+def _keyword_re(keywords):
+    """One alternation per keyword list; ASCII keywords must match whole words."""
+    ascii_kw = sorted({k.lower() for k in keywords if k.isascii()}, key=len, reverse=True)
+    other_kw = sorted({k for k in keywords if not k.isascii()}, key=len, reverse=True)
+    parts = []
+    if ascii_kw:
+        parts.append(r"\b(?:" + "|".join(re.escape(k) for k in ascii_kw) + r")\b")
+    if other_kw:
+        # Devanagari words carry combining vowel signs, so \b is unreliable there
+        parts.append("|".join(re.escape(k) for k in other_kw))
+    return re.compile("|".join(parts), re.IGNORECASE) if parts else None
+
+
+class LinkScorer:
+    def __init__(self, classifier=None):
+        classifier = classifier or Classifier()
+        self.patterns = [
+            (_keyword_re(keywords), classifier.priority_weights.get(cat, 1))
+            for cat, keywords in classifier.categories.items()
+        ]
+        self.exclude = _keyword_re(exclude_keywords)
+
+    @staticmethod
+    def url_text(url):
+        """Path of the URL as plain words (section names and slug)."""
+        return _SLUG_SEP_RE.sub(" ", unquote(urlparse(url).path)).strip()
+
+    def score(self, url, anchor_text=""):
+        text = f"{anchor_text or ''} {self.url_text(url)}"
+        score = 0
+        for pattern, weight in self.patterns:
+            if pattern is not None:
+                score += weight * len(set(m.lower() for m in pattern.findall(text)))
+        if self.exclude is not None:
+            score -= EXCLUDE_PENALTY * len(set(m.lower() for m in self.exclude.findall(text)))
+        return score
+
+    def rank(self, links, anchors=None):
+        """Links sorted by descending score (ties keep their input order), with the scores."""
+        anchors = anchors or {}
+        scores = {link: self.score(link, anchors.get(link, "")) for link in links}
+        return sorted(links, key=lambda l: -scores[l]), scores
+
+
+_scorer = None
+_scorer_lock = threading.Lock()
+
+def get_scorer():
+    """Returns the shared LinkScorer (keyword patterns are compiled once)."""
+    global _scorer
+    with _scorer_lock:
+        if _scorer is None:
+            _scorer = LinkScorer()
+        return _scorer
@@ -0,0 +1,116 @@
+"""
+Declarative source registry.
+
+Every outlet is an entry in scrapers/sources.json (or SOURCES_PATH):
+
+    name          used by --scraper to pick sources
+    base_url      homepage; its host (minus "www.") is the source domain
+    language      "ne" or "en"
+    feeds         sitemap/RSS paths tried before the defaults (optional)
+    listings      section/listing page paths whose pagination is followed
+                  when the source has no usable feed (optional)
+    include       URL regexes, any of which marks an article link (optional)
+    require       URL regex every article link must match; "{year}" is the
+                  current year (optional)
+    exclude       URL regexes for non-news sections, on top of
+                  default_exclude; matched case-insensitively (optional)
+    fetch_mode    "http" or "browser" to skip fetch-mode learning (optional)
+    rate          max requests/sec for this host (optional)
+    max_articles  per-run cap, default MAX_ARTICLES_PER_SITE (optional)
+    extract       selectors for title/body/date/author plus "remove", used
+                  instead of readability; default_extract_remove is added
+                  to every profile's "remove" (optional, see
+                  extractor/extraction_profiles.py)
+    canonical     URL canonicalization rule: "host" and "scheme" (default
+                  base_url's) that every www./m./amp. variant of the domain
+                  is rewritten to, "drop_query" when article URLs never
+                  need a query string; hosts without a rule keep their host
+                  and scheme (optional, see utils/canonical_url.py)
+
+Each source's include and exclude lists are compiled once into a single
+alternation, so filtering a link is one regex search however many sections
+a source lists. Adding an outlet only needs a new entry.
+"""
+import json
+import re
+import threading
+import logging
+from datetime import datetime
+from urllib.parse import urlparse
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def _combine(patterns, flags=0):
+    patterns = [p for p in patterns or [] if p]
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags) if patterns else None
+
+
+class SourceConfig:
+    def __init__(self, entry, default_exclude=(), year=None, default_extract_remove=()):
+        self.name = entry["name"]
+        self.base_url = entry["base_url"].rstrip("/")
+        host = urlparse(self.base_url).netloc.lower()
+        self.domain = entry.get("domain") or (host[4:] if host.startswith("www.") else host)
+        self.language = entry.get("language", "ne")
+        self.feeds = list(entry.get("feeds", []))
+        self.listings = list(entry.get("listings", []))
+        self.fetch_mode = entry.get("fetch_mode")
+        self.rate = entry.get("rate")
+        self.max_articles = entry.get("max_articles")
+        extract = entry.get("extract")
+        self.extract = dict(extract, remove=list(default_extract_remove) + list(extract.get("remove", []))) if extract else None
+        canonical = entry.get("canonical")
+        self.canonical = dict({"host": host, "scheme": urlparse(self.base_url).scheme}, **canonical) if canonical is not None else None
+
+        year = str(year or datetime.now().year)
+        self.include = _combine(entry.get("include"))
+        require = entry.get("require")
+        self.require = re.compile(require.replace("{year}", year)) if require else None
+        self.exclude = _combine(list(default_exclude) + list(entry.get("exclude", [])), re.IGNORECASE)
+
+    def matches(self, url):
+        """True if the URL is an article link this source should consider."""
+        if self.include is not None and not self.include.search(url):
+            return False
+        if self.require is not None and not self.require.search(url):
+            return False
+        return self.exclude is None or not self.exclude.search(url)
+
+    def matches_name(self, target):
+        target = target.lower()
+        return target in f"{self.name}scraper".lower() or target in self.domain
+
+
+def load_sources(path=None, year=None):
+    """Parses the registry file into SourceConfig objects, in file order."""
+    path = path or Config.SOURCES_PATH
+    with open(path, encoding="utf-8") as f:
+        raw = json.load(f)
+    default_exclude = raw.get("default_exclude", [])
+    default_extract_remove = raw.get("default_extract_remove", [])
+    sources = []
+    for entry in raw.get("sources", []):
+        try:
+            sources.append(SourceConfig(entry, default_exclude, year, default_extract_remove))
+        except (KeyError, re.error) as e:
+            logger.error(f"Skipping invalid source entry {entry.get('name', entry)}: {e}")
+    return sources
+
+
+_sources = None
+_sources_lock = threading.Lock()
+
+def get_sources():
+    global _sources
+    with _sources_lock:
+        if _sources is None:
+            _sources = load_sources()
+        return _sources
+
+def get_source(domain):
+    for source in get_sources():
+        if source.domain == domain:
+            return source
+    raise KeyError(f"No source registered for {domain}")
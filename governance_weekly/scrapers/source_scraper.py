@@ -0,0 +1,51 @@
+"""
+Generic scraper engine for registry-configured sources.
+
+One SourceScraper per entry in the source registry: discover links (or
+resume from the crawl frontier), keep the ones matching the source's
+compiled URL patterns, then select, fetch and extract through BaseScraper.
+"""
+import logging
+from config import Config
+from scrapers.base_scraper import BaseScraper
+from utils.fetch_mode import HTTP, BROWSER
+from utils.selenium_manager import selenium_available
+
+logger = logging.getLogger(__name__)
+
+
+class SourceScraper(BaseScraper):
+    def __init__(self, source):
+        super().__init__(source.base_url, source.domain)
+        self.source = source
+        self.feed_paths = source.feeds
+        self.listing_paths = source.listings
+        if source.max_articles:
+            self.max_articles = source.max_articles
+        if source.rate:
+            self.limiter.cap_rate(self.base_url, source.rate)
+
+    def fetch_mode(self):
+        # A configured mode skips the per-domain learning
+        if self.source.fetch_mode == BROWSER and Config.USE_SELENIUM and selenium_available():
+            return BROWSER
+        if self.source.fetch_mode in (HTTP, BROWSER):
+            return HTTP
+        return super().fetch_mode()
+
+    def filter_links(self, links):
+        return [l for l in links if self.source.matches(l)]
+
+    def iter_articles(self):
+        logger.info(f"Starting scrape for {self.domain}")
+
+        if self.frontier is not None:
+            article_links = self.frontier_links()
+        else:
+            links = self.discover_links()
+            if not links:
+                return
+            article_links = self.select_links(self.filter_links(links))
+        logger.info(f"Found {len(article_links)} potential articles")
+
+        yield from self.scrape_articles(article_links, language=self.source.language)
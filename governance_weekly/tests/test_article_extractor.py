@@ -0,0 +1,43 @@
+import unittest
+from extractor.article_extractor import extract_article, clean_text, parse_html, tree_text
+from tools.legacy_article_extractor import extract_article as legacy_extract_article
+
+PAGE = """<html><head><title>Budget row | Kantipur</title>
+<link rel="canonical" href="https://ekantipur.com/news/2025/03/02/budget.html">
+<script type="application/ld+json">{"datePublished": "2025-03-02T08:00:00+05:45"}</script></head>
+<body><div class="menu">Home Politics</div><div class="article-body"><h1>Budget row deepens</h1>
+<p>The finance ministry [Photo] said on Sunday that the budget would be tabled. Read Time : < 1 minute</p>
+<script>var tracking = 1;</script>
+<p>Share via Email More lines about the parliament and government spending on federal projects.</p>
+</div></body></html>"""
+
+class TestExtractArticle(unittest.TestCase):
+    def test_fields(self):
+        data = extract_article(PAGE, "https://ekantipur.com/x")
+        self.assertEqual(data["canonical_url"], "https://ekantipur.com/news/2025/03/02/budget.html")
+        self.assertEqual(data["published_at"].date().isoformat(), "2025-03-02")
+        self.assertIn("finance ministry", data["full_text"])
+        for junk in ("[Photo]", "Read Time", "Share via Email", "tracking"):
+            self.assertNotIn(junk, data["full_text"])
+
+    def test_matches_legacy_extractor(self):
+        old = legacy_extract_article(PAGE, "https://ekantipur.com/x")
+        new = extract_article(PAGE, "https://ekantipur.com/x")
+        for key in ("title", "full_text", "published_at"):
+            self.assertEqual(new[key], old[key])
+
+    def test_date_class_fallback(self):
+        page = ('<html><body><span class="post-date">March 3, 2025</span>'
+                '<div><p>अख्तियार दुरुपयोग अनुसन्धान आयोगले मुद्दा दायर गरेको छ।</p></div></body></html>')
+        self.assertEqual(extract_article(page, "u")["published_at"].date().isoformat(), "2025-03-03")
+
+    def test_xml_declaration_and_empty(self):
+        self.assertIsNotNone(extract_article('<?xml version="1.0" encoding="utf-8"?><html><body><p>x</p></body></html>', "u"))
+        self.assertIsNone(extract_article("", "u"))
+
+    def test_text_helpers(self):
+        self.assertEqual(tree_text(parse_html("<p>a<!-- c -->b</p><script>x</script>")), "a\nb")
+        self.assertEqual(clean_text("one\n\n\n\nAdvertisement\ntwo"), "one\n\ntwo")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from scrapers.source_registry import SourceConfig
+from utils.canonical_url import normalize, CanonicalUrls
+
+class TestNormalize(unittest.TestCase):
+    def test_variants_collapse(self):
+        canonical = "https://www.onlinekhabar.com/2026/10/123456"
+        for variant in [
+            "http://onlinekhabar.com/2026/10/123456/",
+            "https://m.onlinekhabar.com/2026/10/123456?utm_source=facebook&fbclid=x",
+            "https://www.onlinekhabar.com/2026/10/123456/amp",
+            "https://www.onlinekhabar.com//2026/10/123456#comments",
+        ]:
+            self.assertEqual(normalize(variant), canonical, variant)
+
+    def test_percent_encoding(self):
+        raw = normalize("https://ekantipur.com/news/2026/10/01/भ्रष्टाचार")
+        lower = normalize("https://ekantipur.com/news/2026/10/01/%e0%a4%ad%e0%a5%8d%e0%a4%b0%e0%a4%b7%e0%a5%8d%e0%a4%9f%e0%a4%be%e0%a4%9a%e0%a4%be%e0%a4%b0")
+        self.assertEqual(raw, lower)
+
+    def test_reserved_escapes_kept(self):
+        self.assertEqual(normalize("https://ekantipur.com/tag/a%2fb"), "https://ekantipur.com/tag/a%2Fb")
+        self.assertNotEqual(normalize("https://ekantipur.com/tag/a%2Fb"), normalize("https://ekantipur.com/tag/a/b"))
+        self.assertEqual(normalize("https://ekantipur.com/tag/%7ex%3f"), "https://ekantipur.com/tag/~x%3F")
+
+    def test_unknown_domain_keeps_host_scheme_and_query(self):
+        self.assertEqual(normalize("https://www.example.com/view?utm_medium=x&id=7"), "https://www.example.com/view?id=7")
+        self.assertEqual(normalize("http://m.example.org/page?id=1"), "http://m.example.org/page?id=1")
+        self.assertEqual(normalize("https://example.org/amp"), "https://example.org/amp")
+
+    def test_rules_come_from_the_registry(self):
+        source = SourceConfig({"name": "X", "base_url": "https://www.x.com", "canonical": {"drop_query": True}})
+        self.assertEqual(source.canonical, {"host": "www.x.com", "scheme": "https", "drop_query": True})
+        self.assertIsNone(SourceConfig({"name": "Y", "base_url": "https://y.com"}).canonical)
+        with patch("utils.canonical_url.get_rules", return_value={"x.com": source.canonical}):
+            self.assertEqual(normalize("http://m.x.com/a/amp?id=1"), "https://www.x.com/a")
+
+class TestCanonicalAliases(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "aliases.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_rel_canonical_is_remembered(self):
+        urls = CanonicalUrls(path=self.path)
+        stored = urls.learn("https://kathmandupost.com/national/2026/10/01/x-1",
+                            "https://kathmandupost.com/national/2026/10/01/x", "kathmandupost.com")
+        self.assertEqual(stored, "https://kathmandupost.com/national/2026/10/01/x")
+        urls.save()
+        reloaded = CanonicalUrls(path=self.path)
+        self.assertEqual(reloaded.canonicalize("https://kathmandupost.com/national/2026/10/01/x-1/"), stored)
+
+    def test_homepage_canonical_is_ignored(self):
+        urls = CanonicalUrls(path=self.path)
+        link = "https://ukaalo.com/news/12345"
+        self.assertEqual(urls.learn(link, "https://ukaalo.com/", "ukaalo.com"), link)
+
+if __name__ == '__main__':
+    unittest.main()
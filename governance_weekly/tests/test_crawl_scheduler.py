@@ -0,0 +1,65 @@
+import time
+import unittest
+from unittest.mock import patch
+from utils.rate_limiter import TokenBucket, HostLimiter
+from scrapers.crawl_scheduler import stream_articles
+
+class TestTokenBucket(unittest.TestCase):
+    def test_rate_is_enforced_after_burst(self):
+        bucket = TokenBucket(rate=20, capacity=2)
+        start = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        # 2 tokens from the burst, 2 more at 20/s -> at least ~0.1s
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_hosts_share_bucket_ignoring_www(self):
+        limiter = HostLimiter(rate=1, burst=1, concurrency=1)
+        self.assertIs(limiter.bucket("https://www.example.com/a"), limiter.bucket("https://example.com/b"))
+        self.assertIsNot(limiter.bucket("https://example.com/"), limiter.bucket("https://other.com/"))
+
+class SleepyScraper:
+    def __init__(self, domain, delay):
+        self.domain = domain
+        self.base_url = f"https://{domain}"
+        self.delay = delay
+        self.stats = {}
+
+    def fetch_mode(self):
+        return "http"
+
+    def iter_articles(self):
+        time.sleep(self.delay)
+        if self.domain == "broken.com":
+            raise RuntimeError("boom")
+        for i in range(3):
+            yield {"url": f"https://{self.domain}/{i}"}
+
+class TestRunScrapers(unittest.TestCase):
+    def setUp(self):
+        patcher = patch('scrapers.crawl_scheduler.prefetch_robots')
+        self.prefetch = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_sources_run_concurrently(self):
+        scrapers = [SleepyScraper(f"site{i}.com", 0.2) for i in range(5)]
+        start = time.monotonic()
+        events = list(stream_articles(scrapers, workers=5))
+        self.assertLess(time.monotonic() - start, 0.6)
+        self.assertEqual(len([e for e in events if e[1] is not None]), 15)
+        self.assertEqual(len([e for e in events if e[1] is None]), 5)
+
+    def test_failing_source_is_reported(self):
+        scrapers = [SleepyScraper("broken.com", 0), SleepyScraper("ok.com", 0)]
+        done = {s.domain: error for s, article, error in stream_articles(scrapers, workers=2) if article is None}
+        self.assertIsInstance(done["broken.com"], RuntimeError)
+        self.assertIsNone(done["ok.com"])
+
+    def test_consumer_can_stop_early(self):
+        scrapers = [SleepyScraper(f"site{i}.com", 0) for i in range(3)]
+        stream = stream_articles(scrapers, workers=3)
+        next(stream)
+        stream.close()  # must not hang on crawlers blocked on the full queue
+
+if __name__ == '__main__':
+    unittest.main()
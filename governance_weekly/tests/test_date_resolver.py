@@ -0,0 +1,78 @@
+import unittest
+from datetime import date, datetime
+from extractor.article_extractor import parse_html
+from extractor.date_resolver import resolve_date, parse_iso, DateStats, ISO, BS, TEXT
+from utils.nepali_calendar import bs_to_ad, parse_bs_date
+
+class TestNepaliCalendar(unittest.TestCase):
+    def test_bs_to_ad(self):
+        self.assertEqual(bs_to_ad(2082, 1, 1), date(2025, 4, 14))
+        self.assertEqual(bs_to_ad(2081, 1, 1), date(2024, 4, 13))
+        # Constitution Day (Asoj 3) and Vijaya Dashami 2082
+        self.assertEqual(bs_to_ad(2081, 6, 3), date(2024, 9, 19))
+        self.assertEqual(bs_to_ad(2082, 6, 16), date(2025, 10, 2))
+        self.assertIsNone(bs_to_ad(2082, 1, 32))
+        # One known date per table row: New Year, Republic Day (Jestha 15), Shrawan 1, Constitution Day (Asoj 3)
+        known = [((2075, 6, 3), date(2018, 9, 19)), ((2076, 1, 1), date(2019, 4, 14)), ((2076, 6, 3), date(2019, 9, 20)),
+                 ((2077, 1, 1), date(2020, 4, 13)), ((2077, 6, 3), date(2020, 9, 19)), ((2078, 1, 1), date(2021, 4, 14)),
+                 ((2078, 6, 3), date(2021, 9, 19)), ((2079, 1, 1), date(2022, 4, 14)), ((2079, 6, 3), date(2022, 9, 19)),
+                 ((2080, 2, 15), date(2023, 5, 29)), ((2080, 6, 3), date(2023, 9, 20)), ((2081, 2, 15), date(2024, 5, 28)),
+                 ((2082, 2, 15), date(2025, 5, 29)), ((2082, 4, 1), date(2025, 7, 17)), ((2083, 1, 1), date(2026, 4, 14))]
+        for (year, month, day), expected in known:
+            self.assertEqual(bs_to_ad(year, month, day), expected, (year, month, day))
+        self.assertIsNone(bs_to_ad(2050, 1, 1))
+
+    def test_parse_bs_date(self):
+        self.assertEqual(parse_bs_date("२०८२ असोज १५ गते ०९:३०"), datetime(2025, 10, 1, 9, 30))
+        self.assertEqual(parse_bs_date("बिहीबार, असोज १६, २०८२"), datetime(2025, 10, 2))
+        self.assertEqual(parse_bs_date("Poush 3, 2081"), datetime(2024, 12, 18))
+        self.assertEqual(parse_bs_date("२०८२ असोज १५गते"), datetime(2025, 10, 1))
+        # Adjacent dates with no space between them: the day ends at its digit run
+        self.assertIsNone(parse_bs_date("२०७९ साउन ५२०८२ असोज ६"))
+        self.assertIsNone(parse_bs_date("campus 12, 2075"))
+        self.assertIsNone(parse_bs_date("March 3, 2025"))
+
+class TestResolveDate(unittest.TestCase):
+    def resolve(self, html):
+        return resolve_date(parse_html(html))
+
+    def test_iso_fast_path(self):
+        self.assertEqual(parse_iso("2025-03-02T08:00:00Z").isoformat(), "2025-03-02T08:00:00+00:00")
+        self.assertEqual(parse_iso("२०२५-०३-०२"), datetime(2025, 3, 2))
+        # A BS date written the ISO way
+        self.assertEqual(parse_iso("2082-06-16"), datetime(2025, 10, 2))
+        self.assertIsNone(parse_iso("March 2, 2025"))
+
+    def test_structured_sources_before_text(self):
+        page = ('<html><head><script type="application/ld+json">{"@graph": [{"@type": "NewsArticle", '
+                '"datePublished": "2025-03-02T08:00:00+05:45"}]}</script></head>'
+                '<body><span class="post-date">March 1, 2025</span></body></html>')
+        published, method = self.resolve(page)
+        self.assertEqual((published.date(), method), (date(2025, 3, 2), ISO))
+
+    def test_free_text_fallbacks(self):
+        published, method = self.resolve('<html><body><div class="Publish-Time">असोज १६, २०८२</div></body></html>')
+        self.assertEqual((published, method), (datetime(2025, 10, 2), BS))
+        published, method = self.resolve('<html><head><meta name="date" content="March 3, 2025"></head></html>')
+        self.assertEqual((published.date(), method), (date(2025, 3, 3), TEXT))
+        self.assertEqual(self.resolve("<html><body><p>no date</p></body></html>"), (None, None))
+
+    def test_adjacent_dates_not_merged(self):
+        page = ('<html><body><div class="page-wrapper timeline"><span>२०७९ साउन ५</span>'
+                '<span class="published-date">२०८२ असोज ६</span></div></body></html>')
+        self.assertEqual(self.resolve(page), (datetime(2025, 9, 22), BS))
+
+    def test_long_containers_skipped(self):
+        # A date-classed wrapper holding the whole page is not a date line
+        page = ('<html><body><div class="content-date">' + "समाचार " * 40 + '२०७९ साउन ५</div>'
+                '<span class="published-date">२०८२ असोज ६</span></body></html>')
+        self.assertEqual(self.resolve(page), (datetime(2025, 9, 22), BS))
+
+    def test_stats_summary(self):
+        stats = DateStats()
+        stats.record("ekantipur.com", ISO, 0.001)
+        stats.record("ekantipur.com", None, 0.003)
+        self.assertIn("ekantipur.com: 1/2 dated (50%; iso 1, bs 0, text 0), 2.0 ms/page", stats.summary())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from scrapers.base_scraper import BaseScraper
+from scrapers.discovery import parse_feed, parse_feed_date, discover_feed_links
+
+SITEMAP_INDEX = """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/sitemap-2025-01.xml</loc><lastmod>2025-01-31T10:00:00+05:45</lastmod></sitemap>
+  <sitemap><loc>https://example.com/sitemap-2025-03.xml</loc><lastmod>2025-03-10T10:00:00+05:45</lastmod></sitemap>
+</sitemapindex>"""
+
+NEWS_SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url><loc>https://example.com/news/new</loc><news:news><news:publication_date>2025-03-08T09:00:00+05:45</news:publication_date></news:news></url>
+  <url><loc>https://example.com/news/old</loc><lastmod>2025-02-01</lastmod></url>
+</urlset>"""
+
+RSS = """<rss version="2.0"><channel>
+  <item><title>A</title><link>https://example.com/2025/1001</link><pubDate>Sat, 08 Mar 2025 06:00:00 +0545</pubDate></item>
+  <item><title>B</title><link>https://example.com/2025/0999</link><pubDate>Mon, 03 Feb 2025 06:00:00 +0545</pubDate></item>
+</channel></rss>"""
+
+WINDOW = (datetime(2025, 3, 7), datetime(2025, 3, 10, 12))
+
+class TestParseFeed(unittest.TestCase):
+    def test_dates(self):
+        self.assertEqual(parse_feed_date("2025-03-08T09:00:00Z"), datetime(2025, 3, 8, 9))
+        self.assertEqual(parse_feed_date("Sat, 08 Mar 2025 06:00:00 +0545"), datetime(2025, 3, 8, 6))
+        self.assertIsNone(parse_feed_date("yesterday"))
+
+    def test_sitemap_index_and_rss(self):
+        entries, children = parse_feed(SITEMAP_INDEX, "https://example.com")
+        self.assertEqual(entries, [])
+        self.assertEqual(len(children), 2)
+        entries, children = parse_feed(RSS, "https://example.com")
+        self.assertEqual([u for u, _ in entries], ["https://example.com/2025/1001", "https://example.com/2025/0999"])
+
+class TestDiscoverFeedLinks(unittest.TestCase):
+    def test_follows_recent_child_sitemaps_and_filters_window(self):
+        pages = {
+            "https://example.com/sitemap.xml": SITEMAP_INDEX,
+            "https://example.com/sitemap-2025-03.xml": NEWS_SITEMAP,
+        }
+        scraper = BaseScraper("https://example.com", "example.com")
+        with patch('scrapers.discovery.get_sitemaps', return_value=[]), \
+             patch.object(scraper, 'fetch', side_effect=lambda url, **kw: pages.get(url)) as fetch:
+            links = discover_feed_links(scraper, WINDOW)
+        self.assertEqual(list(links), ["https://example.com/news/new"])
+        fetched = [c.args[0] for c in fetch.call_args_list]
+        self.assertNotIn("https://example.com/sitemap-2025-01.xml", fetched)
+
+    def test_no_feed_returns_none(self):
+        scraper = BaseScraper("https://example.com", "example.com")
+        with patch('scrapers.discovery.get_sitemaps', return_value=[]), \
+             patch.object(scraper, 'fetch', return_value="<html><body>Not found</body></html>"):
+            self.assertIsNone(discover_feed_links(scraper, WINDOW))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+from utils.selenium_manager import DriverPool
+
+class TestDriverPool(unittest.TestCase):
+    def test_reuses_drivers(self):
+        pool = DriverPool(size=1)
+        with patch('utils.selenium_manager.create_driver', side_effect=lambda: MagicMock()) as create:
+            with pool.acquire() as first:
+                pass
+            with pool.acquire() as second:
+                pass
+        self.assertIs(first, second)
+        self.assertEqual(create.call_count, 1)
+        pool.close()
+        first.quit.assert_called_once()
+
+    def test_warm_up_finishing_after_close_quits_its_driver(self):
+        pool = DriverPool(size=2)
+        started, release = threading.Event(), threading.Event()
+        driver = MagicMock()
+        def slow_create():
+            started.set()
+            release.wait(5)
+            return driver
+        with patch('utils.selenium_manager.selenium_available', return_value=True), \
+             patch('utils.selenium_manager.create_driver', side_effect=slow_create):
+            pool.warm_up()
+            self.assertTrue(started.wait(5))
+            pool.close()
+            release.set()
+            for thread in threading.enumerate():
+                if thread.name == "selenium-warmup":
+                    thread.join(5)
+        driver.quit.assert_called_once()
+        self.assertEqual((pool._drivers, pool._created, pool._idle.qsize()), ([], 0, 0))
+        with pool.acquire(timeout=0.01) as late:
+            self.assertIsNone(late)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from extractor.article_extractor import extract_article
+from extractor.extraction_pool import ExtractionPool
+
+PAGE = ("<html><head><title>सुशासन</title><meta name='date' content='2025-02-01'></head><body><article>"
+        "<p>अख्तियार दुरुपयोग अनुसन्धान आयोगले आज भ्रष्टाचार मुद्दा दायर गरेको छ।</p></article></body></html>")
+
+class TestExtractionPool(unittest.TestCase):
+    def test_inline_when_disabled(self):
+        pool = ExtractionPool(workers=0)
+        pool.start()
+        self.assertEqual(pool.extract(PAGE, "u")["full_text"], extract_article(PAGE, "u")["full_text"])
+        self.assertIsNone(pool.extract(None, "u"))
+
+    def test_worker_process_matches_inline(self):
+        pool = ExtractionPool(workers=1)
+        pool.start()
+        try:
+            data = pool.extract(PAGE, "u")
+        finally:
+            pool.shutdown()
+        inline = extract_article(PAGE, "u")
+        for key in ("title", "full_text", "published_at", "canonical_url"):
+            self.assertEqual(data[key], inline[key])
+        # Raw HTML is re-attached from the caller's copy
+        self.assertIs(data["raw_html"], PAGE)
+
+    def test_falls_back_after_shutdown(self):
+        pool = ExtractionPool(workers=1)
+        pool.start()
+        pool.shutdown()
+        self.assertEqual(pool.extract(PAGE, "u")["title"], "सुशासन")
+
+if __name__ == '__main__':
+    unittest.main()
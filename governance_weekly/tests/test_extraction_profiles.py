@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import patch
+from extractor.article_extractor import extract_article, parse_html
+from extractor.extraction_profiles import ExtractionProfile, ProfileStats
+from scrapers.source_registry import SourceConfig
+from utils.selenium_manager import ready_selector_for, GENERIC_ARTICLE_READY
+
+BODY = "<p>" + "सरकारले भ्रष्टाचार नियन्त्रणका लागि नयाँ नीति ल्याएको छ। " * 10 + "</p>"
+PAGE = ("<html><head><title>Site | Ekantipur</title></head><body>"
+        "<div class='article-header'><h1>Headline here</h1><span class='byline'>Ram  Sharma</span>"
+        "<time datetime='2025-03-02T08:00:00+05:45'></time></div>"
+        "<div class='description'>" + BODY + "<div class='share-buttons'>Share on Facebook</div>"
+        "<p class='notice'>News Summary box</p></div></body></html>")
+
+PROFILE = ExtractionProfile({
+    "title": ["h2", ".article-header h1"],
+    "body": ".description",
+    "date": "//time",
+    "author": ".byline",
+    "remove": ["[class*='share']", "p.notice"],
+})
+
+class TestExtractionProfiles(unittest.TestCase):
+    @patch("extractor.article_extractor.Document")
+    @patch("extractor.article_extractor.get_profile", return_value=PROFILE)
+    def test_profile_hit(self, _, document):
+        data = extract_article(PAGE, "https://ekantipur.com/news/2025/03/02/x.html")
+        document.assert_not_called()
+        self.assertTrue(data["extraction"]["profile_hit"])
+        self.assertEqual((data["title"], data["author"]), ("Headline here", "Ram Sharma"))
+        self.assertEqual(data["published_at"].date().isoformat(), "2025-03-02")
+        self.assertTrue(data["full_text"].startswith("सरकारले"))
+        self.assertNotIn("Share", data["full_text"])
+        self.assertNotIn("Summary box", data["full_text"])
+
+    @patch("extractor.article_extractor.get_profile", return_value=ExtractionProfile({"body": ".story"}))
+    def test_miss_falls_back_to_readability(self, _):
+        data = extract_article(PAGE, "https://ekantipur.com/x")
+        self.assertFalse(data["extraction"]["profile_hit"])
+        self.assertIn("सरकारले", data["full_text"])
+        self.assertEqual(data["title"], "Site | Ekantipur")
+
+    def test_no_profile(self):
+        self.assertIsNone(extract_article(PAGE, "https://example.com/x")["extraction"]["profile_hit"])
+
+    def test_registry_adds_default_remove(self):
+        source = SourceConfig({"name": "X", "base_url": "https://x.com", "extract": {"body": ".b", "remove": [".ad"]}},
+                              default_extract_remove=["script"])
+        self.assertEqual(source.extract["remove"], ["script", ".ad"])
+        self.assertIsNotNone(ExtractionProfile(source.extract).body_of(parse_html("<div class='b'><p>x</p></div>")))
+
+    def test_ready_selector_from_profile(self):
+        self.assertEqual(ExtractionProfile({"body": [".story", "//div[@id='x']"]}).ready_selectors, [".story p"])
+        self.assertEqual(ready_selector_for("https://www.onlinekhabar.com/2025/10/1"),
+                         ".ok18-single-post-content-wrap p, " + GENERIC_ARTICLE_READY)
+        self.assertEqual(ready_selector_for("https://example.com/x"), GENERIC_ARTICLE_READY)
+
+    def test_stats_flag_low_hit_rate(self):
+        stats = ProfileStats(min_hit_rate=0.8, min_pages=4)
+        for hit in (True, False, False, True, None):
+            stats.record("ekantipur.com", hit)
+        self.assertEqual(stats.hit_rate("ekantipur.com"), 0.5)
+        self.assertIn("ekantipur.com: 2/4 pages (50%) - below the expected hit rate", stats.summary())
+
+if __name__ == '__main__':
+    unittest.main()
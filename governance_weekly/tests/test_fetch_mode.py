@@ -0,0 +1,49 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from utils.fetch_mode import FetchModePolicy, HTTP, BROWSER, PROBE
+from scrapers.base_scraper import BaseScraper
+
+BODY = "Governance news paragraph. " * 30
+FULL_PAGE = f"<html><title>Full</title><body><article><p>{BODY}</p></article></body></html>"
+SHELL_PAGE = "<html><title>Shell</title><body><div id='app'></div></body></html>"
+
+class TestFetchModePolicy(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "modes.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_decision_is_persisted(self):
+        policy = FetchModePolicy(path=self.path, probes=2, ttl_days=14)
+        self.assertEqual(policy.mode_for("example.com"), PROBE)
+        policy.observe("example.com", False)
+        policy.observe("example.com", False)
+        self.assertEqual(policy.mode_for("example.com"), BROWSER)
+        self.assertEqual(FetchModePolicy(path=self.path).mode_for("example.com"), BROWSER)
+
+    def test_probe_escalates_to_browser(self):
+        policy = FetchModePolicy(path=self.path, probes=1, ttl_days=14)
+        scraper = BaseScraper("https://example.com", "example.com")
+
+        def fake_fetch(url, use_selenium=None, kind=None, refresh=False):
+            return FULL_PAGE if use_selenium else SHELL_PAGE
+
+        with patch('scrapers.base_scraper.Config.USE_SELENIUM', True), \
+             patch('scrapers.base_scraper.selenium_available', return_value=True), \
+             patch('scrapers.base_scraper.get_policy', return_value=policy), \
+             patch.object(scraper, 'fetch', side_effect=fake_fetch):
+            data = scraper.fetch_article("https://example.com/news/1")
+            self.assertIn("Governance news", data["full_text"])
+            self.assertEqual(scraper.fetch_mode(), BROWSER)
+
+    def test_http_only_without_selenium(self):
+        scraper = BaseScraper("https://example.com", "example.com")
+        with patch('scrapers.base_scraper.selenium_available', return_value=False):
+            self.assertEqual(scraper.fetch_mode(), HTTP)
+
+if __name__ == '__main__':
+    unittest.main()
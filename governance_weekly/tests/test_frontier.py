@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from scrapers.base_scraper import BaseScraper
+from scrapers.discovery import find_next_page
+from scrapers.frontier import CrawlFrontier, DONE, FAILED
+
+WINDOW = (datetime(2026, 10, 9), datetime(2026, 10, 15, 23, 59))
+
+class TestCrawlFrontier(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "frontier.db")
+        self.frontier = CrawlFrontier(path=self.path, max_attempts=2, rediscover_after=3600)
+
+    def tearDown(self):
+        self.frontier.close()
+        self.tmp.cleanup()
+
+    def test_pending_by_priority_and_states(self):
+        self.frontier.add("a.com", [("https://a.com/1", 1.0), ("https://a.com/2", 5.0), ("https://a.com/3", 0.0)])
+        self.assertEqual([u for u, _ in self.frontier.pending("a.com")],
+                         ["https://a.com/2", "https://a.com/1", "https://a.com/3"])
+        self.frontier.record_attempt("https://a.com/2", True)
+        self.frontier.record_attempt("https://a.com/1", False)
+        self.assertIn("https://a.com/1", [u for u, _ in self.frontier.pending("a.com")])  # retried next time
+        self.frontier.record_attempt("https://a.com/1", False)
+        self.assertEqual([u for u, _ in self.frontier.pending("a.com")], ["https://a.com/3"])
+        self.assertIn(f"1 {DONE}", self.frontier.summary())
+        self.assertIn(f"1 {FAILED}", self.frontier.summary())
+
+    def test_restart_resumes_without_rediscovery(self):
+        self.assertTrue(self.frontier.needs_discovery("a.com", WINDOW[0]))
+        self.frontier.add("a.com", [("https://a.com/1", 1.0)], WINDOW[0])
+        self.frontier.close()
+        self.frontier = CrawlFrontier(path=self.path, rediscover_after=3600)
+        self.assertFalse(self.frontier.needs_discovery("a.com", WINDOW[0]))
+        self.assertEqual(self.frontier.pending("a.com"), [("https://a.com/1", 1.0)])
+
+    def test_extracted_links_stay_pending_until_stored(self):
+        links = ["https://a.com/1", "https://a.com/2", "https://a.com/3"]
+        self.frontier.add("a.com", [(l, 1.0) for l in links])
+        pages = {"https://a.com/1": {"title": "One"}, "https://a.com/2": {"title": ""}}
+        scraper = BaseScraper("https://a.com", "a.com")
+        scraper.frontier = self.frontier
+        with patch.object(scraper, 'fetch_article', side_effect=lambda link: dict(pages[link]) if link in pages else None):
+            articles = list(scraper.scrape_articles(links, "ne"))
+        self.assertEqual([a['link'] for a in articles], ["https://a.com/1"])
+        # Not yet committed: still pending; untitled page settled; failure counted
+        self.assertEqual(sorted(u for u, _ in self.frontier.pending("a.com")), ["https://a.com/1", "https://a.com/3"])
+        self.assertIn(f"1 {DONE}", self.frontier.summary())
+
+class TestListingPagination(unittest.TestCase):
+    def test_next_page(self):
+        self.assertEqual(find_next_page('<a rel="next" href="/news?page=2">2</a>', "https://a.com/news"),
+                         "https://a.com/news?page=2")
+        self.assertEqual(find_next_page('<a href="/news/page/3">3</a><a href="/news/page/4">4</a>', "https://a.com/news/page/2"),
+                         "https://a.com/news/page/3")
+        self.assertEqual(find_next_page('<a href="/p2">अर्को</a>', "https://a.com/news"), "https://a.com/p2")
+        self.assertIsNone(find_next_page('<a href="/about">About</a>', "https://a.com/news"))
+
+    def test_stops_at_links_older_than_window(self):
+        pages = {
+            "https://example.com/news": '<a href="/news/2026/10/12/a">A</a><a rel="next" href="/news?page=2">Next</a>',
+            "https://example.com/news?page=2": '<a href="/news/2026/09/01/b">B</a><a rel="next" href="/news?page=3">Next</a>',
+            "https://example.com/news?page=3": '<a href="/news/2026/08/01/c">C</a>',
+        }
+        scraper = BaseScraper("https://example.com", "example.com")
+        scraper.window = WINDOW
+        scraper.listing_paths = ["/news"]
+        with patch.object(scraper, 'fetch', side_effect=lambda url, **kw: pages.get(url)) as fetch:
+            links = scraper.crawl_listings()
+        self.assertEqual(fetch.call_count, 2)
+        self.assertIn("https://example.com/news/2026/09/01/b", links)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+from utils.html_decode import decode_html, declared_encoding, document_encoding
+
+NEPALI = "<html><head><title>भ्रष्टाचार</title></head><body>सुशासन</body></html>"
+
+class TestDecodeHtml(unittest.TestCase):
+    def test_utf8_without_declared_charset(self):
+        self.assertEqual(decode_html(NEPALI.encode("utf-8"), "text/html"), NEPALI)
+
+    def test_utf8_bom(self):
+        self.assertEqual(decode_html(b"\xef\xbb\xbf" + NEPALI.encode("utf-8")), NEPALI)
+
+    def test_declared_legacy_charset(self):
+        page = '<html><head><meta charset="windows-1252"></head><body>café “quoted”</body></html>'
+        self.assertEqual(decode_html(page.encode("cp1252")), page)
+        self.assertEqual(declared_encoding('text/html; charset="ISO-8859-1"'), "iso-8859-1")
+        self.assertEqual(document_encoding(b'<?xml version="1.0" encoding="windows-1252"?><rss/>'), "windows-1252")
+
+    def test_undecodable_bytes_are_replaced(self):
+        self.assertEqual(decode_html(b"ok \xff", "text/html; charset=bogus"), "ok �")
+
+    def test_str_passes_through(self):
+        self.assertIs(decode_html(NEPALI), NEPALI)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from unittest.mock import patch
+from extractor.article_extractor import extract_article
+from utils.html_minimizer import minimize_html, is_ad_container
+
+BODY = "<p>" + "अख्तियार दुरुपयोग अनुसन्धान आयोगले आज भ्रष्टाचार मुद्दा दायर गरेको छ। " * 5 + "</p>"
+LD = '<script type="application/ld+json">{"@type": "NewsArticle", "datePublished": "2025-03-02"}</script>'
+PAGE = ("<html><head><title>सुशासन</title>" + LD + "<script>var x = '<div>';</script><style>p{color:red}</style>"
+        "<meta name='date' content='2025-03-02'></head><body><!-- header --><svg><svg><path/></svg></svg>"
+        "<svg class='icon'/><article>" + BODY + "<div class='ad-slot'><div><ins class='adsbygoogle'></ins></div>"
+        "<p>Advertisement</p></div><noscript><img src='x'></noscript><div class='headline'>Keep</div></article>"
+        "<aside id=sidebar-ads>Ads</aside></body></html>")
+
+class TestHtmlMinimizer(unittest.TestCase):
+    def test_strips_noise_and_keeps_content(self):
+        html = minimize_html(PAGE)
+        self.assertEqual(html, "<html><head><title>सुशासन</title>" + LD + "<meta name='date' content='2025-03-02'></head>"
+                         "<body><article>" + BODY + "<div class='headline'>Keep</div></article></body></html>")
+
+    def test_extraction_unchanged(self):
+        before, after = extract_article(PAGE, "u"), extract_article(minimize_html(PAGE), "u")
+        for key in ("title", "published_at", "full_text"):
+            self.assertEqual(before[key], after[key])
+
+    def test_unclosed_and_disabled(self):
+        self.assertEqual(minimize_html("<p>a</p><script>b"), "<p>a</p>")
+        self.assertEqual(minimize_html("<p>a</p><!-- b"), "<p>a</p>")
+        with patch("utils.html_minimizer.Config.HTML_MINIMIZE", False):
+            self.assertEqual(minimize_html(PAGE), PAGE)
+
+    def test_unbalanced_ad_container_keeps_content(self):
+        unclosed = "<html><body><div class='ad'><span>Advertisement</span><article>" + BODY + "</article></body></html>"
+        html = minimize_html(unclosed)
+        self.assertIn(BODY, html)
+        self.assertNotIn("class='ad'", html)
+        self.assertTrue(extract_article(html, "u")["full_text"].startswith("अख्तियार"))
+        # Closed by the parent's end tag, so it spans the article: too much text for an ad
+        swallowing = "<div class='main'><div class='ad'>" + BODY * 2 + "</div></div>"
+        self.assertEqual(minimize_html(swallowing), "<div class='main'>" + BODY * 2 + "</div></div>")
+        self.assertEqual(minimize_html("<p>a</p><svg><path/>"), "<p>a</p><path/>")
+
+    def test_ad_container_tokens(self):
+        for attrs in (' class="box ads"', " id='div-gpt-ad'", ' class="advertisement-top"', " class=google-ad", ' class="adContainer"'):
+            self.assertTrue(is_ad_container(attrs), attrs)
+        for attrs in (' class="header-addr"', ' class="shadow"', ' class="loaded"', ' data-ad="1"', ' class="read-more"'):
+            self.assertFalse(is_ad_container(attrs), attrs)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from utils.http_cache import HttpCache
+from scrapers.base_scraper import BaseScraper
+
+class TestHttpCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = HttpCache(path=os.path.join(self.tmp.name, "cache.db"), max_bytes=1000,
+                               ttls={"homepage": 0, "article": 3600})
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def test_ttl_per_kind(self):
+        self.cache.store("https://example.com/a", "<html></html>", etag='"v1"')
+        entry = self.cache.lookup("https://example.com/a")
+        self.assertTrue(self.cache.is_fresh(entry, "article"))
+        self.assertFalse(self.cache.is_fresh(entry, "homepage"))
+        self.assertEqual(self.cache.conditional_headers(entry), {"If-None-Match": '"v1"'})
+
+    def test_lru_eviction(self):
+        self.cache.store("https://example.com/old", "x" * 400)
+        self.cache.store("https://example.com/mid", "x" * 400)
+        self.cache.touch("https://example.com/old")
+        self.cache.store("https://example.com/new", "x" * 400)
+        self.assertIsNone(self.cache.lookup("https://example.com/mid"))
+        self.assertIsNotNone(self.cache.lookup("https://example.com/old"))
+        self.assertLessEqual(self.cache.total_bytes, 1000)
+
+    @patch('scrapers.base_scraper.is_allowed', return_value=True)
+    @patch('scrapers.base_scraper.Config.USE_SELENIUM', False)
+    def test_fetch_revalidates_stale_homepage(self, _allowed):
+        self.cache.store("https://example.com", "<html>cached</html>", etag='"v1"')
+        not_modified = MagicMock(status_code=304)
+        with patch('scrapers.base_scraper.get_cache', return_value=self.cache), \
+             patch('scrapers.base_scraper.http_get', return_value=not_modified) as mock_get:
+            scraper = BaseScraper("https://example.com", "example.com")
+            html = scraper.fetch("https://example.com")
+        self.assertEqual(html, "<html>cached</html>")
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(self.cache.stats["revalidated"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
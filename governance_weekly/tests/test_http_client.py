@@ -0,0 +1,23 @@
+import unittest
+from unittest.mock import patch
+from config import Config
+from utils import http_client
+from utils.http_client import HttpClient, get_client
+
+class TestHttpClient(unittest.TestCase):
+    def test_shared_client_is_reused(self):
+        self.assertIs(get_client(), get_client())
+
+    def test_session_defaults(self):
+        client = HttpClient(http2=False)
+        self.assertEqual(client._client.headers["User-Agent"], Config.USER_AGENT)
+        adapter = client._client.get_adapter("https://ekantipur.com/")
+        self.assertEqual(adapter._pool_maxsize, Config.HTTP_POOL_PER_HOST)
+
+    def test_http2_falls_back_without_httpx(self):
+        with patch.object(http_client, "httpx", None):
+            client = HttpClient(http2=True)
+        self.assertFalse(client.http2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from scrapers.base_scraper import BaseScraper
+from scrapers.link_priority import LinkScorer
+
+class TestLinkScorer(unittest.TestCase):
+    def setUp(self):
+        self.scorer = LinkScorer()
+
+    def test_governance_outranks_sports(self):
+        corruption = self.scorer.score("https://example.com/national/2026/10/01/ciaa-files-corruption-case")
+        sports = self.scorer.score("https://example.com/sports/2026/10/01/cricket-tournament-final")
+        self.assertGreater(corruption, 0)
+        self.assertLess(sports, 0)
+
+    def test_nepali_anchor_text(self):
+        self.assertGreater(self.scorer.score("https://example.com/story/123", "अख्तियारमा भ्रष्टाचार मुद्दा"), 0)
+
+    def test_whole_words_only(self):
+        # "act" must not match inside "impact"
+        self.assertEqual(self.scorer.score("https://example.com/story/1", "impact"), 0)
+
+class TestPrioritizedBudget(unittest.TestCase):
+    def test_budget_goes_to_relevant_links_first(self):
+        scraper = BaseScraper("https://example.com", "example.com")
+        scraper.max_articles = 1
+        html = ('<a href="/news/1">Cricket team wins football match</a>'
+                '<a href="/news/2">Minister arrested for corruption and bribery</a>')
+        links = scraper.extract_links(html)
+        self.assertEqual(scraper.select_links(links), ["https://example.com/news/2"])
+        self.assertEqual(scraper.stats["budget_prescored"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
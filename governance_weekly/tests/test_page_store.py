@@ -0,0 +1,30 @@
+import unittest
+from database.page_store import PageStore, content_hash
+
+PAGE = "<html><body><p>" + "अख्तियार दुरुपयोग अनुसन्धान आयोगले मुद्दा दायर गरेको छ। " * 200 + "</p></body></html>"
+
+class TestPageStore(unittest.TestCase):
+    def setUp(self):
+        self.store = PageStore(":memory:", codec="zlib")
+
+    def test_round_trip_and_dedup(self):
+        digest = self.store.put(PAGE)
+        self.assertEqual(digest, content_hash(PAGE))
+        self.assertEqual(self.store.put(PAGE), digest)
+        self.assertEqual(self.store.get(digest), PAGE)
+        pages, size, stored = self.store.totals()
+        self.assertEqual((pages, size), (1, len(PAGE.encode("utf-8"))))
+        self.assertLess(stored * 10, size)
+        self.assertEqual((self.store.stats["stored"], self.store.stats["duplicate"]), (1, 1))
+
+    def test_iter_pages_in_order(self):
+        hashes = [self.store.put(f"<p>{i}</p>") for i in range(5)]
+        got = list(self.store.iter_pages(["missing"] + hashes[::-1], batch=2))
+        self.assertEqual(got, [(h, f"<p>{i}</p>") for i, h in reversed(list(enumerate(hashes)))])
+
+    def test_empty_page(self):
+        self.assertIsNone(self.store.put(""))
+        self.assertIsNone(self.store.get(None))
+
+if __name__ == '__main__':
+    unittest.main()
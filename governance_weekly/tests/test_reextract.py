@@ -0,0 +1,64 @@
+import sqlite3
+import unittest
+from datetime import datetime
+from database.db import ensure_columns, ADDED_COLUMNS
+from database.page_store import PageStore, move_inline_pages
+from extractor.article_extractor import extract_article
+from extractor.extraction_pool import ExtractionPool
+from extractor.reextract import reextract
+
+BODY = "अख्तियार दुरुपयोग अनुसन्धान आयोगले आज भ्रष्टाचार मुद्दा दायर गरेको छ। " * 3
+
+def page(date):
+    return (f"<html><head><title>सुशासन</title><meta name='date' content='{date}'></head>"
+            f"<body><article><p>{BODY}</p><p>Advertisement</p></article></body></html>")
+
+class TestReextract(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("CREATE TABLE articles (url TEXT PRIMARY KEY, source_domain TEXT, full_text_original TEXT, "
+                          "published_at TIMESTAMP, fetched_at TIMESTAMP, summary TEXT, content_hash TEXT, raw_html TEXT)")
+        self.assertEqual(ensure_columns(self.conn, "articles", ADDED_COLUMNS), list(ADDED_COLUMNS))
+        self.assertEqual(ensure_columns(self.conn, "articles", ADDED_COLUMNS), [])
+        rows = [
+            # Stored before junk cleanup: text changes
+            ("a", "x.com", BODY + "\nAdvertisement", "2025-02-01T00:00:00", "2025-02-02", "old summary", page("2025-02-01")),
+            # Up to date
+            ("b", "x.com", None, "2025-02-01T00:00:00", "2025-02-02", "kept", page("2025-02-01")),
+            # Wrong date stored
+            ("c", "y.com", None, "2025-01-01T00:00:00", "2025-02-02", "old", page("2025-02-03")),
+            # Fetched before --since
+            ("d", "x.com", "stale text", None, "2025-01-01", "old", page("2025-02-01")),
+        ]
+        self.conn.executemany("INSERT INTO articles (url, source_domain, full_text_original, published_at, fetched_at, "
+                              "summary, raw_html) VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        # Rows b and c hold what the current extractor produces for their text
+        current = extract_article(page("2025-02-01"), "b")["full_text"]
+        self.conn.execute("UPDATE articles SET full_text_original = ? WHERE url IN ('b', 'c')", (current,))
+        self.store = PageStore(":memory:")
+
+    def test_only_changed_rows_are_written_and_marked_stale(self):
+        counts = reextract(self.conn, ExtractionPool(workers=0), since=datetime(2025, 2, 1), store=self.store)
+        self.assertEqual((counts["pages"], counts["changed"], counts["text"], counts["date"], counts["unchanged"]),
+                         (3, 2, 1, 1, 1))
+        rows = {r[0]: r[1:] for r in self.conn.execute("SELECT url, stale, summary, published_at FROM articles")}
+        # Summaries are left for the stale refresh to redo
+        self.assertEqual(rows["a"][:2], (1, "old summary"))
+        self.assertEqual(rows["b"][:2], (0, "kept"))
+        self.assertEqual(rows["c"], (1, "old", "2025-02-03T00:00:00"))
+        self.assertEqual(rows["d"][:2], (0, "old"))
+
+    def test_source_filter(self):
+        counts = reextract(self.conn, ExtractionPool(workers=0), source="y.com", store=self.store)
+        self.assertEqual((counts["pages"], counts["changed"]), (1, 1))
+
+    def test_pages_read_from_the_page_store(self):
+        self.assertEqual(move_inline_pages(self.conn, self.store, batch=3), 4)
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM articles WHERE raw_html IS NOT NULL").fetchone()[0], 0)
+        # a, b and d hold the same page
+        self.assertEqual(self.store.totals()[0], 2)
+        counts = reextract(self.conn, ExtractionPool(workers=0), since=datetime(2025, 2, 1), store=self.store)
+        self.assertEqual((counts["pages"], counts["changed"], counts["failed"]), (3, 2, 0))
+
+if __name__ == '__main__':
+    unittest.main()
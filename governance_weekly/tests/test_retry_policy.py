@@ -0,0 +1,105 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from utils.rate_limiter import HostLimiter
+from utils.retry_policy import FetchPolicy, FetchError, parse_retry_after
+from scrapers.base_scraper import BaseScraper
+
+def response(status, text="", headers=None):
+    return MagicMock(status_code=status, text=text, content=text.encode("utf-8"), headers=headers or {})
+
+class TestFetchPolicy(unittest.TestCase):
+    def setUp(self):
+        self.limiter = HostLimiter(rate=1.0, burst=1, concurrency=2)
+        self.limiter.max_rate, self.limiter.min_rate, self.limiter.step = 2.0, 0.1, 0.5
+        self.policy = FetchPolicy(max_retries=2, backoff_base=0.01, backoff_max=1.0,
+                                  slow_seconds=5, breaker_threshold=3, limiter=self.limiter)
+
+    def test_retry_after(self):
+        self.assertEqual(parse_retry_after("7"), 7.0)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:10 GMT", now=1445412480), 10.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertEqual(self.policy.backoff(0, retry_after=30), 1.0)  # capped at backoff_max
+
+    def test_aimd_rate(self):
+        url = "https://example.com/a"
+        for _ in range(5):
+            self.policy.on_success("example.com", url, 0.2)
+        self.assertEqual(self.limiter.bucket(url).rate, 2.0)
+        self.policy.on_failure("example.com", url, FetchError("HTTP 503", status=503))
+        self.assertEqual(self.limiter.bucket(url).rate, 1.0)
+        self.policy.on_success("example.com", url, 9.0)  # slow response
+        self.assertEqual(self.limiter.bucket(url).rate, 0.5)
+
+    def test_backoff_never_exceeds_crawl_delay(self):
+        url = "https://slow.com/a"
+        self.limiter.set_crawl_delay(url, 20)  # 0.05 req/s, below min_rate
+        self.policy.on_failure("slow.com", url, FetchError("HTTP 503", status=503))
+        self.assertEqual(self.limiter.bucket(url).rate, 0.05)
+        self.policy.on_success("slow.com", url, 0.1)
+        self.assertEqual(self.limiter.bucket(url).rate, 0.05)
+
+    def test_breaker_opens_after_consecutive_failures(self):
+        url = "https://dead.com/a"
+        self.policy.on_fetch_failed("dead.com", ConnectionError())
+        self.policy.on_success("dead.com", url, 0.1)  # success resets the streak
+        self.policy.on_fetch_failed("dead.com", ConnectionError())
+        self.policy.on_fetch_failed("dead.com", FetchError("HTTP 404", status=404))  # server answered
+        self.policy.on_fetch_failed("dead.com", ConnectionError())
+        self.assertTrue(self.policy.on_failure("dead.com", url, ConnectionError()))
+        self.policy.on_fetch_failed("dead.com", ConnectionError())
+        self.assertFalse(self.policy.on_failure("dead.com", url, ConnectionError()))
+        self.assertFalse(self.policy.allow("dead.com"))
+        self.assertEqual(self.policy.stats()["dead.com"]["short_circuited"], 1)
+
+    def test_not_found_is_not_retried(self):
+        self.assertFalse(self.policy.on_failure("example.com", "https://example.com/x", FetchError("HTTP 404", status=404)))
+        self.assertTrue(self.policy.allow("example.com"))
+
+
+@patch('scrapers.base_scraper.get_cache', return_value=None)
+@patch('scrapers.base_scraper.is_allowed', return_value=True)
+class TestFetchRetries(unittest.TestCase):
+    def setUp(self):
+        self.policy = FetchPolicy(max_retries=2, backoff_base=0, breaker_threshold=10, limiter=HostLimiter(rate=0))
+        patcher = patch('scrapers.base_scraper.get_fetch_policy', return_value=self.policy)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.scraper = BaseScraper("https://example.com", "example.com")
+        self.scraper.limiter = HostLimiter(rate=0)
+
+    def test_transient_errors_are_retried(self, *_):
+        replies = [response(503, headers={"Retry-After": "0"}), response(200, "<html>ok</html>")]
+        with patch('scrapers.base_scraper.http_get', side_effect=replies) as mock_get:
+            self.assertEqual(self.scraper.fetch("https://example.com/a", use_selenium=False), "<html>ok</html>")
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(self.policy.stats()["example.com"]["retried"], 1)
+
+    def test_gives_up_after_max_retries(self, *_):
+        with patch('scrapers.base_scraper.http_get', side_effect=ConnectionError("down")) as mock_get:
+            self.assertIsNone(self.scraper.fetch("https://example.com/a", use_selenium=False))
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(self.policy.stats()["example.com"]["failed"], 1)
+
+    def test_local_failures_do_not_open_the_breaker(self, *_):
+        self.policy.breaker_threshold = 2
+        with patch('scrapers.base_scraper.driver_session') as session:
+            session.return_value.__enter__.return_value = None  # no WebDriver / pool exhausted
+            for i in range(3):
+                self.assertIsNone(self.scraper.fetch(f"https://example.com/{i}", use_selenium=True))
+        self.assertEqual(session.call_count, 3)  # not retried
+        self.assertTrue(self.policy.allow("example.com"))
+        self.assertEqual(self.policy.stats()["example.com"]["local_error"], 3)
+
+    def test_breaker_counts_fetches_not_attempts(self, *_):
+        self.policy.breaker_threshold = 2
+        with patch('scrapers.base_scraper.http_get', side_effect=ConnectionError("timeout")) as mock_get:
+            self.assertIsNone(self.scraper.fetch("https://example.com/a", use_selenium=False))
+            self.assertEqual(mock_get.call_count, 3)
+            # Three failed attempts of one URL are one failed fetch
+            self.assertTrue(self.policy.allow("example.com"))
+            self.assertIsNone(self.scraper.fetch("https://example.com/b", use_selenium=False))
+        self.assertFalse(self.policy.allow("example.com"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+from utils.robots_checker import RobotsChecker
+from utils.rate_limiter import HostLimiter
+
+ROBOTS = """User-agent: *
+Disallow: /admin/
+Crawl-delay: 5
+Sitemap: https://example.com/sitemap.xml
+"""
+
+class TestRobotsChecker(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.limiter = HostLimiter(rate=1, burst=1, concurrency=1)
+        patches = [
+            patch('utils.robots_checker.Config.ROBOTS_CACHE_PATH', os.path.join(self.tmp.name, "robots.json")),
+            patch('utils.robots_checker.get_limiter', return_value=self.limiter),
+            patch.object(RobotsChecker, '_cache', {}),
+            patch.object(RobotsChecker, '_disk', None),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_single_fetch_rules_and_crawl_delay(self):
+        response = MagicMock(status_code=200, text=ROBOTS)
+        with patch('utils.robots_checker.http_get', return_value=response) as mock_get:
+            threads = [threading.Thread(target=RobotsChecker.is_allowed, args=("https://example.com/news/1", "Bot"))
+                       for _ in range(5)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertFalse(RobotsChecker.is_allowed("https://example.com/admin/x", "Bot"))
+            self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(RobotsChecker.sitemaps("https://example.com/", "Bot"), ["https://example.com/sitemap.xml"])
+        self.assertAlmostEqual(self.limiter.bucket("https://example.com/").rate, 0.2)
+
+    def test_disk_cache_survives_process(self):
+        with patch('utils.robots_checker.http_get', return_value=MagicMock(status_code=200, text=ROBOTS)):
+            RobotsChecker.is_allowed("https://example.com/", "Bot")
+        RobotsChecker._cache.clear()
+        RobotsChecker._disk = None
+        with patch('utils.robots_checker.http_get') as mock_get:
+            self.assertFalse(RobotsChecker.is_allowed("https://example.com/admin/", "Bot"))
+            mock_get.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 from scrapers.base_scraper import BaseScraper
 from scrapers.domain_scrapers.ekantipur import EkantipurScraper
+from utils.known_urls import KnownUrlIndex
 
 class TestBaseScraper(unittest.TestCase):
     def test_extract_links(self):
@@ -11,17 +13,30 @@ class TestBaseScraper(unittest.TestCase):
         self.assertIn("https://example.com/news/123", links)
         self.assertNotIn("https://other.com", links)
 
+    def test_select_links_skips_known_before_limit(self):
+        scraper = BaseScraper("https://example.com", "example.com")
+        scraper.max_articles = 2
+        scraper.known_urls = KnownUrlIndex(["https://example.com/news/1"])
+        links = ["https://example.com/news/1", "https://example.com/news/2", "https://example.com/news/3"]
+        self.assertEqual(scraper.select_links(links), ["https://example.com/news/2", "https://example.com/news/3"])
+
 class TestEkantipurScraper(unittest.TestCase):
-    @patch('scrapers.base_scraper.requests.get')
-    def test_run_mock(self, mock_get):
+    @patch('scrapers.base_scraper.get_cache', return_value=None)
+    @patch('scrapers.base_scraper.http_get')
+    def test_run_mock(self, mock_get, mock_cache):
         # Mock homepage
         mock_response_home = MagicMock()
-        mock_response_home.text = '<html><a href="/news/2024/01/01/test">Test Article</a></html>'
+        # Article links must be from the current year (the source's "require" rule)
+        mock_response_home.text = f'<html><a href="/news/{datetime.now().year}/01/01/test">Test Article</a></html>'
+        mock_response_home.content = mock_response_home.text.encode("utf-8")
+        mock_response_home.headers = {"Content-Type": "text/html"}
         mock_response_home.status_code = 200
         
         # Mock article page
         mock_response_art = MagicMock()
         mock_response_art.text = '<html><title>Test Title</title><article>Test content here.</article></html>'
+        mock_response_art.content = mock_response_art.text.encode("utf-8")
+        mock_response_art.headers = {"Content-Type": "text/html"}
         mock_response_art.status_code = 200
         
         mock_get.side_effect = [mock_response_home, mock_response_art]
@@ -0,0 +1,46 @@
+import json
+import os
+import tempfile
+import unittest
+from scrapers.source_registry import load_sources
+from scrapers.source_scraper import SourceScraper
+
+class TestSourceRegistry(unittest.TestCase):
+    def setUp(self):
+        self.sources = {s.domain: s for s in load_sources(year=2026)}
+
+    def test_all_outlets_registered(self):
+        self.assertEqual(len(self.sources), 10)
+        self.assertEqual(self.sources["onlinekhabar.com"].base_url, "https://www.onlinekhabar.com")
+        self.assertEqual(self.sources["kathmandupost.com"].language, "en")
+
+    def test_link_filters(self):
+        kp = self.sources["kathmandupost.com"]
+        self.assertTrue(kp.matches("https://kathmandupost.com/politics/2026/10/01/x"))
+        self.assertFalse(kp.matches("https://kathmandupost.com/politics/2025/10/01/x"))  # not this year
+        self.assertFalse(kp.matches("https://kathmandupost.com/opinion/2026/10/01/x"))   # default exclude
+        self.assertFalse(kp.matches("https://kathmandupost.com/sports/2026/10/01/x"))    # no section match
+        republica = self.sources["myrepublica.nagariknetwork.com"]
+        self.assertTrue(republica.matches("https://myrepublica.nagariknetwork.com/news/some-story.html"))
+        self.assertFalse(republica.matches("https://myrepublica.nagariknetwork.com/news/"))
+        setopati = self.sources["setopati.com"]
+        self.assertFalse(setopati.matches("https://www.setopati.com/politics/STORY/123"))  # excludes ignore case
+
+    def test_new_outlet_is_a_config_entry(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sources.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"default_exclude": ["/opinion/"], "sources": [
+                    {"name": "Example", "base_url": "https://www.example.com", "language": "en",
+                     "include": [r"/news/\d+"], "rate": 0.5, "fetch_mode": "http"}]}, f)
+            source, = load_sources(path)
+        scraper = SourceScraper(source)
+        self.assertEqual(scraper.domain, "example.com")
+        self.assertEqual(scraper.fetch_mode(), "http")
+        self.assertEqual(scraper.filter_links(["https://example.com/news/12", "https://example.com/news/x",
+                                               "https://example.com/opinion/news/1"]),
+                         ["https://example.com/news/12"])
+        self.assertTrue(source.matches_name("examplescraper"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import json
+import unittest
+from extractor.article_extractor import extract_article
+from extractor.structured_data import structured_article, head_tags, FastPathStats
+
+BODY = "अख्तियार दुरुपयोग अनुसन्धान आयोगले आज भ्रष्टाचार मुद्दा दायर गरेको छ। " * 8
+
+def page(article, head=""):
+    ld = {"@context": "https://schema.org", "@graph": [{"@type": "WebPage"}, article]}
+    return ("<html><head><title>Site title</title>" + head
+            + "<script type=\"application/ld+json\">" + json.dumps(ld, ensure_ascii=False) + "</script>"
+            + "</head><body><article><h1>Headline</h1><p>" + BODY + "</p></article></body></html>")
+
+ARTICLE = {"@type": "NewsArticle", "headline": "आयोगको मुद्दा", "datePublished": "2025-03-02T08:00:00+05:45",
+           "articleBody": "<p>" + BODY + "</p><p>Advertisement</p>", "author": [{"name": "Ram Sharma"}]}
+
+class TestStructuredData(unittest.TestCase):
+    def test_complete_json_ld_skips_the_dom(self):
+        data = extract_article(page(ARTICLE, "<link rel='canonical' href='https://x.com/news/1'>"), "https://x.com/news/1?ref=home")
+        self.assertTrue(data["extraction"]["fast_path"])
+        self.assertEqual((data["title"], data["author"], data["canonical_url"]),
+                         ("आयोगको मुद्दा", "Ram Sharma", "https://x.com/news/1"))
+        self.assertEqual(data["published_at"].isoformat(), "2025-03-02T08:00:00+05:45")
+        self.assertTrue(data["full_text"].startswith("अख्तियार"))
+        self.assertNotIn("Advertisement", data["full_text"])
+
+    def test_incomplete_json_ld_falls_back(self):
+        excerpt = dict(ARTICLE, articleBody=BODY[:400] + "...")
+        undated = {k: v for k, v in ARTICLE.items() if k != "datePublished"}
+        for article in (excerpt, undated, dict(ARTICLE, articleBody="Short.")):
+            self.assertIsNone(structured_article(page(article)))
+        self.assertFalse(extract_article(page(excerpt), "u")["extraction"]["fast_path"])
+
+    def test_opengraph_fills_gaps(self):
+        article = {k: v for k, v in ARTICLE.items() if k not in ("headline", "datePublished")}
+        head = ("<meta property=\"og:title\" content=\"OG &amp; title\">"
+                "<meta property='article:published_time' content='2025-03-01'><meta property=og:url content=https://x.com/og>")
+        data = structured_article(page(article, head))
+        self.assertEqual((data["title"], data["canonical_url"]), ("OG & title", "https://x.com/og"))
+        self.assertEqual(data["published_at"].date().isoformat(), "2025-03-01")
+
+    def test_entities_unescaped_once(self):
+        head = '<meta property="og:title" content="AT&amp;amp;T &amp;lt;3">'
+        article = {k: v for k, v in ARTICLE.items() if k != "headline"}
+        self.assertEqual(structured_article(page(article, head))["title"], "AT&amp;T &lt;3")
+        self.assertEqual(structured_article(page(dict(ARTICLE, headline="Budget &amp; tax")))["title"], "Budget & tax")
+
+    def test_head_tags_stop_at_body(self):
+        tags = list(head_tags("<head><meta name='a' content='1'></head><body><meta name='b' content='2'></body>"))
+        self.assertEqual(tags, [("meta", {"name": "a", "content": "1"})])
+
+    def test_stats_summary(self):
+        stats = FastPathStats()
+        stats.record("x.com", True, 0.001)
+        stats.record("x.com", False, 0.011)
+        self.assertIn("x.com: 1/2 pages (50%), 1.0 vs 11.0 ms/page (~10.0 ms saved per fast page)", stats.summary())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from utils.time_budget import CrawlBudget, SourceStats, parse_duration
+from scrapers.base_scraper import BaseScraper
+from scrapers.crawl_scheduler import stream_articles
+from scrapers.discovery import discover_feed_links
+
+class TestParseDuration(unittest.TestCase):
+    def test_formats(self):
+        self.assertEqual(parse_duration("45m"), 2700)
+        self.assertEqual(parse_duration("1h30m"), 5400)
+        self.assertEqual(parse_duration("900s"), 900)
+        self.assertEqual(parse_duration("45"), 2700)
+        with self.assertRaises(ValueError):
+            parse_duration("soon")
+
+class TestCrawlBudget(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.stats = SourceStats(path=os.path.join(self.tmp.name, "stats.json"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_plan_follows_history_and_capacity(self):
+        self.stats.record("slow.com", 400, 50, 20)
+        self.stats.record("fast.com", 100, 50, 20)
+        budgets = CrawlBudget.plan(1000, ["slow.com", "fast.com"], workers=2, stats=self.stats)
+        self.assertGreater(budgets["slow.com"], budgets["fast.com"])
+        # One worker for two sources that together need more than the deadline: scaled to fit
+        budgets = CrawlBudget.plan(300, ["slow.com", "fast.com"], workers=1, stats=self.stats)
+        self.assertLessEqual(sum(budgets.values()), 300 + 1e-6)
+
+    def test_unused_budget_is_reallocated(self):
+        budget = CrawlBudget(100, ["a.com", "b.com"], workers=2, reserve=0)
+        budget.budgets = {"a.com": 50, "b.com": 0}
+        budget.start("a.com")
+        budget.start("b.com")
+        self.assertFalse(budget.allow("b.com"))
+        budget.finish("a.com")  # ~50s unused
+        with patch('utils.time_budget.Config.BUDGET_BORROW_STEP', 10):
+            self.assertTrue(budget.allow("b.com"))
+
+    def test_discovery_fetches_use_the_budget(self):
+        budget = CrawlBudget(100, ["example.com"], workers=1, reserve=0)
+        budget.budgets = {"example.com": 0}
+        budget.start("example.com")
+        scraper = BaseScraper("https://example.com", "example.com")
+        scraper.budget = budget
+        scraper.window = (None, None)
+        scraper.listing_paths = ["/news"]
+        with patch('scrapers.discovery.get_sitemaps', return_value=[]), \
+             patch.object(scraper, 'fetch') as fetch:
+            self.assertIsNone(discover_feed_links(scraper, scraper.window))
+            self.assertEqual(scraper.crawl_listings(), set())
+            with patch('scrapers.base_scraper.Config.DISCOVERY_ENABLED', False):
+                self.assertEqual(scraper.discover_links(), set())
+        fetch.assert_not_called()
+
+    def test_stopped_budget_ends_fetching(self):
+        budget = CrawlBudget(100, ["example.com"], workers=1, reserve=0)
+        budget.start("example.com")
+        budget.stop()
+        self.assertFalse(budget.allow("example.com"))
+        self.assertFalse(budget.start("other.com"))
+        scraper = BaseScraper("https://example.com", "example.com")
+        scraper.budget = budget
+        with patch('scrapers.base_scraper.is_allowed', return_value=True), \
+             patch('scrapers.base_scraper.get_cache', return_value=None), \
+             patch('scrapers.base_scraper.http_get') as http_get:
+            self.assertIsNone(scraper.fetch("https://example.com/news/1"))
+        http_get.assert_not_called()
+
+    def test_stream_stops_at_deadline(self):
+        class Hanging:
+            domain, base_url, stats = "hang.com", "https://hang.com", {}
+            def fetch_mode(self):
+                return "http"
+            def iter_articles(self):
+                yield {"url": "https://hang.com/1"}
+                time.sleep(3)
+
+        budget = CrawlBudget(0.5, ["hang.com"], workers=1, reserve=0)
+        start = time.monotonic()
+        with patch('scrapers.crawl_scheduler.prefetch_robots'):
+            events = list(stream_articles([Hanging()], workers=1, budget=budget))
+        self.assertLess(time.monotonic() - start, 2.5)
+        self.assertEqual(len(events), 1)
+        self.assertIn("cut off at the deadline", budget.summary())
+        self.assertTrue(budget.stopped())
+
+    def test_queued_articles_delivered_after_deadline(self):
+        class Hanging:
+            domain, base_url, stats = "hang.com", "https://hang.com", {}
+            def fetch_mode(self):
+                return "http"
+            def iter_articles(self):
+                yield {"url": "https://hang.com/1"}
+                yield {"url": "https://hang.com/2"}
+                time.sleep(3)
+
+        budget = CrawlBudget(0.3, ["hang.com"], workers=1, reserve=0)
+        start = time.monotonic()
+        with patch('scrapers.crawl_scheduler.prefetch_robots'):
+            events = stream_articles([Hanging()], workers=1, budget=budget)
+            first = next(events)
+            # A slow consumer: the second article waits in the queue past the deadline
+            time.sleep(0.5)
+            rest = list(events)
+        self.assertLess(time.monotonic() - start, 2.5)
+        self.assertEqual([e[1]["url"] for e in [first] + rest], ["https://hang.com/1", "https://hang.com/2"])
+        self.assertTrue(all(t.daemon for t in threading.enumerate() if t.name.startswith("crawl_")))
+
+if __name__ == '__main__':
+    unittest.main()
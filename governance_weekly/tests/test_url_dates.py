@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from utils.url_dates import IdDateModel, date_range_from_path, estimate_date_range, outside_window
+
+WINDOW = (datetime(2025, 3, 7), datetime(2025, 3, 10, 12))
+
+class TestUrlDates(unittest.TestCase):
+    def test_path_dates(self):
+        self.assertEqual(date_range_from_path("https://ekantipur.com/news/2025/03/08/slug")[0], datetime(2025, 3, 8))
+        earliest, latest = date_range_from_path("https://www.onlinekhabar.com/2025/02/1612345")
+        self.assertEqual((earliest.month, latest.day), (2, 28))
+        self.assertIsNone(date_range_from_path("https://myrepublica.nagariknetwork.com/news/slug.html"))
+        # A year-like segment alone is not a date
+        for url in ("https://example.com/news/2045", "https://example.com/category/2019/slug",
+                    "https://www.onlinekhabar.com/2025/1612345"):
+            self.assertIsNone(date_range_from_path(url), url)
+
+    def test_prunes_only_certain_misses(self):
+        self.assertTrue(outside_window(date_range_from_path("https://ekantipur.com/news/2025/01/01/x"), WINDOW))
+        self.assertFalse(outside_window(date_range_from_path("https://ekantipur.com/news/2025/03/09/x"), WINDOW))
+        self.assertFalse(outside_window(date_range_from_path("https://www.onlinekhabar.com/2019/1612345"), WINDOW))
+        self.assertFalse(outside_window(None, WINDOW))
+
+    def test_learned_id_ranges(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            model = IdDateModel(path=os.path.join(tmp, "ids.json"))
+            model.observe("ratopati.com", "https://www.ratopati.com/story/5000", datetime(2025, 3, 1))
+            model.observe("ratopati.com", "https://www.ratopati.com/story/5200", datetime(2025, 3, 8))
+            model.save()
+            model = IdDateModel(path=os.path.join(tmp, "ids.json"))
+            old = estimate_date_range("ratopati.com", "https://www.ratopati.com/story/4900", id_model=model)
+            new = estimate_date_range("ratopati.com", "https://www.ratopati.com/story/5300", id_model=model)
+            self.assertTrue(outside_window(old, WINDOW))
+            self.assertFalse(outside_window(new, WINDOW))
+
+if __name__ == '__main__':
+    unittest.main()
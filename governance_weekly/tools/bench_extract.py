@@ -0,0 +1,147 @@
+"""
+Benchmark: article extraction, legacy (readability + two BeautifulSoup
+parses + 14 re.sub passes) vs the single-parse lxml extractor.
+
+Pages come from stored articles (the page store, up to --per-source per
+outlet), from a --pages directory of saved .html files, or, when neither
+has any, a synthetic article page. Reports per-page time for both
+extractors and output parity: identical title, identical published_at and
+the similarity of the cleaned text, plus the share of pages served from
+JSON-LD by the structured-data fast path and read with the outlet's
+extraction profile (text parity is lower on those by design: neither is
+readability's guess at the body).
+
+With --pool N it instead measures throughput (pages/s) of the fetch threads
+extracting inline vs handing pages to an ExtractionPool of N processes.
+
+    python tools/bench_extract.py [--per-source 20] [--pages DIR] [--repeat 3] [--pool N]
+"""
+import argparse
+import difflib
+import glob
+import os
+import sqlite3
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from database.page_store import PageStore
+from extractor.article_extractor import extract_article
+from extractor.extraction_pool import ExtractionPool
+from tools.legacy_article_extractor import extract_article as legacy_extract_article
+
+SYNTHETIC = ("<html><head><title>सुशासन | Example Khabar</title>"
+             "<meta property='article:published_time' content='2025-01-05T10:00:00+05:45'>"
+             "<link rel='canonical' href='https://example.com/news/2025/01/05/1'></head><body>"
+             "<nav><a href='/'>गृहपृष्ठ</a><a href='/politics'>राजनीति</a></nav><article><h1>सुशासन</h1>"
+             + "<p>भ्रष्टाचार नियन्त्रणका लागि अख्तियार दुरुपयोग अनुसन्धान आयोगले मुद्दा दायर गरेको छ। "
+               "Share via Email Advertisement</p>" * 60
+             + "</article><footer>Print this page</footer></body></html>")
+
+
+def load_pages(per_source, pages_dir):
+    """(source, url, html) triples grouped by outlet."""
+    pages = []
+    if pages_dir:
+        for path in sorted(glob.glob(os.path.join(pages_dir, "**", "*.html"), recursive=True)):
+            with open(path, encoding="utf-8", errors="replace") as f:
+                source = os.path.basename(os.path.dirname(path)) or "pages"
+                pages.append((source, path, f.read()))
+    elif os.path.exists(Config.DB_PATH):
+        try:
+            conn = sqlite3.connect(Config.DB_PATH)
+            rows = conn.execute(
+                "SELECT source_domain, url, content_hash, raw_html FROM articles "
+                "WHERE (content_hash IS NOT NULL OR raw_html IS NOT NULL) ORDER BY rowid DESC"
+            ).fetchall()
+            conn.close()
+            counts = defaultdict(int)
+            picked = []
+            for source, url, digest, html in rows:
+                if counts[source] < per_source:
+                    counts[source] += 1
+                    picked.append((source or "unknown", url, digest, html))
+            stored = {}
+            if os.path.exists(Config.PAGE_STORE_PATH):
+                store = PageStore()
+                stored = dict(store.iter_pages({digest for _, _, digest, _ in picked if digest}))
+                store.close()
+            pages = [(source, url, stored.get(digest) or html) for source, url, digest, html in picked
+                     if stored.get(digest) or html]
+        except sqlite3.Error as e:
+            print(f"Skipping {Config.DB_PATH}: {e}")
+    if not pages:
+        print("No stored pages found; using a synthetic article page")
+        pages = [("synthetic", "https://example.com/news/2025/01/05/1", SYNTHETIC)] * per_source
+    return pages
+
+def timed(fn, html, url, repeat):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(html, url)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def throughput(pages, processes, threads):
+    """Pages/s with `threads` fetch threads extracting inline vs through the process pool."""
+    pool = ExtractionPool(processes)
+    pool.start()
+    results = {}
+    for label, fn in (("inline", extract_article), (f"{processes} processes", pool.extract)):
+        with ThreadPoolExecutor(max_workers=threads) as fetchers:
+            start = time.perf_counter()
+            list(fetchers.map(lambda page: fn(page[2], page[1]), pages))
+            results[label] = len(pages) / (time.perf_counter() - start)
+    pool.shutdown()
+    for label, rate in results.items():
+        print(f"{label:16}{rate:8.1f} pages/s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--per-source", type=int, default=20, help="Stored pages per outlet")
+    parser.add_argument("--pages", help="Directory of saved .html pages (one subdirectory per outlet)")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs per page")
+    parser.add_argument("--pool", type=int, help="Measure throughput with this many extraction processes")
+    args = parser.parse_args()
+
+    pages = load_pages(args.per_source, args.pages)
+    print(f"{len(pages)} pages from {len({p[0] for p in pages})} outlets")
+    if args.pool:
+        # As many feeding threads as a collect run has fetch threads
+        throughput(pages, args.pool, Config.CRAWL_WORKERS * Config.HOST_CONCURRENCY)
+        return
+
+    rows = defaultdict(lambda: {"n": 0, "old": 0.0, "new": 0.0, "title": 0, "date": 0, "text": 0.0, "fast": 0, "profile": 0})
+    for source, url, html in pages:
+        old_time, old = timed(legacy_extract_article, html, url, args.repeat)
+        new_time, new = timed(extract_article, html, url, args.repeat)
+        row = rows[source]
+        row["n"] += 1
+        row["old"] += old_time
+        row["new"] += new_time
+        info = new.get("extraction", {}) if new else {}
+        row["fast"] += bool(info.get("fast_path"))
+        row["profile"] += bool(info.get("profile_hit"))
+        if old and new:
+            row["title"] += old["title"] == new["title"]
+            row["date"] += old["published_at"] == new["published_at"]
+            row["text"] += difflib.SequenceMatcher(None, old["full_text"], new["full_text"], autojunk=False).ratio()
+        else:
+            row["title"] += old is new
+            row["date"] += old is new
+            row["text"] += float(old is new)
+
+    print(f"{'outlet':24}{'pages':>6}{'old ms':>9}{'new ms':>9}{'saved':>7}{'title':>7}{'date':>7}{'text':>7}{'fast':>7}{'profile':>9}")
+    for source, r in sorted(rows.items()):
+        n = r["n"]
+        saved = (1 - r["new"] / r["old"]) * 100 if r["old"] else 0.0
+        print(f"{source[:23]:24}{n:6}{r['old'] / n * 1000:9.1f}{r['new'] / n * 1000:9.1f}{saved:6.0f}%"
+              f"{r['title'] / n:7.0%}{r['date'] / n:7.0%}{r['text'] / n:7.1%}{r['fast'] / n:7.0%}{r['profile'] / n:9.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: HTML minimization before extraction.
+
+For each outlet reports the page size before and after
+utils.html_minimizer.minimize_html, the time the pre-pass itself takes, and
+extract_article's per-page time on the raw page vs on the minimized page
+(including the pre-pass), plus output parity: identical title, identical
+published_at and the similarity of the cleaned text.
+
+Pages are loaded as in bench_extract.py: stored articles (up to
+--per-source per outlet), a --pages directory (one subdirectory per outlet)
+or a synthetic page. Pages stored since minimization was enabled are
+already minimized, so saved outlet pages give the meaningful numbers.
+
+    python tools/bench_minimize.py [--per-source 20] [--pages DIR] [--repeat 3]
+"""
+import argparse
+import difflib
+import os
+import sys
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+from extractor.article_extractor import extract_article
+from tools.bench_extract import load_pages, timed
+from utils.html_minimizer import minimize_html
+
+
+def minimized_extract(html, url):
+    return extract_article(minimize_html(html), url)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--per-source", type=int, default=20, help="Stored pages per outlet")
+    parser.add_argument("--pages", help="Directory of saved .html pages (one subdirectory per outlet)")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs per page")
+    args = parser.parse_args()
+    Config.HTML_MINIMIZE = True
+
+    pages = load_pages(args.per_source, args.pages)
+    print(f"{len(pages)} pages from {len({p[0] for p in pages})} outlets")
+
+    rows = defaultdict(lambda: {"n": 0, "raw": 0, "min": 0, "pass": 0.0, "old": 0.0, "new": 0.0,
+                                "title": 0, "date": 0, "text": 0.0})
+    for source, url, html in pages:
+        pass_time, small = timed(lambda page, _: minimize_html(page), html, url, args.repeat)
+        old_time, old = timed(extract_article, html, url, args.repeat)
+        new_time, new = timed(minimized_extract, html, url, args.repeat)
+        row = rows[source]
+        row["n"] += 1
+        row["raw"] += len(html.encode("utf-8"))
+        row["min"] += len(small.encode("utf-8"))
+        row["pass"] += pass_time
+        row["old"] += old_time
+        row["new"] += new_time
+        if old and new:
+            row["title"] += old["title"] == new["title"]
+            row["date"] += old["published_at"] == new["published_at"]
+            row["text"] += difflib.SequenceMatcher(None, old["full_text"], new["full_text"], autojunk=False).ratio()
+        else:
+            row["title"] += old is new
+            row["date"] += old is new
+            row["text"] += float(old is new)
+
+    print(f"{'outlet':24}{'pages':>6}{'KB':>8}{'min KB':>8}{'bytes':>7}{'pass ms':>9}{'raw ms':>9}{'min ms':>9}"
+          f"{'speedup':>9}{'title':>7}{'date':>7}{'text':>7}")
+    for source, r in sorted(rows.items()):
+        n = r["n"]
+        smaller = (1 - r["min"] / r["raw"]) * 100 if r["raw"] else 0.0
+        speedup = r["old"] / r["new"] if r["new"] else 0.0
+        print(f"{source[:23]:24}{n:6}{r['raw'] / n / 1024:8.1f}{r['min'] / n / 1024:8.1f}{smaller:6.0f}%"
+              f"{r['pass'] / n * 1000:9.2f}{r['old'] / n * 1000:9.1f}{r['new'] / n * 1000:9.1f}{speedup:8.2f}x"
+              f"{r['title'] / n:7.0%}{r['date'] / n:7.0%}{r['text'] / n:7.1%}")
+
+if __name__ == "__main__":
+    main()
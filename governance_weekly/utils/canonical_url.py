@@ -0,0 +1,186 @@
+"""
+Canonical article URLs.
+
+The same story is often linked under several URLs: with tracking query
+parameters, with or without a trailing slash or "www.", through mobile/AMP
+variants, or with different percent-encoding. Every article link is reduced
+to one canonical form before the known-URL check, the HTTP cache and the
+database, so those variants are not refetched, re-translated and stored
+twice. Aliases learned from a page's <link rel="canonical"> are remembered
+between runs.
+
+Host, scheme, AMP-path and query rewriting follow each source's "canonical"
+rule in the registry (scrapers/sources.json); other hosts only lose tracking
+parameters, fragments and redundant slashes. Percent-escapes of non-ASCII
+text are normalized, escapes of ASCII characters (%2F, %3F, ...) are kept.
+"""
+import json
+import os
+import re
+import threading
+import logging
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, quote
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that never change the page content
+TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "igshid", "ref", "ref_src", "source",
+                   "share", "from", "amp", "output", "s", "_ga"}
+TRACKING_PREFIXES = ("utm_", "fb_", "ga_", "mc_")
+
+HOST_PREFIX_RE = re.compile(r"^(?:www|m|mobile|amp)\.")
+AMP_PATH_RE = re.compile(r"^/amp(?=/)|/amp/?$|\.amp(?=$|\.html$)")
+SLASHES_RE = re.compile(r"/{2,}")
+ESCAPES_RE = re.compile(r"(?:%[0-9A-Fa-f]{2})+")
+UNRESERVED_MARKS = "-._~"
+# Characters left unescaped in paths (RFC 3986 unreserved + sub-delims); "%" keeps kept escapes intact
+PATH_SAFE = "/:@!$&'()*+,;=-._~%"
+
+
+def registered_host(host):
+    """Host without www./m./amp. prefixes, used to look up a source's rule."""
+    host = host.lower().split(":")[0]
+    while HOST_PREFIX_RE.match(host):
+        host = HOST_PREFIX_RE.sub("", host, count=1)
+    return host
+
+def load_rules():
+    """registered host -> canonical rule for every registry source that has one."""
+    # Imported here: the registry belongs to the scrapers, URLs are canonicalized everywhere
+    from scrapers.source_registry import get_sources
+    return {source.domain: source.canonical for source in get_sources() if source.canonical}
+
+_rules = None
+_rules_lock = threading.Lock()
+
+def get_rules():
+    global _rules
+    with _rules_lock:
+        if _rules is None:
+            try:
+                _rules = load_rules()
+            except Exception as e:
+                logger.error(f"Could not load canonical URL rules: {e}")
+                _rules = {}
+        return _rules
+
+def _decode_utf8(data):
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return "".join(f"%{b:02X}" for b in data)
+
+def _decode_run(m):
+    """
+    A run of percent-escapes with UTF-8 text and unreserved characters
+    decoded; other ASCII escapes stay escaped (upper-cased): "%2F" is not "/".
+    """
+    out, pending = [], bytearray()
+    for byte in bytes.fromhex(m.group(0).replace("%", "")):
+        if byte >= 0x80:
+            pending.append(byte)
+            continue
+        if pending:
+            out.append(_decode_utf8(bytes(pending)))
+            pending.clear()
+        char = chr(byte)
+        out.append(char if char.isalnum() or char in UNRESERVED_MARKS else f"%{byte:02X}")
+    if pending:
+        out.append(_decode_utf8(bytes(pending)))
+    return "".join(out)
+
+def _is_tracking(key):
+    key = key.lower()
+    return key in TRACKING_PARAMS or key.startswith(TRACKING_PREFIXES)
+
+def normalize(url):
+    """Rule-based canonical form of a URL (no alias lookup)."""
+    if not url:
+        return url
+    parts = urlsplit(url.strip())
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return url
+    rule = get_rules().get(registered_host(parts.netloc))
+
+    path = ESCAPES_RE.sub(_decode_run, parts.path)
+    if rule:
+        path = AMP_PATH_RE.sub("", path)
+    path = SLASHES_RE.sub("/", path)
+    if len(path) > 1:
+        path = path.rstrip("/")
+    # Re-encode consistently so %e0%a4 / %E0%A4 / raw Devanagari all compare equal
+    path = quote(path or "/", safe=PATH_SAFE)
+
+    if rule and rule.get("drop_query"):
+        query = ""
+    else:
+        params = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking(k)]
+        query = urlencode(sorted(params))
+    if rule:
+        return urlunsplit((rule["scheme"], rule["host"], path, query, ""))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), path, query, ""))
+
+
+class CanonicalUrls:
+    """normalize() plus page-declared aliases (URL -> rel=canonical URL)."""
+    def __init__(self, path=None, max_aliases=20000):
+        self.path = path or Config.URL_ALIASES_PATH
+        self.max_aliases = max_aliases
+        self._aliases = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._aliases = json.load(f)
+            except Exception as e:
+                logger.warning(f"Could not read URL aliases from {self.path}: {e}")
+
+    def canonicalize(self, url):
+        url = normalize(url)
+        return self._aliases.get(url, url)
+
+    def learn(self, url, declared, domain):
+        """
+        Resolves a fetched page's rel=canonical against its link. Returns the
+        URL to store the article under; off-site or homepage canonicals
+        (a common CMS misconfiguration) are ignored.
+        """
+        url = self.canonicalize(url)
+        if not declared:
+            return url
+        declared = normalize(declared)
+        parts = urlsplit(declared)
+        if registered_host(parts.netloc) != domain or parts.path in ("", "/") or declared == url:
+            return url
+        with self._lock:
+            if len(self._aliases) < self.max_aliases:
+                self._aliases[url] = declared
+                self._dirty = True
+        return declared
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            aliases = dict(self._aliases)
+            self._dirty = False
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(aliases, f)
+        os.replace(tmp, self.path)
+
+
+_canonical = None
+_canonical_lock = threading.Lock()
+
+def get_canonical_urls():
+    global _canonical
+    with _canonical_lock:
+        if _canonical is None:
+            _canonical = CanonicalUrls()
+        return _canonical
+
+def canonicalize(url):
+    return get_canonical_urls().canonicalize(url)
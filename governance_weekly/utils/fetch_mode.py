@@ -0,0 +1,90 @@
+"""
+Per-domain fetch mode learning.
+
+Rendering every page in a browser is only necessary for outlets whose
+articles are assembled client-side. For each domain we probe a few article
+pages over plain HTTP, check whether extract_article gets usable text out of
+them, and remember the verdict ("http" or "browser") in a JSON file so later
+runs skip the probe.
+"""
+import json
+import os
+import threading
+import logging
+from datetime import datetime, timedelta
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+HTTP = "http"
+BROWSER = "browser"
+PROBE = "probe"
+
+def is_usable(data):
+    """True if an extraction result has a title and a real article body."""
+    return bool(data and data.get("title") and len(data.get("full_text") or "") >= Config.FETCH_MODE_MIN_TEXT)
+
+
+class FetchModePolicy:
+    def __init__(self, path=None, probes=None, ttl_days=None):
+        self.path = path or Config.FETCH_MODE_PATH
+        self.probes = probes or Config.FETCH_MODE_PROBES
+        self.ttl = timedelta(days=ttl_days if ttl_days is not None else Config.FETCH_MODE_TTL_DAYS)
+        self._lock = threading.Lock()
+        self._samples = {}  # domain -> [ok, total] while probing
+        self._modes = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not read fetch modes from {self.path}: {e}")
+            return {}
+
+    def _save(self):
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._modes, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def mode_for(self, domain):
+        """Returns "http", "browser", or "probe" while the domain is still undecided."""
+        with self._lock:
+            entry = self._modes.get(domain)
+        if not entry:
+            return PROBE
+        decided_at = datetime.fromisoformat(entry["decided_at"])
+        if datetime.now() - decided_at > self.ttl:
+            return PROBE  # re-learn periodically, sites get redesigned
+        return entry["mode"]
+
+    def observe(self, domain, usable):
+        """Records one plain-HTTP probe result; decides once enough probes are in."""
+        with self._lock:
+            ok, total = self._samples.get(domain, [0, 0])
+            ok, total = ok + (1 if usable else 0), total + 1
+            self._samples[domain] = [ok, total]
+            if total < self.probes:
+                return
+            mode = HTTP if ok * 2 >= total else BROWSER
+            self._modes[domain] = {"mode": mode, "decided_at": datetime.now().isoformat(), "probes": total, "usable": ok}
+            del self._samples[domain]
+            try:
+                self._save()
+            except Exception as e:
+                logger.warning(f"Could not save fetch modes: {e}")
+        logger.info(f"{domain}: fetch mode set to '{mode}' ({ok}/{total} plain-HTTP probes usable)")
+
+
+_policy = None
+_policy_lock = threading.Lock()
+
+def get_policy():
+    global _policy
+    with _policy_lock:
+        if _policy is None:
+            _policy = FetchModePolicy()
+        return _policy
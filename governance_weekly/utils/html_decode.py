@@ -0,0 +1,56 @@
+"""
+Single-pass decoding of fetched pages.
+
+`requests`' Response.text runs full charset detection over the whole body
+whenever the Content-Type header has no charset, which is the norm for the
+outlets we crawl. Pages are instead decoded once from the raw bytes: strict
+UTF-8 first (every source we scrape serves UTF-8, and valid UTF-8 is very
+unlikely to be anything else), then the charset declared in the header or a
+<meta> tag, and finally UTF-8 with replacement characters. Parsers receive
+the resulting str and never decode again.
+"""
+import codecs
+import re
+
+CHARSET_PARAM_RE = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+META_CHARSET_RE = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+XML_ENCODING_RE = re.compile(rb"<\?xml[^>]+encoding\s*=\s*[\"']([\w.:-]+)", re.IGNORECASE)
+
+# Only the head of the document is searched for a <meta charset>
+META_SNIFF_BYTES = 4096
+
+
+def declared_encoding(content_type):
+    """Charset parameter of a Content-Type header, or None."""
+    if not content_type:
+        return None
+    m = CHARSET_PARAM_RE.search(content_type)
+    return m.group(1).lower() if m else None
+
+def document_encoding(body):
+    """Charset from a <meta> tag or XML declaration near the start of the body, or None."""
+    head = body[:META_SNIFF_BYTES]
+    m = META_CHARSET_RE.search(head) or XML_ENCODING_RE.search(head)
+    return m.group(1).decode("ascii", "ignore").lower() if m else None
+
+def decode_html(body, content_type=None):
+    """Decodes a page body (bytes) to str exactly once; str input is returned as is."""
+    if body is None or isinstance(body, str):
+        return body
+    if body.startswith(codecs.BOM_UTF8):
+        return body[len(codecs.BOM_UTF8):].decode("utf-8", "replace")
+    try:
+        return body.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+    for encoding in (declared_encoding(content_type), document_encoding(body)):
+        if encoding and encoding not in ("utf-8", "utf8"):
+            try:
+                return body.decode(encoding)
+            except (LookupError, UnicodeDecodeError):
+                continue
+    return body.decode("utf-8", "replace")
+
+def response_text(response):
+    """Decoded body of a requests/httpx response, skipping their charset detection."""
+    return decode_html(response.content, response.headers.get("Content-Type"))
@@ -0,0 +1,109 @@
+"""
+Strips markup that carries no article content from a fetched page.
+
+Outlet pages (and Selenium's page_source even more) are mostly inline
+scripts, styles, SVG icons, JSON blobs and ad slots; all of it used to be
+parsed by every extraction step and stored with the article. minimize_html
+removes it in one forward scan with regular expressions, without building a
+DOM, before the page reaches extract_article or the page store:
+
+- <script> (JSON-LD is kept: the structured-data fast path and the date
+  resolver read it), <style>, <svg>, <noscript>, <template> and comments
+- elements whose class or id marks them as an ad container (AD_WORDS)
+
+Pages are not always well-formed. An SVG or ad container without a matching
+close tag, or an "ad" holding more than AD_MAX_TEXT characters of text (it
+swallowed the content after it), loses only its start tag; its content is
+kept.
+
+Nothing else is touched, so whatever the extractor reads (meta tags, <time>,
+the article body) comes through byte for byte.
+"""
+import re
+from config import Config
+
+# Elements dropped with everything inside them
+RAW_TEXT_TAGS = ("script", "style", "svg", "noscript", "template")
+# Elements dropped when their class/id is an ad container's
+AD_CONTAINER_TAGS = ("div", "aside", "section", "ins", "figure")
+
+TOKEN_RE = re.compile(
+    r"<!--.*?(?:-->|\Z)|<(" + "|".join(RAW_TEXT_TAGS) + r")\b([^>]*)>|<(" + "|".join(AD_CONTAINER_TAGS) + r")\b([^>]*)>",
+    re.IGNORECASE | re.DOTALL,
+)
+CLOSE_RE = {tag: re.compile(rf"</{tag}\s*>", re.IGNORECASE) for tag in RAW_TEXT_TAGS}
+NESTING_RE = {tag: re.compile(rf"<(/?){tag}\b[^>]*>", re.IGNORECASE) for tag in AD_CONTAINER_TAGS + ("svg",)}
+JSON_LD_TYPE_RE = re.compile(r"""type\s*=\s*["']?application/ld\+json""", re.IGNORECASE)
+CLASS_ID_RE = re.compile(r"""(?:^|\s)(?:class|id)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>"']+))""", re.IGNORECASE)
+# class/id tokens are split on - and _; a segment among these marks an ad container
+AD_WORDS = {"ad", "ads", "dfp", "adsense", "adsbygoogle", "googlead", "googleads"}
+AD_PREFIXES = ("advert", "adslot", "adunit", "adbox", "adbanner", "adcontainer", "adwrap", "adzone")
+SEGMENT_SPLIT_RE = re.compile(r"[-_]")
+TAG_RE = re.compile(r"<[^>]*>")
+AD_MAX_TEXT = 300  # characters of text an ad container may hold
+
+
+def is_ad_container(attrs):
+    for m in CLASS_ID_RE.finditer(attrs):
+        value = m.group(1) or m.group(2) or m.group(3) or ""
+        for token in value.lower().split():
+            if any(seg in AD_WORDS or seg.startswith(AD_PREFIXES) for seg in SEGMENT_SPLIT_RE.split(token)):
+                return True
+    return False
+
+def element_end(html, tag, pos):
+    """
+    End of the element whose start tag ends at `pos`, counting nested
+    same-name tags; None if it is never closed. An unclosed script or style
+    runs to the end of the page, as it does for a browser.
+    """
+    if tag in RAW_TEXT_TAGS and tag != "svg":
+        m = CLOSE_RE[tag].search(html, pos)
+        return m.end() if m else len(html)
+    depth = 1
+    for m in NESTING_RE[tag].finditer(html, pos):
+        if m.group(1):
+            depth -= 1
+            if depth == 0:
+                return m.end()
+        elif not m.group(0).endswith("/>"):
+            depth += 1
+    return None
+
+def holds_content(fragment):
+    return len("".join(TAG_RE.sub(" ", fragment).split())) > AD_MAX_TEXT
+
+def minimize_html(html):
+    """`html` without scripts (but JSON-LD), styles, SVG, noscript, comments and ad containers."""
+    if not html or not Config.HTML_MINIMIZE:
+        return html
+    parts = []
+    pos = 0
+    while True:
+        m = TOKEN_RE.search(html, pos)
+        if not m:
+            break
+        raw_tag, raw_attrs, container_tag, container_attrs = m.groups()
+        if raw_tag:
+            tag = raw_tag.lower()
+            # <svg .../> is complete; other raw-text tags ignore the slash like browsers do
+            end = m.end() if tag == "svg" and raw_attrs.endswith("/") else element_end(html, tag, m.end())
+            if tag == "script" and JSON_LD_TYPE_RE.search(raw_attrs):
+                parts.append(html[pos:end])
+                pos = end
+                continue
+        elif container_tag:
+            if not is_ad_container(container_attrs):
+                parts.append(html[pos:m.end()])
+                pos = m.end()
+                continue
+            end = element_end(html, container_tag.lower(), m.end())
+            if end is not None and holds_content(html[m.end():end]):
+                end = None
+        else:
+            end = m.end()
+        parts.append(html[pos:m.start()])
+        # Unbalanced: drop the start tag only
+        pos = m.end() if end is None else end
+    parts.append(html[pos:])
+    return "".join(parts)
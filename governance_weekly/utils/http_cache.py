@@ -0,0 +1,137 @@
+"""
+Persistent HTTP response cache.
+
+Responses are stored in a small SQLite file next to the main database, keyed
+by URL, together with their ETag / Last-Modified validators. A fresh entry
+(younger than the TTL for its resource type) is served without touching the
+network; a stale one is revalidated with If-None-Match / If-Modified-Since
+and served from disk on 304. The cache is size-bounded and evicts the least
+recently used entries first.
+"""
+import sqlite3
+import threading
+import time
+import logging
+from collections import namedtuple
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+CacheEntry = namedtuple("CacheEntry", ["url", "body", "etag", "last_modified", "fetched_at"])
+
+
+class HttpCache:
+    def __init__(self, path=None, max_bytes=None, ttls=None):
+        self.path = path or Config.HTTP_CACHE_PATH
+        self.max_bytes = max_bytes if max_bytes is not None else Config.HTTP_CACHE_MAX_MB * 1024 * 1024
+        self.ttls = ttls or {
+            "homepage": Config.HTTP_CACHE_TTL_HOMEPAGE,
+            "feed": Config.HTTP_CACHE_TTL_HOMEPAGE,
+            "article": Config.HTTP_CACHE_TTL_ARTICLE,
+        }
+        self.stats = {"hit": 0, "revalidated": 0, "miss": 0, "evicted": 0}
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL,
+                last_access REAL,
+                size INTEGER
+            )
+        ''')
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+        self.conn.commit()
+        self.total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def lookup(self, url):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT url, body, etag, last_modified, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def is_fresh(self, entry, kind):
+        ttl = self.ttls.get(kind, self.ttls["article"])
+        return (time.time() - entry.fetched_at) < ttl
+
+    @staticmethod
+    def conditional_headers(entry):
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def record(self, outcome):
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def touch(self, url, refreshed=False):
+        """Marks an entry as recently used (and, after a 304, as freshly validated)."""
+        now = time.time()
+        with self._lock:
+            if refreshed:
+                self.conn.execute("UPDATE responses SET last_access = ?, fetched_at = ? WHERE url = ?", (now, now, url))
+            else:
+                self.conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (now, url))
+            self.conn.commit()
+
+    def store(self, url, body, etag=None, last_modified=None):
+        if body is None:
+            return
+        size = len(body.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            old = self.conn.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses (url, body, etag, last_modified, fetched_at, last_access, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, now, now, size)
+            )
+            self.total_bytes += size - (old[0] if old else 0)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+            self.conn.commit()
+
+    def _evict(self):
+        # Drop least recently used entries until we are back under 90% of the limit
+        target = int(self.max_bytes * 0.9)
+        rows = self.conn.execute("SELECT url, size FROM responses ORDER BY last_access ASC").fetchall()
+        for url, size in rows:
+            if self.total_bytes <= target:
+                break
+            self.conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self.total_bytes -= size
+            self.stats["evicted"] += 1
+
+    def summary(self):
+        lookups = self.stats["hit"] + self.stats["revalidated"] + self.stats["miss"]
+        served = self.stats["hit"] + self.stats["revalidated"]
+        rate = (served / lookups * 100) if lookups else 0.0
+        return (f"HTTP cache: {self.stats['hit']} hits, {self.stats['revalidated']} revalidated (304), "
+                f"{self.stats['miss']} misses, {self.stats['evicted']} evicted ({rate:.0f}% served from disk)")
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+def get_cache():
+    """Returns the shared HttpCache, or None when HTTP_CACHE_ENABLED is off."""
+    global _cache
+    if not Config.HTTP_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache()
+        return _cache
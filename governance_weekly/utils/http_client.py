@@ -0,0 +1,84 @@
+"""
+Process-wide HTTP client.
+
+All outbound requests (scrapers, robots.txt, link checks) go through one
+keep-alive session so connections to the same few hosts are reused instead
+of paying a fresh TCP+TLS handshake per request. HTTP/2 multiplexing is used
+when HTTP2_ENABLED is set and httpx (with the h2 extra) is installed.
+"""
+import threading
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from config import Config
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClient:
+    def __init__(self, http2=None, timeout=None):
+        self.timeout = timeout or Config.HTTP_TIMEOUT
+        self.default_headers = {"User-Agent": Config.USER_AGENT}
+        self.http2 = Config.HTTP2_ENABLED if http2 is None else http2
+
+        if self.http2 and httpx is None:
+            logger.warning("HTTP2_ENABLED is set but httpx is not installed; using HTTP/1.1 keep-alive")
+            self.http2 = False
+
+        if self.http2:
+            limits = httpx.Limits(
+                max_connections=Config.HTTP_POOL_HOSTS * Config.HTTP_POOL_PER_HOST,
+                max_keepalive_connections=Config.HTTP_POOL_HOSTS * Config.HTTP_POOL_PER_HOST,
+            )
+            self._client = httpx.Client(
+                http2=True,
+                headers=self.default_headers,
+                timeout=self.timeout,
+                limits=limits,
+                follow_redirects=True,
+            )
+        else:
+            session = requests.Session()
+            session.headers.update(self.default_headers)
+            # One pool per host (pool_connections) with room for the per-host
+            # concurrency used by the scrapers (pool_maxsize)
+            adapter = HTTPAdapter(
+                pool_connections=Config.HTTP_POOL_HOSTS,
+                pool_maxsize=Config.HTTP_POOL_PER_HOST,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._client = session
+
+    def get(self, url, headers=None, timeout=None, **kwargs):
+        return self._client.get(url, headers=headers, timeout=timeout or self.timeout, **kwargs)
+
+    def close(self):
+        self._client.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """Returns the shared HttpClient, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
+
+def http_get(url, headers=None, timeout=None, **kwargs):
+    return get_client().get(url, headers=headers, timeout=timeout, **kwargs)
+
+def close_client():
+    global _client
+    with _client_lock:
+        if _client:
+            _client.close()
+            _client = None
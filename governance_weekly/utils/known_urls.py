@@ -0,0 +1,44 @@
+"""
+In-memory index of article URLs already stored in the database.
+
+Loaded once per collect run and consulted by the scrapers before fetching,
+so articles we already have never cost a network round-trip or a parse.
+"""
+import threading
+import logging
+from utils.canonical_url import canonicalize
+
+logger = logging.getLogger(__name__)
+
+
+class KnownUrlIndex:
+    def __init__(self, urls=()):
+        self._urls = set(urls)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_db(cls, db):
+        # Iterate the cursor rather than fetchall() to avoid a second full copy.
+        # Rows stored before canonicalization are indexed under both forms.
+        db.cursor.execute("SELECT url FROM articles")
+        index = cls(u for row in db.cursor for u in {row[0], canonicalize(row[0])})
+        logger.info(f"Known-URL index loaded: {len(index)} stored articles")
+        return index
+
+    def __contains__(self, url):
+        return url in self._urls
+
+    def __len__(self):
+        return len(self._urls)
+
+    def add(self, url):
+        with self._lock:
+            self._urls.add(url)
+
+    def discard(self, url):
+        with self._lock:
+            self._urls.discard(url)
+
+    def filter_new(self, links):
+        """Returns the links not yet stored, preserving order."""
+        return [l for l in links if l not in self._urls]
@@ -0,0 +1,108 @@
+"""
+Bikram Sambat (BS) to Gregorian conversion.
+
+BS month lengths vary from year to year and follow no formula, so they come
+from a table. BS_MONTH_DAYS covers 2075-2085 BS (April 2018 - April 2029),
+which is all a weekly report window needs; dates outside it are left to
+dateparser. Day offsets of each year from the anchor are precomputed, so a
+conversion is a couple of list lookups.
+
+Also parses the date strings Nepali outlets print: Devanagari numerals and
+BS month names (Devanagari or romanized), e.g. "२०८२ असोज १५ गते",
+"Asoj 15, 2082" or "2082/06/15".
+"""
+import re
+from datetime import date, datetime, timedelta
+
+AD_ANCHOR = date(2018, 4, 14)  # Baisakh 1, 2075 BS
+
+BS_MONTH_DAYS = {
+    2075: [31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
+    2076: [31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30],
+    2077: [31, 32, 31, 32, 31, 30, 30, 30, 29, 30, 29, 31],
+    2078: [31, 31, 31, 32, 31, 31, 30, 29, 30, 29, 30, 30],
+    2079: [31, 31, 32, 31, 31, 31, 30, 29, 30, 29, 30, 30],
+    2080: [31, 32, 31, 32, 31, 30, 30, 30, 29, 29, 30, 30],
+    2081: [31, 31, 32, 32, 31, 30, 30, 30, 29, 30, 30, 30],
+    2082: [31, 31, 32, 31, 31, 30, 30, 30, 29, 30, 30, 30],
+    2083: [31, 31, 32, 31, 31, 30, 30, 30, 29, 30, 30, 30],
+    2084: [31, 31, 32, 31, 31, 30, 30, 30, 29, 30, 30, 30],
+    2085: [31, 32, 31, 32, 30, 31, 30, 30, 29, 30, 30, 30],
+}
+
+def _year_offsets():
+    """Days from AD_ANCHOR to Baisakh 1 of each BS year, and to each month within it."""
+    offsets, total = {}, 0
+    for year in sorted(BS_MONTH_DAYS):
+        months, start = [], total
+        for days in BS_MONTH_DAYS[year]:
+            months.append(total - start)
+            total += days
+        offsets[year] = (start, months)
+    return offsets
+
+_OFFSETS = _year_offsets()
+
+DEVANAGARI_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
+
+# Spellings seen on Nepali news sites
+MONTH_NAMES = {
+    1: ("बैशाख", "वैशाख", "baisakh", "baishakh"),
+    2: ("जेठ", "जेष्ठ", "jestha", "jeth"),
+    3: ("असार", "आषाढ", "असाढ", "ashadh", "asar", "asadh", "ashar"),
+    4: ("साउन", "श्रावण", "shrawan", "saun", "srawan", "shravan"),
+    5: ("भदौ", "भाद्र", "bhadra", "bhadau"),
+    6: ("असोज", "आश्विन", "asoj", "ashoj", "ashwin", "aswin"),
+    7: ("कात्तिक", "कार्तिक", "kartik", "kattik"),
+    8: ("मंसिर", "मङ्सिर", "मार्ग", "mangsir", "mansir", "marga"),
+    9: ("पुस", "पौष", "poush", "paush", "push", "pus"),
+    10: ("माघ", "magh"),
+    11: ("फागुन", "फाल्गुन", "falgun", "fagun", "phalgun"),
+    12: ("चैत", "चैत्र", "chaitra", "chait"),
+}
+MONTH_BY_NAME = {name: month for month, names in MONTH_NAMES.items() for name in names}
+# Longest first, and not inside a longer Latin word ("campus 12" is no month)
+_MONTH_ALT = "(?<![a-z])(?:" + "|".join(sorted(map(re.escape, MONTH_BY_NAME), key=len, reverse=True)) + ")"
+
+# "2082 Asoj 15" and "Asoj 15, 2082" (after numerals are converted); optional HH:MM.
+# The day must end its digit run: "Saun 52082" is not Saun 5, 2082.
+YEAR_FIRST_RE = re.compile(rf"\b(20[6-9]\d)\s*,?\s*({_MONTH_ALT})\s*,?\s*(\d{{1,2}})(?!\d)", re.IGNORECASE)
+MONTH_FIRST_RE = re.compile(rf"({_MONTH_ALT})\s*(\d{{1,2}})(?!\d)\s*(?:गते)?\s*,?\s*(20[6-9]\d)\b", re.IGNORECASE)
+NUMERIC_RE = re.compile(r"\b(20[6-9]\d)[-/.](\d{1,2})[-/.](\d{1,2})\b")
+TIME_RE = re.compile(r"\b([01]?\d|2[0-3]):([0-5]\d)\b")
+
+
+def to_ascii_digits(text):
+    return text.translate(DEVANAGARI_DIGITS)
+
+def bs_to_ad(year, month, day):
+    """Gregorian date for a BS date, or None if it is outside the table or invalid."""
+    if year not in _OFFSETS or not 1 <= month <= 12 or not 1 <= day <= BS_MONTH_DAYS[year][month - 1]:
+        return None
+    start, months = _OFFSETS[year]
+    return AD_ANCHOR + timedelta(days=start + months[month - 1] + day - 1)
+
+def parse_bs_date(text):
+    """
+    Naive datetime for a BS date written in `text` (with its HH:MM if
+    given), or None when there is no convertible BS date.
+    """
+    text = to_ascii_digits(text)
+    m = YEAR_FIRST_RE.search(text)
+    if m:
+        year, month, day = int(m.group(1)), MONTH_BY_NAME[m.group(2).lower()], int(m.group(3))
+    else:
+        m = MONTH_FIRST_RE.search(text)
+        if m:
+            year, month, day = int(m.group(3)), MONTH_BY_NAME[m.group(1).lower()], int(m.group(2))
+        else:
+            m = NUMERIC_RE.search(text)
+            if not m:
+                return None
+            year, month, day = (int(g) for g in m.groups())
+    ad = bs_to_ad(year, month, day)
+    if ad is None:
+        return None
+    t = TIME_RE.search(text, m.end()) or TIME_RE.search(text)
+    hour, minute = (int(t.group(1)), int(t.group(2))) if t else (0, 0)
+    return datetime(ad.year, ad.month, ad.day, hour, minute)
@@ -0,0 +1,145 @@
+"""
+Per-host politeness control for concurrent crawling.
+
+Each host gets a token bucket (sustained request rate + small burst) and a
+semaphore capping in-flight requests, so sources can be crawled in parallel
+without any single outlet seeing more than its configured rate.
+"""
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity=1.0):
+        # rate: tokens per second (<= 0 means unlimited)
+        self.rate = rate
+        self.capacity = max(1.0, float(capacity))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        if self.rate > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        else:
+            self.tokens = self.capacity
+        self.updated = now
+
+    def set_rate(self, rate):
+        with self.lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def acquire(self):
+        """Blocks until a token is available and consumes it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            # Sleep outside the lock so other hosts' callers are never blocked
+            time.sleep(wait)
+
+
+class HostLimiter:
+    def __init__(self, rate=None, burst=None, concurrency=None):
+        self.rate = Config.HOST_RATE_PER_SEC if rate is None else rate
+        self.burst = Config.HOST_BURST if burst is None else burst
+        self.concurrency = Config.HOST_CONCURRENCY if concurrency is None else concurrency
+        self.max_rate = Config.HOST_RATE_MAX
+        self.min_rate = Config.HOST_RATE_MIN
+        self.step = Config.HOST_RATE_STEP
+        self._buckets = {}
+        self._semaphores = {}
+        self._host_rates = {}  # per-host rate overrides (robots.txt Crawl-delay)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url):
+        host = urlparse(url).netloc.lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def _get(self, host):
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self._host_rates.get(host, self.rate), self.burst)
+                self._semaphores[host] = threading.BoundedSemaphore(max(1, self.concurrency))
+            return self._buckets[host], self._semaphores[host]
+
+    def set_crawl_delay(self, url, delay):
+        """Caps the host's rate at one request per `delay` seconds."""
+        if delay > 0:
+            self.cap_rate(url, 1.0 / delay)
+
+    def cap_rate(self, url, rate):
+        """Caps the host's rate (requests/sec), e.g. from robots.txt or the source registry."""
+        if rate <= 0:
+            return
+        host = self.host_of(url)
+        rate = min(rate, self._host_rates.get(host, rate))
+        if self.rate > 0:
+            rate = min(rate, self.rate)
+        with self._lock:
+            self._host_rates[host] = rate
+            bucket = self._buckets.get(host)
+        if bucket:
+            bucket.set_rate(rate)
+
+    def _ceiling(self, host):
+        # Crawl-delay is a hard cap; otherwise AIMD may climb to HOST_RATE_MAX
+        return self._host_rates.get(host, max(self.rate, self.max_rate))
+
+    def speed_up(self, url):
+        """Additive increase after a fast successful response."""
+        if self.rate <= 0:
+            return
+        host = self.host_of(url)
+        bucket = self._get(host)[0]
+        bucket.set_rate(min(self._ceiling(host), bucket.rate + self.step))
+
+    def slow_down(self, url):
+        """Multiplicative decrease after an error, throttling or a slow response."""
+        if self.rate <= 0:
+            return
+        host = self.host_of(url)
+        bucket = self._get(host)[0]
+        # Never above the host's ceiling: a Crawl-delay slower than HOST_RATE_MIN stays in force
+        rate = min(self._ceiling(host), max(self.min_rate, bucket.rate / 2))
+        if rate < bucket.rate:
+            logger.info(f"{host}: backing off to {rate:.2f} req/s")
+        bucket.set_rate(rate)
+
+    def bucket(self, url):
+        return self._get(self.host_of(url))[0]
+
+    @contextmanager
+    def slot(self, url):
+        """
+        Holds one of the host's concurrency slots and a rate token for the
+        duration of a single request.
+        """
+        bucket, semaphore = self._get(self.host_of(url))
+        with semaphore:
+            bucket.acquire()
+            yield
+
+
+_limiter = None
+_limiter_lock = threading.Lock()
+
+def get_limiter():
+    """Returns the process-wide host limiter."""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = HostLimiter()
+        return _limiter
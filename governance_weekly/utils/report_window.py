@@ -0,0 +1,20 @@
+from datetime import datetime, timedelta
+
+def get_report_window(now=None):
+    """
+    Returns (last_friday, now): the week's news window, Friday 00:00 to now.
+    On Friday mornings the window goes back a full week.
+    """
+    today = now or datetime.now()
+    days_since_friday = (today.weekday() - 4) % 7  # Friday is 4
+    if days_since_friday == 0 and today.hour < 12:  # If it's Friday morning, go back a week
+        days_since_friday = 7
+    last_friday = today - timedelta(days=days_since_friday)
+    last_friday = last_friday.replace(hour=0, minute=0, second=0, microsecond=0)
+    return last_friday, today
+
+def to_naive(dt):
+    """Drops tzinfo so dates compare with the naive report window (wall-clock time is kept)."""
+    if dt is not None and dt.tzinfo is not None:
+        return dt.replace(tzinfo=None)
+    return dt
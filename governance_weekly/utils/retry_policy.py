@@ -0,0 +1,155 @@
+"""
+Per-domain fetch policy: retries, backoff and circuit breaking.
+
+Transient failures (timeouts, connection errors, 429 and 5xx) are retried
+with exponential backoff and full jitter, honoring Retry-After when the
+server sends one. Every outcome also feeds the host's adaptive rate in the
+limiter, and a domain that keeps failing is short-circuited for the rest of
+the run instead of being hammered once per article. Outcome counters per
+domain are kept for the collect summary.
+"""
+import random
+import threading
+import time
+import logging
+from email.utils import parsedate_to_datetime
+from config import Config
+from utils.rate_limiter import get_limiter
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+
+
+class FetchError(Exception):
+    """
+    A failed fetch with the HTTP status (if any) and the server's Retry-After.
+    `local` marks failures on our side (no WebDriver, pool exhausted) that
+    say nothing about the site.
+    """
+    def __init__(self, message, status=None, retry_after=None, retryable=None, local=False):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+        self.local = local
+        if retryable is None:
+            retryable = not local and (status is None or status in RETRY_STATUSES)
+        self.retryable = retryable
+
+
+def parse_retry_after(value, now=None):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+class FetchPolicy:
+    def __init__(self, max_retries=None, backoff_base=None, backoff_max=None,
+                 slow_seconds=None, breaker_threshold=None, limiter=None):
+        self.max_retries = Config.FETCH_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_base = Config.FETCH_BACKOFF_BASE if backoff_base is None else backoff_base
+        self.backoff_max = Config.FETCH_BACKOFF_MAX if backoff_max is None else backoff_max
+        self.slow_seconds = Config.FETCH_SLOW_SECONDS if slow_seconds is None else slow_seconds
+        self.breaker_threshold = Config.BREAKER_THRESHOLD if breaker_threshold is None else breaker_threshold
+        self.limiter = limiter or get_limiter()
+        self._failures = {}  # domain -> consecutive failed fetches
+        self._open = set()   # domains skipped for the rest of the run
+        self._stats = {}     # domain -> outcome -> count
+        self._lock = threading.Lock()
+
+    def count(self, domain, outcome, n=1):
+        with self._lock:
+            stats = self._stats.setdefault(domain, {})
+            stats[outcome] = stats.get(outcome, 0) + n
+
+    def allow(self, domain):
+        """False once the domain's circuit breaker has tripped."""
+        if domain in self._open:
+            self.count(domain, "short_circuited")
+            return False
+        return True
+
+    def backoff(self, attempt, retry_after=None):
+        """Delay before retry number `attempt` (0-based)."""
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        # Full jitter keeps concurrent workers from retrying in lockstep
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def on_success(self, domain, url, elapsed):
+        with self._lock:
+            self._failures[domain] = 0
+        self.count(domain, "ok")
+        if elapsed > self.slow_seconds:
+            self.count(domain, "slow")
+            self.limiter.slow_down(url)
+        else:
+            self.limiter.speed_up(url)
+
+    def on_failure(self, domain, url, error):
+        """Records a failed attempt; returns False when the error is not worth retrying."""
+        status = getattr(error, "status", None)
+        if status in THROTTLE_STATUSES:
+            self.count(domain, "throttled")
+        if getattr(error, "local", False):
+            self.count(domain, "local_error")
+            return False
+        if not getattr(error, "retryable", True):
+            # 404s and the like: the site is up, the page just isn't there
+            self.count(domain, "http_error")
+            return False
+        self.limiter.slow_down(url)
+        return domain not in self._open
+
+    def on_fetch_failed(self, domain, error):
+        """
+        Records a fetch that gave up (retries exhausted or a non-retryable
+        error), once per fetch rather than per attempt. A non-retryable HTTP
+        status means the server answered, and a local failure is not the
+        site's, so neither counts towards the breaker.
+        """
+        if getattr(error, "local", False):
+            return
+        if getattr(error, "status", None) is not None and not getattr(error, "retryable", True):
+            return
+        with self._lock:
+            self._failures[domain] = self._failures.get(domain, 0) + 1
+            tripped = self._failures[domain] >= self.breaker_threshold and domain not in self._open
+            if tripped:
+                self._open.add(domain)
+        if tripped:
+            logger.error(f"{domain}: {self.breaker_threshold} consecutive failed fetches, skipping it for the rest of the run")
+            self.count(domain, "breaker_tripped")
+
+    def stats(self):
+        with self._lock:
+            return {domain: dict(s) for domain, s in self._stats.items()}
+
+    def summary(self):
+        lines = []
+        for domain, s in sorted(self.stats().items()):
+            parts = ", ".join(f"{k}={v}" for k, v in sorted(s.items()))
+            state = " [circuit open]" if domain in self._open else ""
+            lines.append(f"  {domain}: {parts}{state}")
+        return "Fetch outcomes per domain:\n" + "\n".join(lines) if lines else "Fetch outcomes per domain: none"
+
+
+_policy = None
+_policy_lock = threading.Lock()
+
+def get_fetch_policy():
+    """Returns the process-wide FetchPolicy."""
+    global _policy
+    with _policy_lock:
+        if _policy is None:
+            _policy = FetchPolicy()
+        return _policy
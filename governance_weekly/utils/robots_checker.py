@@ -1,50 +1,150 @@
+"""
+robots.txt handling.
+
+Each host's robots.txt is fetched once through the shared HTTP client and
+parsed from that body. The raw body is persisted on disk with a TTL so
+consecutive CLI runs don't refetch it, Crawl-delay is passed on to the
+per-host rate limiter, and all configured hosts can be prefetched in
+parallel at startup. Safe to call from concurrent scrapers.
+"""
+import json
+import os
+import threading
+import time
 import urllib.robotparser
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
-import requests
 import logging
+from config import Config
+from utils.http_client import http_get
+from utils.rate_limiter import get_limiter
 
 logger = logging.getLogger(__name__)
 
+
 class RobotsChecker:
-    _cache = {}  # Store both parser and raw content
+    _cache = {}  # base_key -> {'parser', 'sitemaps', 'crawl_delay'}
+    _disk = None  # base_key -> {'body', 'fetched_at'}
+    _lock = threading.Lock()
+    _host_locks = {}
 
-    @classmethod
-    def is_allowed(cls, url, user_agent):
+    @staticmethod
+    def _base_key(url):
         parsed = urlparse(url)
-        base_key = f"{parsed.scheme}://{parsed.netloc}"
-        
-        if base_key not in cls._cache:
-            robots_url = f"{base_key}/robots.txt"
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    @classmethod
+    def _host_lock(cls, base_key):
+        with cls._lock:
+            return cls._host_locks.setdefault(base_key, threading.Lock())
+
+    @classmethod
+    def _load_disk(cls):
+        # Called with cls._lock held
+        if cls._disk is None:
+            cls._disk = {}
+            if os.path.exists(Config.ROBOTS_CACHE_PATH):
+                try:
+                    with open(Config.ROBOTS_CACHE_PATH, encoding="utf-8") as f:
+                        cls._disk = json.load(f)
+                except Exception as e:
+                    logger.warning(f"Could not read robots cache: {e}")
+        return cls._disk
+
+    @classmethod
+    def _save_disk(cls, base_key, body):
+        with cls._lock:
+            disk = cls._load_disk()
+            disk[base_key] = {"body": body, "fetched_at": time.time()}
             try:
-                # Fetch robots.txt manually to check content
-                r = requests.get(robots_url, timeout=10, headers={"User-Agent": "Mozilla/5.0"})
-                robots_content = r.text if r.status_code == 200 else ""
-                
-                # Check if robots.txt is essentially empty or fully permissive
-                # "Disallow:" with nothing after means allow all
-                lines = [l.strip().lower() for l in robots_content.split('\n') if l.strip() and not l.strip().startswith('#')]
-                disallow_lines = [l for l in lines if l.startswith('disallow:')]
-                
-                # If no disallow rules or only empty disallow (allow all)
-                is_permissive = len(disallow_lines) == 0 or all(l == 'disallow:' for l in disallow_lines)
-                
-                if is_permissive:
-                    cls._cache[base_key] = {'permissive': True, 'parser': None}
-                else:
-                    rp = urllib.robotparser.RobotFileParser()
-                    rp.set_url(robots_url)
-                    rp.read()
-                    cls._cache[base_key] = {'permissive': False, 'parser': rp}
-                    
+                tmp = Config.ROBOTS_CACHE_PATH + ".tmp"
+                with open(tmp, "w", encoding="utf-8") as f:
+                    json.dump(disk, f)
+                os.replace(tmp, Config.ROBOTS_CACHE_PATH)
             except Exception as e:
-                logger.warning(f"Could not read robots.txt for {parsed.netloc}: {e}")
-                # Default to allowed if robots.txt unreachable
-                cls._cache[base_key] = {'permissive': True, 'parser': None}
-        
-        cache_entry = cls._cache[base_key]
-        if cache_entry['permissive']:
-            return True
-        return cache_entry['parser'].can_fetch(user_agent, url)
+                logger.warning(f"Could not save robots cache: {e}")
+
+    @classmethod
+    def _cached_body(cls, base_key):
+        with cls._lock:
+            entry = cls._load_disk().get(base_key)
+        if entry and time.time() - entry["fetched_at"] < Config.ROBOTS_CACHE_TTL:
+            return entry["body"]
+        return None
+
+    @classmethod
+    def _fetch_body(cls, base_key):
+        robots_url = f"{base_key}/robots.txt"
+        try:
+            r = http_get(robots_url, timeout=10)
+            # Missing/forbidden robots.txt: treat as allow-all, as before
+            return r.text if r.status_code == 200 else ""
+        except Exception as e:
+            logger.warning(f"Could not read robots.txt for {urlparse(base_key).netloc}: {e}")
+            return None
+
+    @classmethod
+    def _entry(cls, url):
+        base_key = cls._base_key(url)
+        entry = cls._cache.get(base_key)
+        if entry is not None:
+            return entry
+
+        # One fetch per host even when several scrapers ask at once
+        with cls._host_lock(base_key):
+            entry = cls._cache.get(base_key)
+            if entry is not None:
+                return entry
+
+            body = cls._cached_body(base_key)
+            if body is None:
+                body = cls._fetch_body(base_key)
+                if body is not None:
+                    cls._save_disk(base_key, body)
+
+            rp = urllib.robotparser.RobotFileParser()
+            rp.set_url(f"{base_key}/robots.txt")
+            # Unreachable robots.txt: default to allowed (not persisted, retried next run)
+            rp.parse((body or "").splitlines())
+
+            crawl_delay = rp.crawl_delay(Config.USER_AGENT)
+            if crawl_delay:
+                get_limiter().set_crawl_delay(url, float(crawl_delay))
+                logger.info(f"{urlparse(base_key).netloc}: honoring Crawl-delay {crawl_delay}s")
+
+            entry = {
+                'parser': rp,
+                'sitemaps': rp.site_maps() or [],
+                'crawl_delay': crawl_delay,
+            }
+            with cls._lock:
+                cls._cache[base_key] = entry
+            return entry
+
+    @classmethod
+    def is_allowed(cls, url, user_agent):
+        return cls._entry(url)['parser'].can_fetch(user_agent, url)
+
+    @classmethod
+    def sitemaps(cls, url, user_agent):
+        """Sitemap URLs advertised in the host's robots.txt."""
+        return cls._entry(url)['sitemaps']
+
+    @classmethod
+    def prefetch(cls, urls):
+        """Loads robots.txt for all given sites in parallel."""
+        keys = list(dict.fromkeys(cls._base_key(u) for u in urls))
+        if not keys:
+            return
+        with ThreadPoolExecutor(max_workers=min(len(keys), Config.CRAWL_WORKERS or 1),
+                                thread_name_prefix="robots") as pool:
+            list(pool.map(cls._entry, keys))
 
 def is_allowed(url, user_agent):
     return RobotsChecker.is_allowed(url, user_agent)
+
+def get_sitemaps(url, user_agent):
+    return RobotsChecker.sitemaps(url, user_agent)
+
+def prefetch_robots(urls):
+    RobotsChecker.prefetch(urls)
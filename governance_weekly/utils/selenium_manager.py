@@ -1,37 +1,252 @@
+import threading
+import queue
+import logging
+from contextlib import contextmanager
 from config import Config
+from extractor.extraction_profiles import get_profile
 
-_driver_instance = None
+logger = logging.getLogger(__name__)
 
-def get_driver():
+# CSS selectors whose presence means the article body has rendered: the
+# source's extraction profile body (sources.json "extract"), then these
+# generic fallbacks, which are always appended since the wait ends on the
+# first match.
+GENERIC_ARTICLE_READY = "article p, [itemprop='articleBody'] p"
+HOMEPAGE_READY = "a[href]"
+
+# Resources never needed to read an article: media, fonts, ads and analytics
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.mp3",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*doubleclick.net*", "*googlesyndication.com*", "*googletagmanager.com*",
+    "*google-analytics.com*", "*googleadservices.com*", "*adservice.google.*",
+    "*facebook.net*", "*connect.facebook.net*", "*platform.twitter.com*",
+    "*scorecardresearch.com*", "*taboola.com*", "*outbrain.com*",
+    "*hotjar.com*", "*chartbeat.com*", "*onesignal.com*",
+]
+
+def ready_selector_for(url, kind="article"):
+    if kind == "homepage":
+        return HOMEPAGE_READY
+    profile = get_profile(url)
+    specific = ", ".join(profile.ready_selectors) if profile else ""
+    return f"{specific}, {GENERIC_ARTICLE_READY}" if specific else GENERIC_ARTICLE_READY
+
+def selenium_available():
+    try:
+        import selenium  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def create_driver():
+    """
+    Starts a new configured Chrome WebDriver (None if Selenium is missing).
+    """
+    try:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+    except ImportError:
+        print("WARNING: Selenium not installed. Dynamic scraping disabled.", flush=True)
+        return None
+
+    options = Options()
+    if Config.SELENIUM_HEADLESS:
+        options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument(f"user-agent={Config.USER_AGENT}")
+
+    if Config.SELENIUM_LEAN_MODE:
+        # Return control at DOMContentLoaded instead of waiting for every
+        # image, ad and tracker; render_page() then waits for the article itself
+        options.page_load_strategy = "eager"
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
+            "profile.managed_default_content_settings.notifications": 2,
+        })
+
+    # You might need to specify the path to chromedriver if it's not in PATH
+    # service = Service("/path/to/chromedriver")
+    # return webdriver.Chrome(service=service, options=options)
+
+    driver = webdriver.Chrome(options=options)
+    driver.set_page_load_timeout(Config.SELENIUM_PAGE_TIMEOUT)
+
+    if Config.SELENIUM_LEAN_MODE:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.warning(f"Could not install request blocking: {e}")
+
+    return driver
+
+def render_page(driver, url, kind="article"):
     """
-    Returns a singleton instance of the Selenium WebDriver.
+    Loads a page and returns its HTML as soon as the source's "ready"
+    selector is present (or SELENIUM_READY_TIMEOUT passes), rather than after
+    the full page load.
     """
-    global _driver_instance
-    if _driver_instance is None:
+    from selenium.common.exceptions import TimeoutException
+
+    try:
+        driver.get(url)
+    except TimeoutException:
+        # Hard limit hit: keep whatever has rendered so far
+        logger.debug(f"Page load timeout for {url}; using partial DOM")
         try:
-            from selenium import webdriver
-            from selenium.webdriver.chrome.options import Options
-        except ImportError:
-            print("WARNING: Selenium not installed. Dynamic scraping disabled.", flush=True)
+            driver.execute_script("window.stop();")
+        except Exception:
+            pass
+
+    if Config.SELENIUM_LEAN_MODE:
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        selector = ready_selector_for(url, kind)
+        try:
+            WebDriverWait(driver, Config.SELENIUM_READY_TIMEOUT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+        except TimeoutException:
+            logger.debug(f"Ready selector '{selector}' not found on {url} within {Config.SELENIUM_READY_TIMEOUT}s")
+
+    return driver.page_source
+
+
+class DriverPool:
+    """
+    A bounded pool of WebDrivers shared by concurrently running scrapers.
+    Drivers are started lazily (or ahead of time via warm_up) and each one
+    serves a single page load at a time.
+    """
+    def __init__(self, size=None):
+        self.size = max(1, size or Config.SELENIUM_POOL_SIZE)
+        self._idle = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._drivers = []
+        self._closed = False
+
+    def _start_driver(self):
+        try:
+            driver = create_driver()
+        except Exception as e:
+            logger.error(f"Could not start WebDriver: {e}")
+            driver = None
+        with self._lock:
+            closed = self._closed
+            if driver is None:
+                if not closed:
+                    self._created -= 1
+            elif not closed:
+                self._drivers.append(driver)
+        if driver is not None and closed:
+            # Started (e.g. by warm_up) after close(): nobody will quit it later
+            self._quit(driver)
             return None
+        return driver
 
-        options = Options()
-        if Config.SELENIUM_HEADLESS:
-            options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument(f"user-agent={Config.USER_AGENT}")
-        
-        # You might need to specify the path to chromedriver if it's not in PATH
-        # service = Service("/path/to/chromedriver")
-        # _driver_instance = webdriver.Chrome(service=service, options=options)
-        
-        _driver_instance = webdriver.Chrome(options=options)
-        
-    return _driver_instance
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _reserve_slot(self):
+        with self._lock:
+            if not self._closed and self._created < self.size:
+                self._created += 1
+                return True
+            return False
+
+    def warm_up(self):
+        """
+        Starts one driver in the background so browser startup overlaps
+        with the first plain-HTTP fetches instead of blocking them.
+        """
+        if not selenium_available() or not self._reserve_slot():
+            return
+        def start():
+            driver = self._start_driver()
+            if driver:
+                self._idle.put(driver)
+        threading.Thread(target=start, name="selenium-warmup", daemon=True).start()
+
+    @contextmanager
+    def acquire(self, timeout=None):
+        driver = None
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            if self._reserve_slot():
+                driver = self._start_driver()
+            else:
+                # All drivers are busy (or still starting): wait for one
+                try:
+                    driver = self._idle.get(timeout=timeout or Config.SELENIUM_ACQUIRE_TIMEOUT)
+                except queue.Empty:
+                    driver = None
+        if driver is None:
+            yield None
+            return
+        try:
+            yield driver
+        except Exception:
+            # A driver that failed mid-load may be wedged; replace it lazily
+            self._discard(driver)
+            raise
+        else:
+            with self._lock:
+                closed = self._closed
+            if not closed:
+                self._idle.put(driver)
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+                self._created -= 1
+        self._quit(driver)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            drivers, self._drivers = self._drivers, []
+            self._created = 0
+        for driver in drivers:
+            self._quit(driver)
+        self._idle = queue.Queue()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool()
+        return _pool
+
+@contextmanager
+def driver_session():
+    """
+    Borrows a driver from the shared pool for one page load (yields None if
+    Selenium is not available).
+    """
+    with get_pool().acquire() as driver:
+        yield driver
 
 def close_driver():
-    global _driver_instance
-    if _driver_instance:
-        _driver_instance.quit()
-        _driver_instance = None
+    global _pool
+    with _pool_lock:
+        if _pool:
+            _pool.close()
+            _pool = None
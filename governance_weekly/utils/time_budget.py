@@ -0,0 +1,183 @@
+"""
+Deadline-aware crawling.
+
+SourceStats keeps a running history (EWMA) of each source's crawl time,
+links fetched and articles yielded, persisted between runs. With a
+`--deadline`, CrawlBudget turns that history into a per-source time budget:
+each source gets roughly its usual crawl time (more for sources that yield
+articles quickly), time left over by sources that finish early goes back to
+a shared pool that slower sources can draw on, and nothing new is started
+once the crawl deadline has passed. Sitemap, feed and listing fetches draw
+on the same budget as articles. Links left unfetched are recorded for the
+run summary.
+"""
+import json
+import os
+import re
+import threading
+import time
+import logging
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)\s*([hms]?)", re.IGNORECASE)
+UNIT_SECONDS = {"h": 3600, "m": 60, "s": 1, "": 60}  # bare numbers are minutes
+
+
+def parse_duration(value):
+    """'45m', '1h30m', '900s' or '45' (minutes) -> seconds."""
+    text = str(value).strip().lower()
+    parts = DURATION_RE.findall(text)
+    if not parts or DURATION_RE.sub("", text).strip():
+        raise ValueError(f"invalid duration: {value!r} (use e.g. 45m, 1h30m, 900s)")
+    return sum(float(n) * UNIT_SECONDS[unit] for n, unit in parts)
+
+
+class SourceStats:
+    """Per-source crawl history: seconds, links fetched and articles per run (EWMA)."""
+    def __init__(self, path=None, alpha=0.3):
+        self.path = path or Config.SOURCE_STATS_PATH
+        self.alpha = alpha
+        self._stats = {}
+        self._lock = threading.Lock()
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._stats = json.load(f)
+            except Exception as e:
+                logger.warning(f"Could not read source stats from {self.path}: {e}")
+
+    def get(self, domain):
+        return self._stats.get(domain)
+
+    def record(self, domain, seconds, links, articles):
+        sample = {"seconds": seconds, "links": links, "articles": articles}
+        with self._lock:
+            old = self._stats.get(domain)
+            if old:
+                sample = {k: old[k] + self.alpha * (v - old[k]) for k, v in sample.items()}
+            self._stats[domain] = sample
+
+    def save(self):
+        with self._lock:
+            raw = dict(self._stats)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(raw, f, indent=2)
+        os.replace(tmp, self.path)
+
+
+class CrawlBudget:
+    def __init__(self, deadline_seconds, domains, workers, stats=None, reserve=None):
+        self.started = time.monotonic()
+        self.deadline = self.started + deadline_seconds
+        # Crawling stops early enough for the consumer to process what is queued
+        reserve = Config.DEADLINE_RESERVE if reserve is None else reserve
+        self.crawl_deadline = self.deadline - deadline_seconds * reserve
+        self.budgets = self.plan(self.crawl_deadline - self.started, domains, workers, stats)
+        self._pool = 0.0
+        self._started = {}
+        self._finished = set()
+        self.skipped = {}      # domain -> links not fetched because of the budget
+        self.not_started = []  # sources that never got a worker before the deadline
+        self._stopped = False
+        self._lock = threading.Lock()
+        for domain, budget in sorted(self.budgets.items()):
+            logger.info(f"Budget for {domain}: {budget:.0f}s")
+
+    @staticmethod
+    def plan(total, domains, workers, stats=None):
+        """
+        Splits `total` seconds of crawl time (times the number of parallel
+        workers) across sources by their historical crawl time, weighted by
+        how quickly each one yields articles; no source gets more than `total`.
+        """
+        history = {d: stats.get(d) if stats else None for d in domains}
+        default = Config.DEFAULT_SOURCE_SECONDS
+        expected = {d: max(1.0, h["seconds"]) if h else default for d, h in history.items()}
+        rates = {d: h["articles"] / max(1.0, h["seconds"]) for d, h in history.items() if h}
+        mean_rate = sum(rates.values()) / len(rates) if rates else 0
+        weight = {d: min(2.0, max(0.5, rates[d] / mean_rate)) if d in rates and mean_rate else 1.0 for d in domains}
+
+        # Usual time plus headroom, then scaled down if it exceeds what the workers can cover
+        desired = {d: expected[d] * 1.25 * weight[d] for d in domains}
+        capacity = total * max(1, min(workers, len(domains)))
+        scale = min(1.0, capacity / sum(desired.values())) if desired else 1.0
+        return {d: min(total, desired[d] * scale) for d in domains}
+
+    def expired(self):
+        """True once the overall deadline has passed."""
+        return time.monotonic() >= self.deadline
+
+    def stop(self):
+        """Ends the crawl at the deadline: in-flight scrapers fetch nothing more."""
+        self._stopped = True
+
+    def stopped(self):
+        return self._stopped
+
+    def start(self, domain):
+        """Called when a source gets a worker; False if it is too late to start."""
+        with self._lock:
+            if self._stopped or time.monotonic() >= self.crawl_deadline:
+                self.not_started.append(domain)
+                return False
+            self._started[domain] = time.monotonic()
+            return True
+
+    def allow(self, domain):
+        """Whether the source may fetch another page."""
+        now = time.monotonic()
+        if self._stopped or now >= self.crawl_deadline:
+            return False
+        with self._lock:
+            used = now - self._started.get(domain, now)
+            budget = self.budgets.get(domain, 0)
+            if used < budget:
+                return True
+            # Over budget: borrow time left over by sources that already finished
+            needed = used - budget + Config.BUDGET_BORROW_STEP
+            if self._pool >= needed:
+                self._pool -= needed
+                self.budgets[domain] = budget + needed
+                return True
+            return False
+
+    def skip(self, domain, links):
+        with self._lock:
+            self.skipped[domain] = self.skipped.get(domain, 0) + links
+
+    def finish(self, domain):
+        """Returns a finished source's unused time to the shared pool."""
+        with self._lock:
+            if domain in self._finished or domain not in self._started:
+                return
+            self._finished.add(domain)
+            unused = self.budgets.get(domain, 0) - (time.monotonic() - self._started[domain])
+            if unused > 0:
+                self._pool += unused
+
+    def summary(self):
+        lines = [f"Deadline budget: {time.monotonic() - self.started:.0f}s used of "
+                 f"{self.deadline - self.started:.0f}s"]
+        for domain, links in sorted(self.skipped.items()):
+            lines.append(f"  {domain}: {links} article links skipped (budget exhausted)")
+        for domain in sorted(set(self._started) - self._finished):
+            lines.append(f"  {domain}: cut off at the deadline while still crawling")
+        for domain in self.not_started:
+            lines.append(f"  {domain}: not crawled (deadline reached before it started)")
+        if len(lines) == 1:
+            lines.append("  nothing skipped")
+        return "\n".join(lines)
+
+
+_stats = None
+_stats_lock = threading.Lock()
+
+def get_source_stats():
+    global _stats
+    with _stats_lock:
+        if _stats is None:
+            _stats = SourceStats()
+        return _stats
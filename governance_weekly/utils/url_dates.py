@@ -0,0 +1,173 @@
+"""
+Publication date estimates from article URLs.
+
+Many outlets put the date in the path (/2025/01/31/...) or use monotonically
+increasing article IDs. Each link gets an (earliest, latest) estimate so
+links that certainly fall outside the report window can be dropped before
+they are fetched. ID -> date observations are learned from stored articles
+and persisted between runs.
+"""
+import calendar
+import json
+import os
+import re
+import threading
+import logging
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from config import Config
+from utils.report_window import to_naive
+
+logger = logging.getLogger(__name__)
+
+# /2025/01/31/ (ekantipur, Kathmandu Post ...) and /2025/01/ (onlinekhabar).
+# A bare /2025/ segment is not trusted: category and article IDs look the same
+FULL_DATE_RE = re.compile(r"/(20\d{2})/(0?[1-9]|1[0-2])/(0?[1-9]|[12]\d|3[01])(?:/|$)")
+YEAR_MONTH_RE = re.compile(r"/(20\d{2})/(0?[1-9]|1[0-2])(?:/|$)")
+
+# Numeric article IDs that grow with publication time
+ID_PATTERNS = {
+    "onlinekhabar.com": re.compile(r"/20\d{2}/(?:\d{2}/)?(\d{4,})"),
+    "setopati.com": re.compile(r"setopati\.com/[a-z-]+/(\d{4,})"),
+    "ratopati.com": re.compile(r"/story/(\d{4,})"),
+    "nayapatrikadaily.com": re.compile(r"/news-details/(\d{3,})"),
+    "annapurnapost.com": re.compile(r"/(?:story|news)/(\d{4,})"),
+    "ukaalo.com": re.compile(r"/(?:news|politics|society)/(\d{4,})"),
+}
+
+def date_range_from_path(url):
+    """(earliest, latest) implied by a date in the URL path, or None."""
+    m = FULL_DATE_RE.search(url)
+    if m:
+        try:
+            day = datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+            return day, day + timedelta(days=1) - timedelta(microseconds=1)
+        except ValueError:
+            pass
+    m = YEAR_MONTH_RE.search(url)
+    if m:
+        year, month = int(m.group(1)), int(m.group(2))
+        last_day = calendar.monthrange(year, month)[1]
+        return datetime(year, month, 1), datetime(year, month, last_day, 23, 59, 59)
+    return None
+
+def article_id(domain, url):
+    pattern = ID_PATTERNS.get(domain)
+    if not pattern:
+        return None
+    m = pattern.search(url)
+    return int(m.group(1)) if m else None
+
+
+class IdDateModel:
+    """
+    Learned (article_id, published_at) points per domain. Because IDs are
+    assigned in publication order, the nearest known IDs on either side of a
+    link bound its publication date.
+    """
+    def __init__(self, path=None, max_points=None):
+        self.path = path or Config.URL_ID_DATES_PATH
+        self.max_points = max_points or Config.URL_ID_MAX_POINTS
+        self._lock = threading.Lock()
+        self._points = {}  # domain -> sorted list of (id, datetime)
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                raw = json.load(f)
+            for domain, points in raw.items():
+                self._points[domain] = sorted((int(i), datetime.fromisoformat(d)) for i, d in points)
+        except Exception as e:
+            logger.warning(f"Could not read URL id/date model from {self.path}: {e}")
+
+    def save(self):
+        with self._lock:
+            raw = {d: [[i, dt.isoformat()] for i, dt in pts] for d, pts in self._points.items()}
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(raw, f)
+        os.replace(tmp, self.path)
+
+    def observe(self, domain, url, published_at):
+        art_id = article_id(domain, url)
+        if art_id is None or published_at is None:
+            return
+        with self._lock:
+            points = dict(self._points.get(domain, []))
+            points[art_id] = to_naive(published_at)
+            ordered = sorted(points.items())
+            if len(ordered) > self.max_points:
+                # Keep the newest points; the window only ever moves forward
+                ordered = ordered[-self.max_points:]
+            self._points[domain] = ordered
+
+    def learn_from_db(self, db):
+        db.cursor.execute("SELECT url, source_domain, published_at FROM articles WHERE published_at IS NOT NULL")
+        for url, domain, published_at in db.cursor:
+            if domain in ID_PATTERNS:
+                try:
+                    self.observe(domain, url, datetime.fromisoformat(str(published_at)))
+                except ValueError:
+                    continue
+
+    def date_range(self, domain, url):
+        art_id = article_id(domain, url)
+        if art_id is None:
+            return None
+        with self._lock:
+            points = self._points.get(domain)
+            if not points:
+                return None
+            ids = [p[0] for p in points]
+            lower = bisect_right(ids, art_id) - 1  # largest known id <= art_id
+            upper = bisect_left(ids, art_id)       # smallest known id >= art_id
+            earliest = points[lower][1] if lower >= 0 else None
+            latest = points[upper][1] if upper < len(points) else None
+        if earliest is None and latest is None:
+            return None
+        return earliest, latest
+
+
+def estimate_date_range(domain, url, link_dates=None, id_model=None):
+    """
+    Best (earliest, latest) publication estimate for a link, combining feed
+    dates, dates in the path and learned ID ranges; either bound may be None
+    when unknown. Returns None if nothing is known.
+    """
+    if link_dates and link_dates.get(url):
+        exact = link_dates[url]
+        return exact, exact
+    estimates = [r for r in (date_range_from_path(url), id_model.date_range(domain, url) if id_model else None) if r]
+    if not estimates:
+        return None
+    # Intersect: the tightest bound on each side wins
+    earliest = max((e for e, _ in estimates if e is not None), default=None)
+    latest = min((l for _, l in estimates if l is not None), default=None)
+    return earliest, latest
+
+def outside_window(date_range, window, slack=None):
+    """True only if the estimate is certainly outside the window (with slack for late publishing)."""
+    if not date_range:
+        return False
+    slack = timedelta(days=Config.URL_DATE_SLACK_DAYS if slack is None else slack)
+    start, end = window
+    earliest, latest = date_range
+    if latest is not None and latest < start - slack:
+        return True
+    if earliest is not None and earliest > end + slack:
+        return True
+    return False
+
+
+_model = None
+_model_lock = threading.Lock()
+
+def get_id_model():
+    global _model
+    with _model_lock:
+        if _model is None:
+            _model = IdDateModel()
+        return _model
@@ -1,12 +1,16 @@
-import requests
+import os
+import sys
 from bs4 import BeautifulSoup
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "governance_weekly"))
+from utils.http_client import http_get
+
 headers = {"User-Agent": "Mozilla/5.0"}
 
 # Test MyRepublica
 print("=== MyRepublica Links ===")
 try:
-    r = requests.get("https://myrepublica.nagariknetwork.com", headers=headers, timeout=15)
+    r = http_get("https://myrepublica.nagariknetwork.com", headers=headers, timeout=15)
     soup = BeautifulSoup(r.text, "html.parser")
     links = [a["href"] for a in soup.find_all("a", href=True) if "/news/" in a["href"]][:10]
     for l in links:
@@ -16,7 +20,7 @@ except Exception as e:
 
 print("\n=== Setopati Links ===")
 try:
-    r = requests.get("https://www.setopati.com", headers=headers, timeout=15)
+    r = http_get("https://www.setopati.com", headers=headers, timeout=15)
     soup = BeautifulSoup(r.text, "html.parser")
     links = [a["href"] for a in soup.find_all("a", href=True) if "/politics/" in a["href"] or "/social/" in a["href"]][:10]
     for l in links: